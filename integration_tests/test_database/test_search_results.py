@@ -370,3 +370,45 @@ def test_uuid_id_auto_generated(db_session):
     # Verify it's a valid UUID format
     assert len(str(saved.id)) == 36  # UUID string format
     assert str(saved.id).count("-") == 4  # UUID has 4 hyphens
+
+
+def test_insert_large_batch_uses_copy_path(db_session, monkeypatch):
+    """Test that batches above the COPY threshold are staged and deduplicated."""
+    monkeypatch.setattr("src.database.db._COPY_THRESHOLD", 3)
+
+    existing = {
+        "title": "Existing",
+        "summary": "Already stored",
+        "url": "https://example.com/0",
+        "source": "arxiv",
+        "published_at": None,
+        "raw": {},
+    }
+    assert insert_search_results(db_session, [existing]) == 1
+
+    batch = [existing] + [
+        {
+            "title": f'Paper, "{i}"',
+            "summary": f"Summary\nline {i}",
+            "url": f"https://example.com/{i}",
+            "source": "arxiv",
+            "published_at": datetime(2024, 1, i, tzinfo=timezone.utc) if i % 2 else None,
+            "raw": {"index": i, "unicode": "世界"},
+        }
+        for i in range(1, 5)
+    ]
+
+    count = insert_search_results(db_session, batch)
+    assert count == 4
+
+    saved = db_session.execute(select(SearchResult)).scalars().all()
+    assert len(saved) == 5
+
+    first = next(r for r in saved if r.url.endswith("/1"))
+    assert first.title == 'Paper, "1"'
+    assert first.summary == "Summary\nline 1"
+    assert first.published_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert first.raw == {"index": 1, "unicode": "世界"}
+
+    second = next(r for r in saved if r.url.endswith("/2"))
+    assert second.published_at is None
@@ -0,0 +1,43 @@
+"""search results covering unique index
+
+Revision ID: 9c2e69efb1da
+Revises: 082d999d7910
+Create Date: 2026-10-16 17:49:57.970204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2e69efb1da"
+down_revision: Union[str, Sequence[str], None] = "082d999d7910"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_search_results_source_url_inc",
+            "search_results",
+            ["source", "url"],
+            unique=True,
+            postgresql_include=["id", "published_at"],
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint("uq_search_results_source_url", "search_results", type_="unique")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint("uq_search_results_source_url", "search_results", ["source", "url"])
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_search_results_source_url_inc",
+            table_name="search_results",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,54 @@
+"""search results conflict key index
+
+Revision ID: d43a3e867e46
+Revises: 9c2e69efb1da
+Create Date: 2026-10-16 18:02:11.418327
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d43a3e867e46"
+down_revision: Union[str, Sequence[str], None] = "9c2e69efb1da"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_search_results_conflict_key",
+            "search_results",
+            [sa.text("decode(md5(source || '|' || url), 'hex')")],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_search_results_source_url_inc",
+            table_name="search_results",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_search_results_source_url_inc",
+            "search_results",
+            ["source", "url"],
+            unique=True,
+            postgresql_include=["id", "published_at"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "uq_search_results_conflict_key",
+            table_name="search_results",
+            postgresql_concurrently=True,
+        )
@@ -32,12 +32,18 @@ Example:
 from dataclasses import dataclass
 
 from src.agents.structure_planner import Outline, Section
-from src.integrations.llm_client import generate_text
+from src.integrations.llm_client import generate_text, truncate_to_tokens
 from src.integrations.prompts import RESEARCH_SYNTHESIS_PROMPT_V1
 from src.integrations.search.arxiv_client import fetch_arxiv
 from src.integrations.search.github_trending_client import fetch_github_trending
 from src.integrations.search.tavily_client import search_tavily
 
+# Token budgets for each research source in the synthesis prompt. Sources are
+# formatted best-ranked first, so truncation drops the lowest-ranked tail.
+_WEB_TOKEN_BUDGET = 4000
+_PAPERS_TOKEN_BUDGET = 2000
+_CODE_TOKEN_BUDGET = 2000
+
 
 @dataclass(frozen=True)
 class ResearchDossier:
@@ -288,10 +294,12 @@ def _build_synthesis_prompt(
     web_results: list[dict],
     papers: list[dict],
     code_examples: list[dict],
+    model: str | None = None,
 ) -> str:
     """Build prompt for LLM to synthesize research findings.
 
     Uses centralized prompt template from prompts.py with formatted research data.
+    Each source is truncated to its token budget so input size stays bounded.
 
     Args:
         topic: Article topic
@@ -299,14 +307,17 @@ def _build_synthesis_prompt(
         web_results: Web search results
         papers: arXiv papers
         code_examples: GitHub repositories
+        model: Model whose tokenizer measures the budgets (default: generic)
 
     Returns:
         Formatted prompt string ready for LLM
     """
-    # Format all research sources
-    web_text = _format_web_results(web_results)
-    papers_text = _format_papers(papers)
-    code_text = _format_code_examples(code_examples)
+    # Format all research sources, each within its token budget
+    web_text = truncate_to_tokens(_format_web_results(web_results), _WEB_TOKEN_BUDGET, model=model)
+    papers_text = truncate_to_tokens(_format_papers(papers), _PAPERS_TOKEN_BUDGET, model=model)
+    code_text = truncate_to_tokens(
+        _format_code_examples(code_examples), _CODE_TOKEN_BUDGET, model=model
+    )
 
     # Use centralized prompt template
     return RESEARCH_SYNTHESIS_PROMPT_V1.format(
@@ -417,7 +428,7 @@ async def research_section(
 
     # 7. Synthesize research using LLM
     synthesis_prompt = _build_synthesis_prompt(
-        outline.topic, section.title, web_results, papers, code_examples
+        outline.topic, section.title, web_results, papers, code_examples, model=model
     )
     synthesis = await generate_text(synthesis_prompt, model=model, temperature=0.3)
 
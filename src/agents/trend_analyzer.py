@@ -15,6 +15,7 @@ Design Principles:
 - Input sanitization (defensive programming)
 """
 
+import heapq
 from dataclasses import dataclass
 from typing import Final
 
@@ -268,6 +269,11 @@ def _score_topic(topic: str) -> float:
     return max(0.0, base + bonus + penalty)
 
 
+def _rank_key(scored_topic: ScoredTopic) -> tuple[float, str]:
+    """Sort key ranking topics by descending score, then alphabetically."""
+    return (-scored_topic.score, scored_topic.topic)
+
+
 def analyze_trends(
     topics: list[str],
     *,
@@ -309,6 +315,7 @@ def analyze_trends(
         - Filters out empty/whitespace-only topics automatically
         - Frozen dataclass output prevents accidental mutation
         - Stable sort ensures deterministic ordering
+        - Partial selection when max_topics < len(topics) avoids a full sort
         - Safe for concurrent use (no shared state)
     """
     # Validate parameters
@@ -325,8 +332,9 @@ def analyze_trends(
     # Score all valid topics (don't mutate input)
     scored = [ScoredTopic(topic=topic, score=_score_topic(topic)) for topic in clean_topics]
 
-    # Sort by score (descending), then by topic name (stable)
-    scored.sort(key=lambda x: (-x.score, x.topic))
-
-    # Return top N
-    return scored[:max_topics]
+    # Order by score (descending), then by topic name (stable)
+    if max_topics < len(scored):
+        # Only the top N are returned; select them without sorting the rest
+        return heapq.nsmallest(max_topics, scored, key=_rank_key)
+    scored.sort(key=_rank_key)
+    return scored
@@ -1,15 +1,21 @@
 """PostgreSQL database connection layer with SQLAlchemy."""
 
+import csv
+import io
+import logging
 import time
 from contextlib import contextmanager
-from typing import Generator
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Generator, Mapping
 
+import orjson
 from sqlalchemy import create_engine, exc, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.database.models import Article, SearchResult, Topic
+from src.database.models import SEARCH_RESULT_CONFLICT_KEY, Article, SearchResult, Topic
 from src.utils.config import get_settings
 from src.utils.logging_config import get_logger
 
@@ -17,6 +23,23 @@ from src.utils.logging_config import get_logger
 _engine: Engine | None = None
 _session_factory: sessionmaker[Session] | None = None
 
+# Liveness probe used by health_check, built once and reused
+_HEALTH_CHECK_STMT = text("SELECT 1")
+
+# Batches at or above this size are loaded via COPY into a staging table
+_COPY_THRESHOLD = 10_000
+
+_SEARCH_RESULT_COLUMNS = "title, summary, url, source, published_at, raw"
+_SEARCH_RESULT_REQUIRED_FIELDS = frozenset({"title", "summary", "url", "source", "raw"})
+
+# Fields accepted by the update helpers, and kwargs that map to a different attribute
+_TOPIC_UPDATE_FIELDS = frozenset({"name", "description", "keywords", "metadata"})
+_ARTICLE_UPDATE_FIELDS = frozenset({"title", "content", "metadata", "status", "published_at"})
+_FIELD_RENAME = {"metadata": "meta_data"}
+
+# Rendered as NULL by COPY (csv writes None as an empty, unquoted field otherwise)
+_COPY_NULL = "\\N"
+
 
 class DatabaseError(Exception):
     """Base exception for database errors."""
@@ -66,6 +89,21 @@ def _is_transient_error(error: Exception) -> bool:
     return any(keyword in error_str for keyword in transient_keywords)
 
 
+def _json_serializer(value: Any) -> str:
+    """
+    Serialize JSONB values with orjson.
+
+    Non-string dict keys are coerced to strings to match stdlib json.dumps.
+
+    Args:
+        value: JSON-compatible value to serialize
+
+    Returns:
+        JSON document as a string
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def retry_on_transient_error(max_retries: int | None = None, delay: float | None = None):
     """
     Decorator to retry database operations on transient errors.
@@ -122,6 +160,31 @@ def retry_on_transient_error(max_retries: int | None = None, delay: float | None
     return decorator
 
 
+@lru_cache(maxsize=1)
+def _engine_kwargs() -> Mapping[str, Any]:
+    """
+    Build the create_engine keyword arguments from settings.
+
+    Cached so repeated init_db() calls skip re-reading settings; close_db()
+    clears the cache so configuration changes are picked up on the next init.
+
+    Returns:
+        Read-only mapping of engine keyword arguments
+    """
+    settings = get_settings()
+    return MappingProxyType(
+        {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_pre_ping": True,  # Verify connections before using them
+            "echo": settings.DEBUG,  # Log SQL queries in debug mode
+            "json_serializer": _json_serializer,
+            "json_deserializer": orjson.loads,
+        }
+    )
+
+
 def init_db() -> None:
     """
     Initialize database engine and session factory.
@@ -135,8 +198,7 @@ def init_db() -> None:
     """
     global _engine, _session_factory
 
-    settings = get_settings()
-    database_url = settings.get_database_url()
+    database_url = get_settings().get_database_url()
 
     if not database_url:
         raise DatabaseConnectionError(
@@ -147,14 +209,7 @@ def init_db() -> None:
         _get_logger().info("Initializing database connection...")
 
         # Create engine with connection pooling
-        _engine = create_engine(
-            database_url,
-            pool_size=settings.DB_POOL_SIZE,
-            max_overflow=settings.DB_MAX_OVERFLOW,
-            pool_timeout=settings.DB_POOL_TIMEOUT,
-            pool_pre_ping=True,  # Verify connections before using them
-            echo=settings.DEBUG,  # Log SQL queries in debug mode
-        )
+        _engine = create_engine(database_url, **_engine_kwargs())
 
         # Create session factory
         _session_factory = sessionmaker(
@@ -186,14 +241,32 @@ def get_engine() -> Engine:
     return _engine
 
 
-@contextmanager
 @retry_on_transient_error()
+def _acquire_connection(session: Session) -> None:
+    """
+    Check out the session's connection, retrying transient failures.
+
+    Args:
+        session: Freshly created session
+
+    Raises:
+        DatabaseRetryError: If all retry attempts fail
+    """
+    try:
+        session.connection()
+    except Exception:
+        # Reset the failed autobegin so the next attempt starts clean
+        session.rollback()
+        raise
+
+
+@contextmanager
 def get_session() -> Generator[Session, None, None]:
     """
     Context manager for database sessions.
 
     Automatically handles session lifecycle:
-    - Creates session
+    - Creates session and acquires a connection (retried on transient errors)
     - Commits on success
     - Rolls back on error
     - Closes session
@@ -213,18 +286,24 @@ def get_session() -> Generator[Session, None, None]:
     if _session_factory is None:
         raise DatabaseError("Database session factory not initialized. Call init_db() first.")
 
+    logger = _get_logger()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     session = _session_factory()
     try:
+        _acquire_connection(session)
         yield session
         session.commit()
-        _get_logger().debug("Database session committed successfully")
+        if debug_enabled:
+            logger.debug("Database session committed successfully")
     except Exception as e:
         session.rollback()
-        _get_logger().error("Database session rolled back due to error: %s", e)
+        logger.error("Database session rolled back due to error: %s", e)
         raise
     finally:
         session.close()
-        _get_logger().debug("Database session closed")
+        if debug_enabled:
+            logger.debug("Database session closed")
 
 
 @retry_on_transient_error()
@@ -244,7 +323,7 @@ def health_check() -> bool:
     try:
         engine = get_engine()
         with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+            conn.execute(_HEALTH_CHECK_STMT)
             _get_logger().info("Database health check passed")
             return True
     except Exception as e:
@@ -260,6 +339,8 @@ def close_db() -> None:
     """
     global _engine, _session_factory
 
+    _engine_kwargs.cache_clear()
+
     if _engine is not None:
         _get_logger().info("Closing database connections...")
         _engine.dispose()
@@ -356,16 +437,12 @@ def update_topic(session: Session, topic_id, **fields) -> Topic:
     if not topic:
         raise ValueError(f"Topic with id {topic_id} not found")
 
-    allowed_fields = {"name", "description", "keywords", "metadata"}
-    unknown = set(fields.keys()) - allowed_fields
-    if unknown:
+    if not _TOPIC_UPDATE_FIELDS.issuperset(fields):
+        unknown = fields.keys() - _TOPIC_UPDATE_FIELDS
         raise ValueError(f"Unknown fields: {unknown}")
 
     for key, value in fields.items():
-        if key == "metadata":
-            topic.meta_data = value
-        else:
-            setattr(topic, key, value)
+        setattr(topic, _FIELD_RENAME.get(key, key), value)
 
     session.flush()
     session.refresh(topic)
@@ -431,21 +508,92 @@ def insert_search_results(session: Session, results: list[dict]) -> int:
         return 0
 
     # Validate required fields before attempting insert
-    required_fields = {"title", "summary", "url", "source", "raw"}
+    # dict_keys >= frozenset probes membership without building a set per row
     for result in results:
-        missing = required_fields - set(result.keys())
-        if missing:
+        if not result.keys() >= _SEARCH_RESULT_REQUIRED_FIELDS:
+            missing = _SEARCH_RESULT_REQUIRED_FIELDS - result.keys()
             raise ValueError(f"Missing required field: {missing.pop()}")
 
-    # Bulk insert with ON CONFLICT DO NOTHING
-    # This leverages the unique constraint (source, url) at the database level
-    stmt = insert(SearchResult).values(results)
-    stmt = stmt.on_conflict_do_nothing(index_elements=["source", "url"])
+    if len(results) >= _COPY_THRESHOLD:
+        inserted_count = _copy_search_results(session, results)
+    else:
+        # Bulk insert with ON CONFLICT DO NOTHING
+        # This leverages the unique (source, url) digest index at the database level
+        stmt = insert(SearchResult).values(results)
+        stmt = stmt.on_conflict_do_nothing(index_elements=[SEARCH_RESULT_CONFLICT_KEY])
+
+        result = session.execute(stmt)
+        inserted_count = result.rowcount
+
+    logger = _get_logger()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Inserted %d search results (duplicates ignored)", inserted_count)
+
+    return inserted_count
+
+
+def _copy_search_results(session: Session, results: list[dict]) -> int:
+    """
+    Load a large batch of search results via COPY into a temporary staging table.
+
+    Rows are streamed as CSV over COPY FROM STDIN, then moved into search_results
+    with a single INSERT ... SELECT ... ON CONFLICT DO NOTHING so duplicate handling
+    matches the regular insert path.
 
-    result = session.execute(stmt)
+    Args:
+        session: SQLAlchemy session (caller must commit)
+        results: Validated list of normalized result dicts
+
+    Returns:
+        Number of rows inserted into search_results
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for result in results:
+        published_at = result.get("published_at")
+        writer.writerow(
+            (
+                result["title"],
+                result["summary"],
+                result["url"],
+                result["source"],
+                published_at.isoformat() if published_at is not None else _COPY_NULL,
+                _json_serializer(result["raw"]),
+            )
+        )
+    buffer.seek(0)
+
+    # Staging table lives for the current transaction only
+    session.execute(
+        text(
+            "CREATE TEMP TABLE IF NOT EXISTS search_results_staging ("
+            "title text, summary text, url text, source text, "
+            "published_at timestamptz, raw jsonb"
+            ") ON COMMIT DROP"
+        )
+    )
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY search_results_staging ({_SEARCH_RESULT_COLUMNS}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+    result = session.execute(
+        text(
+            f"INSERT INTO search_results ({_SEARCH_RESULT_COLUMNS}) "
+            f"SELECT {_SEARCH_RESULT_COLUMNS} FROM search_results_staging "
+            f"ON CONFLICT ({SEARCH_RESULT_CONFLICT_KEY.text}) DO NOTHING"
+        )
+    )
     inserted_count = result.rowcount
 
-    _get_logger().debug("Inserted %d search results (duplicates ignored)", inserted_count)
+    # Staging table may be reused by another batch in the same transaction
+    session.execute(text("TRUNCATE search_results_staging"))
 
     return inserted_count
 
@@ -483,16 +631,12 @@ def update_article(session: Session, article_id, **fields) -> Article:
     if not article:
         raise ValueError(f"Article with id {article_id} not found")
 
-    allowed_fields = {"title", "content", "metadata", "status", "published_at"}
-    unknown = set(fields.keys()) - allowed_fields
-    if unknown:
+    if not _ARTICLE_UPDATE_FIELDS.issuperset(fields):
+        unknown = fields.keys() - _ARTICLE_UPDATE_FIELDS
         raise ValueError(f"Unknown fields: {unknown}")
 
     for key, value in fields.items():
-        if key == "metadata":
-            article.meta_data = value
-        else:
-            setattr(article, key, value)
+        setattr(article, _FIELD_RENAME.get(key, key), value)
 
     session.flush()
     session.refresh(article)
@@ -18,13 +18,16 @@ from sqlalchemy import (
     Index,
     String,
     Text,
-    UniqueConstraint,
     event,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+# ON CONFLICT target for search result inserts. Indexing a 16-byte digest of
+# (source, url) keeps the unique index small regardless of URL length.
+SEARCH_RESULT_CONFLICT_KEY = text("decode(md5(source || '|' || url), 'hex')")
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -341,10 +344,15 @@ class SearchResult(Base):
     )
 
     # Indexes and constraints
+    # (source, url) uniqueness is enforced through SEARCH_RESULT_CONFLICT_KEY
     __table_args__ = (
         Index("ix_search_results_source", "source"),
         Index("ix_search_results_published_at", "published_at"),
-        UniqueConstraint("source", "url", name="uq_search_results_source_url"),
+        Index(
+            "uq_search_results_conflict_key",
+            SEARCH_RESULT_CONFLICT_KEY,
+            unique=True,
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,67 @@
+"""Sharing of identical concurrent calls to external services.
+
+When several callers ask for the same thing at once (the same keyword from
+several planners, duplicate prompts in a batch), only the first one sends the
+request; the others await its result. Each caller is shielded, so cancelling
+one does not cancel the call for the rest, and the call is cancelled once the
+last caller has gone, so abandoned requests stop spending API quota.
+
+Public API:
+    InflightCall: A shared call registered under its key while it runs
+"""
+
+import asyncio
+from collections.abc import Coroutine, Hashable
+from typing import Any
+
+
+class InflightCall:
+    """A shared call plus the number of callers awaiting it.
+
+    The call registers itself in ``registry`` under ``key`` and removes itself
+    when it finishes or is abandoned, so callers look up ``registry[key]`` to
+    join a call already in flight.
+    """
+
+    def __init__(
+        self,
+        registry: dict[Hashable, "InflightCall"],
+        key: Hashable,
+        coro: Coroutine[Any, Any, Any],
+    ) -> None:
+        self.registry = registry
+        self.key = key
+        self.task = asyncio.ensure_future(coro)
+        self.waiters = 0
+        self.task.add_done_callback(self._finished)
+        registry[key] = self
+
+    def _forget(self) -> None:
+        """Remove this call from the registry, if it is still the one registered."""
+        if self.registry.get(self.key) is self:
+            del self.registry[self.key]
+
+    def _finished(self, task: asyncio.Task) -> None:
+        """Unregister the finished call.
+
+        Also marks its exception as retrieved, since every caller may already
+        have been cancelled.
+        """
+        self._forget()
+        if not task.cancelled():
+            task.exception()
+
+    async def wait(self) -> Any:
+        """Await the shared call; cancel it if the last waiter goes away."""
+        self.waiters += 1
+        try:
+            # Shield so one cancelled caller does not cancel the call for the others
+            return await asyncio.shield(self.task)
+        finally:
+            self.waiters -= 1
+            if not self.waiters and not self.task.done():
+                # Unregister now, not in the done callback, so a caller arriving
+                # before the cancellation lands starts a fresh call instead of
+                # joining one that is about to raise CancelledError
+                self._forget()
+                self.task.cancel()
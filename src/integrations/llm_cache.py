@@ -0,0 +1,115 @@
+"""Persistent SQLite cache for LLM responses.
+
+The in-process response cache dies with the process, so rerunning the
+pipeline on the same article pays again for identical outline and synthesis
+prompts. This module keeps those responses on disk, shared by every run and
+worker on the machine. Values are zlib-compressed; the database runs in WAL
+mode so concurrent readers never block the writer. Each store also deletes
+entries that have outlived the TTL, so the file does not grow without bound.
+
+Blocking SQLite calls belong off the event loop; callers run them through
+asyncio.to_thread.
+
+Public API:
+    get_cached_response: Look up a stored response that is still fresh
+    store_response: Store a response under its request key
+    clear_llm_cache: Drop every stored response
+    close_llm_cache: Close the database connection (call on shutdown)
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+_CACHE_PATH = Path("~/.cache/agentic-blogger/llm.db").expanduser()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    response BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at);
+"""
+
+_connection: sqlite3.Connection | None = None
+# One connection is shared by the to_thread worker threads; serialize its use
+_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database on first use. Call with _lock held."""
+    global _connection
+    if _connection is None:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _connection = sqlite3.connect(_CACHE_PATH, isolation_level=None, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.executescript(_SCHEMA)
+    return _connection
+
+
+def get_cached_response(key: str, ttl: int) -> str | None:
+    """Return the response stored under key if it is younger than ttl seconds.
+
+    Args:
+        key: Request fingerprint
+        ttl: Maximum age in seconds of a usable entry
+
+    Returns:
+        The cached response text, or None if missing or stale
+    """
+    with _lock:
+        row = (
+            _get_connection()
+            .execute("SELECT created_at, response FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+    if row is None:
+        return None
+
+    created_at, response = row
+    if created_at + ttl <= time.time():
+        return None
+    return zlib.decompress(response).decode("utf-8")
+
+
+def store_response(key: str, model: str, response: str, ttl: int) -> None:
+    """Store a response under key, replacing any previous entry.
+
+    Entries older than ttl seconds can no longer be served, so they are
+    deleted in the same call.
+
+    Args:
+        key: Request fingerprint
+        model: Model that produced the response
+        response: Generated text
+        ttl: Lifetime in seconds of a usable entry
+    """
+    blob = zlib.compress(response.encode("utf-8"))
+    now = int(time.time())
+    with _lock:
+        connection = _get_connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO responses (key, model, created_at, response) "
+            "VALUES (?, ?, ?, ?)",
+            (key, model, now, blob),
+        )
+        connection.execute("DELETE FROM responses WHERE created_at <= ?", (now - ttl,))
+
+
+def clear_llm_cache() -> None:
+    """Drop every stored response."""
+    with _lock:
+        _get_connection().execute("DELETE FROM responses")
+
+
+def close_llm_cache() -> None:
+    """Close the database connection. Safe to call when it was never opened."""
+    global _connection
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+        _connection = None
@@ -5,7 +5,11 @@ using LiteLLM, with Gemini as the default provider and optional OpenAI support.
 
 Public API:
     generate_text: Generate text from a prompt using configured LLM provider
+    generate_text_batch: Generate text for many prompts with bounded concurrency
     generate_structured: Generate structured output matching a Pydantic schema
+    clear_response_cache: Drop all cached generate_text responses
+    reset_rate_limiter: Forget request history used for client-side throttling
+    truncate_to_tokens: Cut text to a token budget before it goes into a prompt
     LLMRetryExhausted: Exception raised when retries are exhausted
 
 Example:
@@ -21,20 +25,368 @@ Example:
 """
 
 import asyncio
+import contextlib
+import functools
+import hashlib
 import json
+import random
+import re
+import statistics
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
 
-import litellm
 from pydantic import BaseModel, ValidationError
 
+from src.integrations import llm_cache
+from src.integrations.inflight import InflightCall
 from src.utils.config import get_settings
 from src.utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import litellm
+
 
 def _get_logger():
     """Get logger instance lazily to avoid module-level import issues."""
     return get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _litellm():
+    """Import LiteLLM on first use.
+
+    LiteLLM pulls in every provider SDK (seconds of import time), so code
+    paths that never call an LLM should not pay for it at import.
+    """
+    import litellm  # pylint: disable=import-outside-toplevel
+
+    return litellm
+
+
+# Responses above this temperature are sampled fresh and never cached
+_CACHE_MAX_TEMPERATURE = 0.3
+
+
+class _ResponseCache:
+    """In-process TTL cache mapping request fingerprints to generated text."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, str]] = {}
+
+    def get(self, key: str) -> str | None:
+        """Return the cached text for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, text = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return text
+
+    def set(self, key: str, text: str, ttl: int) -> None:
+        """Store text under key for ttl seconds."""
+        self._entries[key] = (time.monotonic() + ttl, text)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+_response_cache = _ResponseCache()
+
+# Upper bound on a single retry sleep, however many attempts have failed
+_MAX_RETRY_DELAY = 60.0
+
+# Rate-limit reset headers each provider sends on a 429, checked after the
+# standard Retry-After headers. OpenAI (and OpenAI-compatible custom endpoints)
+# report per-dimension resets as durations like "1s" or "6m0s"; Gemini only
+# sends Retry-After.
+_RATE_LIMIT_RESET_HEADERS: dict[str, tuple[str, ...]] = {
+    "openai": ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"),
+    "gemini": (),
+}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+# Default (requests, tokens) per minute for LLM_RATE_LIMIT when not overridden
+_PROVIDER_RATE_LIMITS: dict[str, tuple[int, int]] = {
+    "gemini": (60, 100_000),
+    "openai": (60, 150_000),
+}
+
+# Lazily built router for LLM_KEY_POOL, with the settings it was built from
+_router: "litellm.Router | None" = None
+_router_signature: tuple | None = None
+
+
+def _cache_key(
+    provider: str, base_url: str | None, model: str, temperature: float, prompt: str
+) -> str:
+    """Build a deterministic cache key for a generation request.
+
+    The prompt is keyed exactly as given; callers pass the output of
+    _canonicalize_prompt, so only trailing and outer whitespace is ignored.
+    Indentation and line breaks stay significant (code, YAML, nested lists).
+
+    The provider and endpoint are part of the key, so a persisted response is
+    never served to a different endpoint that happens to use the same model
+    name.
+
+    Args:
+        provider: LLM provider name
+        base_url: Custom endpoint URL, or None for hosted providers
+        model: Resolved model ID
+        temperature: Sampling temperature
+        prompt: Canonical prompt text
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding of the request
+    """
+    payload = json.dumps(
+        {"pr": provider, "u": base_url, "m": model, "t": temperature, "p": prompt},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _canonicalize_prompt(prompt: str) -> str:
+    """Normalize incidental whitespace in a prompt before it is sent.
+
+    Strips trailing whitespace from every line and leading/trailing blank
+    space from the whole prompt, so callers that build the same prompt with
+    slightly different formatting send byte-identical text and can reuse the
+    provider's prompt prefix cache.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Canonical prompt text
+    """
+    return "\n".join(line.rstrip() for line in prompt.splitlines()).strip()
+
+
+# Identical low-temperature requests currently awaiting a response, by _cache_key
+_inflight_requests: dict[str, InflightCall] = {}
+
+
+def clear_response_cache() -> None:
+    """Drop all cached generate_text responses. Useful for testing."""
+    _response_cache.clear()
+
+
+class _RateLimiter:
+    """Sliding-window admission control for requests and tokens per minute.
+
+    Each admitted request is recorded as a ``[timestamp, tokens]`` entry; a new
+    request waits until the last 60 seconds hold fewer than ``rpm`` entries and
+    room for its tokens. A request larger than the whole token budget is still
+    admitted once the window is empty so it can never wait forever.
+    """
+
+    _WINDOW = 60.0
+
+    def __init__(self, rpm: int, tpm: int) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._entries: deque[list[float]] = deque()
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        """Drop entries that have left the sliding window."""
+        cutoff = now - self._WINDOW
+        while self._entries and self._entries[0][0] <= cutoff:
+            self._entries.popleft()
+
+    async def acquire(self, tokens: int) -> list[float]:
+        """Wait until a request of ``tokens`` fits and record it.
+
+        Returns:
+            The window entry, to be corrected with record_usage()
+        """
+        # The lock keeps waiters first-come first-served
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                used = sum(entry[1] for entry in self._entries)
+                if not self._entries or (
+                    len(self._entries) < self.rpm and used + tokens <= self.tpm
+                ):
+                    entry = [now, float(tokens)]
+                    self._entries.append(entry)
+                    return entry
+                await asyncio.sleep(self._entries[0][0] + self._WINDOW - now)
+
+    @staticmethod
+    def record_usage(entry: list[float], tokens: int) -> None:
+        """Replace an admitted request's estimate with its reported token usage."""
+        entry[1] = float(tokens)
+
+
+# Error-message keywords, each compiled to one alternation so classifying an
+# error is a single case-insensitive scan
+_OVERLOAD_PATTERN = re.compile(r"rate limit|429|server error|50[0234]", re.IGNORECASE)
+_RETRYABLE_PATTERN = re.compile(
+    r"rate limit|timeout|connection|server error|50[0234]", re.IGNORECASE
+)
+_NON_RETRYABLE_PATTERN = re.compile(
+    r"authentication|invalid api key|unauthorized|40[013]|invalid request", re.IGNORECASE
+)
+
+
+def _is_overload_error(error: BaseException) -> bool:
+    """Whether an error means the provider is overloaded (HTTP 429 or 5xx).
+
+    Args:
+        error: The exception raised by the LLM call
+
+    Returns:
+        True for rate-limit and server errors, False otherwise
+    """
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    return _OVERLOAD_PATTERN.search(str(error)) is not None
+
+
+class _AIMDLimiter:
+    """Concurrency limit that adapts to provider health (AIMD).
+
+    Used as an ``async with`` slot around each provider request. Additive
+    increase: successful calls grow the limit by one per full window of
+    requests while the median recent latency stays under the target.
+    Multiplicative decrease: a 429/5xx halves it. The limit stays between 1
+    and ``maximum``.
+    """
+
+    _TARGET_LATENCY = 2.0
+    _DECREASE_FACTOR = 0.5
+    _LATENCY_SAMPLES = 20
+
+    def __init__(self, maximum: int) -> None:
+        self.maximum = maximum
+        self.limit = float(maximum)
+        self._in_flight = 0
+        self._latencies: deque[float] = deque(maxlen=self._LATENCY_SAMPLES)
+        self._started: dict[asyncio.Task | None, float] = {}
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "_AIMDLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        self._started[asyncio.current_task()] = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        latency = time.monotonic() - self._started.pop(asyncio.current_task())
+        async with self._condition:
+            self._in_flight -= 1
+            if exc is None:
+                self._latencies.append(latency)
+                if statistics.median(self._latencies) < self._TARGET_LATENCY:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            elif _is_overload_error(exc):
+                self.limit = max(1.0, self.limit * self._DECREASE_FACTOR)
+            self._condition.notify_all()
+        return False
+
+
+# Lazily built limiter for LLM_RATE_LIMIT, with the limits it was built from
+_rate_limiter: _RateLimiter | None = None
+_rate_limiter_signature: tuple | None = None
+
+
+def _get_rate_limiter(provider: str | None, base_url: str | None) -> _RateLimiter | None:
+    """Get the shared rate limiter for the current settings, if enabled.
+
+    Args:
+        provider: Provider name from _get_llm_config
+        base_url: Custom endpoint URL, or None for hosted providers
+
+    Returns:
+        The limiter, or None when LLM_RATE_LIMIT is off or no limits are known
+    """
+    global _rate_limiter, _rate_limiter_signature
+    settings = get_settings()
+    if not settings.LLM_RATE_LIMIT:
+        return None
+
+    # Custom endpoints have no known defaults; both limits must then be set explicitly
+    default_rpm, default_tpm = (None, None)
+    if not base_url:
+        default_rpm, default_tpm = _PROVIDER_RATE_LIMITS.get(provider or "", (None, None))
+    rpm = settings.LLM_RPM_LIMIT or default_rpm
+    tpm = settings.LLM_TPM_LIMIT or default_tpm
+    if rpm is None or tpm is None:
+        return None
+
+    signature = (provider, base_url, rpm, tpm)
+    if _rate_limiter is None or _rate_limiter_signature != signature:
+        _rate_limiter = _RateLimiter(rpm, tpm)
+        _rate_limiter_signature = signature
+    return _rate_limiter
+
+
+def reset_rate_limiter() -> None:
+    """Forget all recorded requests so throttling starts fresh. Useful for testing."""
+    global _rate_limiter, _rate_limiter_signature
+    _rate_limiter = None
+    _rate_limiter_signature = None
+
+
+# Per-request overhead (role markers, message framing) added to token estimates
+_REQUEST_TOKEN_OVERHEAD = 16
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheaply estimate the tokens a request for ``text`` will consume.
+
+    Uses ~4 characters per token plus a fixed per-request overhead. This runs
+    on every admission, so it deliberately avoids tokenizing; the limiter is
+    corrected with the provider's reported usage once the call completes.
+    """
+    return (len(text) >> 2) + _REQUEST_TOKEN_OVERHEAD
+
+
+def truncate_to_tokens(text: str, max_tokens: int, *, model: str | None = None) -> str:
+    """Truncate text to at most ``max_tokens`` tokens, dropping from the end.
+
+    Uses the model's tokenizer via LiteLLM; models without a known tokenizer
+    fall back to tiktoken's cl100k_base, which is close enough for budgeting.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget (must be positive)
+        model: Model whose tokenizer to use (default: generic tokenizer)
+
+    Returns:
+        ``text`` unchanged if it fits, otherwise its longest token prefix
+        within budget
+
+    Raises:
+        ValueError: If max_tokens is not positive
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+
+    # Every token covers at least one byte, so short texts fit without encoding
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+
+    llm = _litellm()
+    tokens = llm.encode(model=model or "", text=text)
+    if len(tokens) <= max_tokens:
+        return text
+    return llm.decode(model=model or "", tokens=tokens[:max_tokens])
+
+
 class LLMRetryExhausted(Exception):
     """Raised when all retry attempts are exhausted or error is non-retryable.
 
@@ -74,9 +426,31 @@ def _strip_markdown_json(text: str) -> str:
     return text.strip()
 
 
+@functools.lru_cache(maxsize=1)
+def _litellm_error_types() -> tuple[tuple[type, ...], tuple[type, ...]]:
+    """LiteLLM exception classes as (retryable, non-retryable) tuples."""
+    exceptions = _litellm().exceptions
+    retryable = (
+        exceptions.RateLimitError,
+        exceptions.APIConnectionError,  # Includes Timeout
+        exceptions.InternalServerError,
+        exceptions.ServiceUnavailableError,
+    )
+    non_retryable = (
+        exceptions.AuthenticationError,
+        exceptions.PermissionDeniedError,
+        exceptions.BadRequestError,  # Includes context window and content policy errors
+        exceptions.NotFoundError,
+    )
+    return retryable, non_retryable
+
+
 def _is_retryable_error(error: Exception) -> bool:
     """Determine if an error should trigger a retry.
 
+    LiteLLM maps every provider failure to a typed exception, so those are
+    classified by type. Message keywords are only a fallback for other errors.
+
     Args:
         error: The exception that occurred
 
@@ -94,42 +468,128 @@ def _is_retryable_error(error: Exception) -> bool:
     if isinstance(error, retryable_types):
         return True
 
-    # Check for LiteLLM-specific errors
-    error_str = str(error).lower()
-    if any(
-        keyword in error_str
-        for keyword in [
-            "rate limit",
-            "timeout",
-            "connection",
-            "server error",
-            "500",
-            "502",
-            "503",
-            "504",
-        ]
-    ):
+    litellm_retryable, litellm_non_retryable = _litellm_error_types()
+    if isinstance(error, litellm_retryable):
+        return True
+    if isinstance(error, litellm_non_retryable):
+        return False
+
+    # Fall back to message keywords; retryable keywords win over non-retryable
+    error_str = str(error)
+    if _RETRYABLE_PATTERN.search(error_str):
         return True
 
     # Non-retryable: authentication, invalid request, etc.
-    if any(
-        keyword in error_str
-        for keyword in [
-            "authentication",
-            "invalid api key",
-            "unauthorized",
-            "401",
-            "403",
-            "invalid request",
-            "400",
-        ]
-    ):
+    if _NON_RETRYABLE_PATTERN.search(error_str):
         return False
 
     # Default: retry on unknown errors
     return True
 
 
+def _backoff_delay(attempt: int, base_delay: float) -> float:
+    """Compute a jittered exponential backoff delay for a retry.
+
+    The delay is drawn uniformly from ``[base_delay, base_delay * 3 * 2**attempt]``
+    and capped at _MAX_RETRY_DELAY, so coroutines that were rate limited
+    together do not all retry at the same instant.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base_delay: Minimum delay in seconds (LLM_RETRY_DELAY)
+
+    Returns:
+        Delay in seconds
+    """
+    return min(_MAX_RETRY_DELAY, random.uniform(base_delay, base_delay * 3 * (2**attempt)))
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse a rate-limit header duration into seconds.
+
+    Accepts plain seconds ("0.8") and Go-style durations ("20ms", "6m0s").
+
+    Args:
+        value: Header value
+
+    Returns:
+        Duration in seconds, or None if the value cannot be parsed
+    """
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def _get_error_headers(error: Exception) -> dict[str, str]:
+    """Collect HTTP response headers attached to a LiteLLM/provider error.
+
+    Args:
+        error: The exception raised by the LLM call (or its cause)
+
+    Returns:
+        Headers with lowercased names (empty if none are attached)
+    """
+    for candidate in (error, error.__cause__):
+        if candidate is None:
+            continue
+        headers = getattr(candidate, "headers", None) or getattr(
+            getattr(candidate, "response", None), "headers", None
+        )
+        if headers:
+            return {str(name).lower(): str(value) for name, value in headers.items()}
+    return {}
+
+
+def _retry_after_delay(error: Exception, provider: str | None) -> float | None:
+    """Read the server-requested wait time from a rate-limited error.
+
+    Checks ``retry-after-ms`` and ``retry-after`` (seconds or HTTP date), then
+    the provider's reset headers from _RATE_LIMIT_RESET_HEADERS, taking the
+    longest reset so every exhausted dimension has recovered.
+
+    Args:
+        error: The exception raised by the LLM call
+        provider: Provider name from _get_llm_config
+
+    Returns:
+        Delay in seconds capped at _MAX_RETRY_DELAY, or None if no usable header
+    """
+    headers = _get_error_headers(error)
+    if not headers:
+        return None
+
+    delay = None
+    if "retry-after-ms" in headers:
+        delay = _parse_duration(headers["retry-after-ms"])
+        delay = delay / 1000 if delay is not None else None
+    if delay is None and "retry-after" in headers:
+        delay = _parse_duration(headers["retry-after"])
+        if delay is None:
+            try:
+                retry_at = parsedate_to_datetime(headers["retry-after"])
+                delay = retry_at.timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+    if delay is None:
+        resets = [
+            _parse_duration(headers[name])
+            for name in _RATE_LIMIT_RESET_HEADERS.get(provider or "", ())
+            if name in headers
+        ]
+        resets = [reset for reset in resets if reset is not None]
+        delay = max(resets) if resets else None
+
+    if delay is None:
+        return None
+    return min(_MAX_RETRY_DELAY, max(0.0, delay))
+
+
 def _get_llm_config(model_override: str | None) -> dict:
     """Get LLM configuration based on priority: custom endpoint > hosted provider.
 
@@ -140,8 +600,9 @@ def _get_llm_config(model_override: str | None) -> dict:
         dict: Configuration with keys:
             - model: Model ID (may include provider prefix like vertex_ai/model-name)
             - base_url: Custom endpoint URL or None
-            - api_key: API key to use
+            - api_key: API key to use (None when a key pool is configured)
             - provider: Provider name or None (None lets LiteLLM auto-detect from model prefix)
+            - key_pool: Tuple of API keys to load-balance across (empty if not configured)
     """
     settings = get_settings()
 
@@ -152,28 +613,77 @@ def _get_llm_config(model_override: str | None) -> dict:
             "base_url": settings.CUSTOM_LLM_BASE_URL,
             "api_key": settings.get_custom_llm_api_key(),
             "provider": "openai",  # Treat all custom endpoints as OpenAI-compatible
+            "key_pool": (),
         }
 
     # Priority 2: Hosted provider (gemini/openai)
+    key_pool = tuple(settings.get_llm_key_pool())
     return {
         "model": model_override or settings.LLM_DEFAULT_MODEL,
         "base_url": None,
-        "api_key": settings.get_llm_api_key(),
+        "api_key": None if key_pool else settings.get_llm_api_key(),
         "provider": settings.LLM_PROVIDER,
+        "key_pool": key_pool,
     }
 
 
+def _get_router(model: str, provider: str, key_pool: tuple[str, ...]) -> "litellm.Router":
+    """Get a Router that load-balances one model across the configured key pool.
+
+    The router is rebuilt only when the model, provider, or pool changes.
+    Router-level retries are disabled because _call_llm_with_retry already
+    retries; the router's job is to steer each attempt to the least busy key
+    and cool down keys that are being rate limited.
+
+    Args:
+        model: Plain model ID
+        provider: Hosted provider name
+        key_pool: API keys to spread requests across
+
+    Returns:
+        litellm.Router serving ``model`` from every key in the pool
+    """
+    global _router, _router_signature
+    signature = (model, provider, key_pool)
+    if _router is None or _router_signature != signature:
+        _router = _litellm().Router(
+            model_list=[
+                {
+                    "model_name": model,
+                    "litellm_params": {
+                        "model": model,
+                        "api_key": key,
+                        "custom_llm_provider": provider,
+                    },
+                }
+                for key in key_pool
+            ],
+            routing_strategy="least-busy",
+            num_retries=0,
+        )
+        _router_signature = signature
+    return _router
+
+
 async def _call_llm_with_retry(  # pylint: disable=too-many-locals
     prompt: str,
     config: dict,
     temperature: float,
+    slot: asyncio.Semaphore | _AIMDLimiter | None = None,
 ) -> str:
-    """Call LLM with retry logic and exponential backoff.
+    """Call LLM with retry logic and jittered exponential backoff.
+
+    This loop is the only retry layer: LiteLLM's own ``num_retries`` and the
+    provider SDK's ``max_retries`` are pinned to 0 so a failing request is
+    attempted exactly 1 + LLM_MAX_RETRIES times rather than multiplied by
+    hidden SDK retries.
 
     Args:
         prompt: Text prompt to send to LLM
         config: LLM configuration dict from _get_llm_config
         temperature: Sampling temperature
+        slot: Optional semaphore or _AIMDLimiter held only while a request is
+              in flight, so backoff sleeps do not count against a batch's concurrency
 
     Returns:
         Generated text
@@ -190,9 +700,11 @@ async def _call_llm_with_retry(  # pylint: disable=too-many-locals
     base_url = config["base_url"]
     api_key = config["api_key"]
     provider = config["provider"]
+    key_pool = config["key_pool"]
 
     # Determine provider for logging (custom endpoint or hosted)
     provider_name = "custom" if base_url else provider
+    limiter = _get_rate_limiter(provider, base_url)
 
     # Total attempts = 1 initial + max_retries
     for attempt in range(max_retries + 1):
@@ -211,20 +723,40 @@ async def _call_llm_with_retry(  # pylint: disable=too-many-locals
                 },
             )
 
-            # Call LiteLLM with configuration
-            response = await litellm.acompletion(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
-                api_key=api_key,
-                base_url=base_url,
-                timeout=settings.LLM_TIMEOUT,
-                custom_llm_provider=provider,
-            )
+            # Wait for rate-limit headroom before taking a concurrency slot
+            admission = await limiter.acquire(_estimate_tokens(prompt)) if limiter else None
+
+            # Call LiteLLM with configuration, spreading load over the key pool if set
+            async with slot if slot is not None else contextlib.nullcontext():
+                if key_pool:
+                    response = await _get_router(model, provider, key_pool).acompletion(
+                        model=model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=temperature,
+                        timeout=settings.LLM_TIMEOUT,
+                        max_retries=0,
+                    )
+                else:
+                    response = await _litellm().acompletion(
+                        model=model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=temperature,
+                        api_key=api_key,
+                        base_url=base_url,
+                        timeout=settings.LLM_TIMEOUT,
+                        custom_llm_provider=provider,
+                        num_retries=0,
+                        max_retries=0,
+                    )
 
             # Extract generated text
             generated_text = response.choices[0].message.content
 
+            if admission is not None:
+                total_tokens = getattr(getattr(response, "usage", None), "total_tokens", None)
+                if isinstance(total_tokens, int):
+                    limiter.record_usage(admission, total_tokens)
+
             # Log success at INFO level
             logger.info(
                 "LLM request successful",
@@ -240,8 +772,8 @@ async def _call_llm_with_retry(  # pylint: disable=too-many-locals
             return generated_text
 
         except Exception as e:
-            # Log error details at DEBUG level
-            logger.debug("LLM error on attempt %d: %s: %s", attempt + 1, type(e).__name__, str(e))
+            # Log error details at DEBUG level (formatted only if DEBUG is enabled)
+            logger.debug("LLM error on attempt %d: %s: %s", attempt + 1, type(e).__name__, e)
 
             # Check if error is retryable
             if not _is_retryable_error(e):
@@ -276,8 +808,10 @@ async def _call_llm_with_retry(  # pylint: disable=too-many-locals
                     f"All {max_retries} retries failed: {type(e).__name__}: {str(e)}"
                 ) from e
 
-            # Calculate exponential backoff delay
-            delay = settings.LLM_RETRY_DELAY * (2**attempt)
+            # Wait as long as the provider asked, else use jittered exponential backoff
+            delay = _retry_after_delay(e, provider)
+            if delay is None:
+                delay = _backoff_delay(attempt, settings.LLM_RETRY_DELAY)
             logger.debug("Retrying in %ss (attempt %d/%d)", delay, attempt + 2, max_retries + 1)
             await asyncio.sleep(delay)
 
@@ -317,26 +851,160 @@ async def generate_text(
         - Supports both hosted providers (Gemini/OpenAI) and custom endpoints (Ollama/LM Studio)
         - Priority: CUSTOM_LLM_BASE_URL > LLM_PROVIDER
         - Model IDs should be plain (no provider prefix)
-        - Retry behavior: exponential backoff with max retries from config
+        - Retry behavior: honors Retry-After/rate-limit reset headers, otherwise
+          jittered exponential backoff (capped at 60s), with max retries from config
         - Total attempts = 1 initial + LLM_MAX_RETRIES
+        - Trailing whitespace is stripped from the prompt before sending so
+          equivalent prompts share the provider's prefix cache
+        - When LLM_CACHE_TTL > 0, responses for temperature <= 0.3 are reused
+          for identical (model, temperature, prompt) requests within the TTL;
+          LLM_CACHE_PERSIST also keeps them on disk across runs
+        - Concurrent identical requests at temperature <= 0.3 share one
+          provider call
         - Logs provider, model, and attempt count (never prompt or generated text)
     """
-    # Validate inputs
+    return await _generate_text(prompt, model=model, temperature=temperature)
+
+
+async def generate_text_batch(
+    prompts: list[str],
+    *,
+    model: str | None = None,
+    temperature: float = 0.2,
+    concurrency: int = 10,
+    adaptive: bool = False,
+) -> list[str]:
+    """Generate text for several independent prompts concurrently.
+
+    Each prompt goes through the same path as generate_text (cache, retries),
+    but at most ``concurrency`` provider requests are in flight at once.
+
+    Args:
+        prompts: Prompts to generate text for
+        model: Optional model override, as for generate_text
+        temperature: Sampling temperature applied to every prompt (default: 0.2)
+        concurrency: Maximum simultaneous provider requests (default: 10)
+        adaptive: Halve the in-flight limit on 429/5xx responses and grow it
+            back while latency stays low, never exceeding ``concurrency``
+            (default: False)
+
+    Returns:
+        Generated texts in the same order as ``prompts``
+
+    Raises:
+        ValueError: If any prompt is empty, temperature is out of range, or
+            concurrency is less than 1 (raised before any request is sent)
+        LLMRetryExhausted: When any prompt exhausts its retries; the remaining
+            requests are cancelled
+
+    Example:
+        >>> sections = await generate_text_batch([intro_prompt, body_prompt], concurrency=5)
+
+    Notes:
+        - The concurrency slot is released while a prompt waits to retry, so a
+          backing-off prompt never blocks the others
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    for prompt in prompts:
+        _validate_generation_args(prompt, temperature)
+
+    slot = _AIMDLimiter(concurrency) if adaptive else asyncio.Semaphore(concurrency)
+    tasks = [
+        asyncio.ensure_future(
+            _generate_text(prompt, model=model, temperature=temperature, slot=slot)
+        )
+        for prompt in prompts
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _validate_generation_args(prompt: str, temperature: float) -> None:
+    """Validate the prompt and temperature shared by the text generators.
+
+    Raises:
+        ValueError: If the prompt is empty or temperature is out of range
+    """
     if not prompt or not prompt.strip():
         raise ValueError("Prompt cannot be empty")
 
     if not 0.0 <= temperature <= 2.0:
         raise ValueError("Temperature must be between 0.0 and 2.0")
 
+
+async def _generate_text(
+    prompt: str,
+    *,
+    model: str | None,
+    temperature: float,
+    slot: asyncio.Semaphore | _AIMDLimiter | None = None,
+) -> str:
+    """Shared implementation of generate_text and generate_text_batch."""
+    # Validate inputs
+    _validate_generation_args(prompt, temperature)
+
     # Get LLM configuration (handles provider priority and model selection)
     config = _get_llm_config(model)
-
-    # Call LLM with retry logic
-    return await _call_llm_with_retry(
-        prompt=prompt,
-        config=config,
-        temperature=temperature,
+    prompt = _canonicalize_prompt(prompt)
+
+    # Higher temperatures are sampled fresh, so they are neither cached nor shared
+    if temperature > _CACHE_MAX_TEMPERATURE:
+        return await _call_llm_with_retry(
+            prompt=prompt,
+            config=config,
+            temperature=temperature,
+            slot=slot,
+        )
+
+    # Serve repeated low-temperature requests from the response cache
+    settings = get_settings()
+    cache_ttl = settings.LLM_CACHE_TTL
+    persist = bool(cache_ttl) and settings.LLM_CACHE_PERSIST
+    request_key = _cache_key(
+        config["provider"], config["base_url"], config["model"], temperature, prompt
     )
+    if cache_ttl:
+        cached = _response_cache.get(request_key)
+        if cached is None and persist:
+            cached = await asyncio.to_thread(llm_cache.get_cached_response, request_key, cache_ttl)
+        if cached is not None:
+            _get_logger().debug("LLM response cache hit for model %s", config["model"])
+            return cached
+
+    # Join an identical request that is already in flight instead of sending another
+    inflight = _inflight_requests.get(request_key)
+    if inflight is None:
+
+        async def fetch() -> str:
+            generated_text = await _call_llm_with_retry(
+                prompt=prompt,
+                config=config,
+                temperature=temperature,
+                slot=slot,
+            )
+            if cache_ttl:
+                _response_cache.set(request_key, generated_text, cache_ttl)
+            if persist:
+                await asyncio.to_thread(
+                    llm_cache.store_response,
+                    request_key,
+                    config["model"],
+                    generated_text,
+                    cache_ttl,
+                )
+            return generated_text
+
+        inflight = InflightCall(_inflight_requests, request_key, fetch())
+    else:
+        _get_logger().debug("Joining in-flight LLM request for model %s", config["model"])
+
+    return await inflight.wait()
 
 
 async def generate_structured(
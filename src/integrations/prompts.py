@@ -1,14 +1,55 @@
 """Centralized prompt registry for LLM interactions.
 
 This module contains versioned prompt templates used across the application.
-Each prompt is a static string constant with no dynamic logic.
+Each prompt is a string constant with no dynamic logic.
 
 Naming convention: <PURPOSE>_PROMPT_V<NUMBER>
 
+Templates with placeholders keep their static instructions first and the
+per-request fields last, so consecutive calls share a byte-identical prefix
+that providers can serve from their prompt cache. They are PromptTemplate
+instances: ordinary strings whose placeholders are parsed once at import.
+
 Version History:
 - V1: Initial prompt set for article generation workflow
 """
 
+from string import Formatter
+
+
+class PromptTemplate(str):
+    """A prompt string whose ``{field}`` placeholders are parsed once.
+
+    Behaves like the plain string it wraps. ``format()`` with keyword
+    arguments joins the pre-parsed literal chunks and field values instead of
+    re-scanning the template on every call. Templates using positional
+    fields, conversions, or format specs fall back to ``str.format``.
+
+    Attributes:
+        static_prefix: Literal text before the first placeholder
+    """
+
+    def __new__(cls, template: str) -> "PromptTemplate":
+        self = super().__new__(cls, template)
+        parts = list(Formatter().parse(template))
+        simple = all(
+            field is None or (field.isidentifier() and not spec and conversion is None)
+            for _, field, spec, conversion in parts
+        )
+        self._parts = [(literal, field) for literal, field, _, _ in parts] if simple else None
+        self.static_prefix = parts[0][0] if parts else ""
+        return self
+
+    def format(self, *args, **kwargs) -> str:
+        """Fill placeholders, matching ``str.format`` output exactly."""
+        if args or self._parts is None:
+            return str.format(self, *args, **kwargs)
+        return "".join(
+            literal if field is None else literal + format(kwargs[field])
+            for literal, field in self._parts
+        )
+
+
 TOPIC_ANALYSIS_PROMPT_V1 = """
 You are an expert AI researcher.
 
@@ -46,15 +87,10 @@ Write a clear, accurate, and engaging technical article
 based on the provided outline and research.
 """
 
-ARTICLE_REVIEW_PROMPT_V1 = """You are a meticulous technical editor and SEO specialist.
-
-TASK: Review and optimize the following technical article for publication.
-
-ARTICLE CONTEXT:
-Topic: {topic}
+ARTICLE_REVIEW_PROMPT_V1 = PromptTemplate(
+    """You are a meticulous technical editor and SEO specialist.
 
-ARTICLE CONTENT:
-{content}
+TASK: Review and optimize the technical article given at the end of this prompt for publication.
 
 YOUR REVIEW SHOULD INCLUDE:
 
@@ -65,6 +101,14 @@ YOUR REVIEW SHOULD INCLUDE:
 5. **SEO Optimization**: Create compelling title, subtitle, and tags
 6. **Readability**: Assess and improve readability level (aim for accessible technical writing)
 
+REQUIREMENTS:
+- Maintain the original structure and main points
+- Keep code examples intact (only fix syntax/formatting if needed)
+- Preserve technical depth while improving clarity
+- Ensure title is compelling and includes main keyword
+- Tags should cover: technology, concepts, audience level, use cases
+- Polished content should be publication-ready
+
 OUTPUT FORMAT (follow this structure exactly):
 
 Title: [SEO-optimized title, 50-60 characters, engaging and keyword-rich]
@@ -77,30 +121,20 @@ Polished Content:
 [Insert the complete polished article content here, with all improvements applied.
 Use proper markdown formatting. Include all sections, headings, code blocks, etc.]
 
-REQUIREMENTS:
-- Maintain the original structure and main points
-- Keep code examples intact (only fix syntax/formatting if needed)
-- Preserve technical depth while improving clarity
-- Ensure title is compelling and includes main keyword
-- Tags should cover: technology, concepts, audience level, use cases
-- Polished content should be publication-ready
-"""
-
-SECTION_WRITING_PROMPT_V1 = """
-You are an expert technical writer specializing in clear, engaging technical content.
-
-Write prose content for EXACTLY ONE SECTION of a technical article.
-
 ARTICLE CONTEXT:
 Topic: {topic}
 
-SECTION TO WRITE:
-Title: {section_title}
+ARTICLE CONTENT:
+{content}
+"""
+)
 
-Subsections to cover:
-{subsections_list}
+SECTION_WRITING_PROMPT_V1 = PromptTemplate(
+    """You are an expert technical writer specializing in clear, engaging
+technical content.
 
-TARGET LENGTH: Approximately {target_words} words
+Write prose content for EXACTLY ONE SECTION of a technical article.
+The article context, section, and target length are given at the end of this prompt.
 
 REQUIREMENTS:
 - Write ONLY the content for this ONE section (not the full article)
@@ -110,28 +144,29 @@ REQUIREMENTS:
 - Use clear, technically accurate language
 - Include code examples where appropriate
 - Be engaging and educational
-- Target approximately {target_words} words (flexible by ±20%)
+- Hit the target length (flexible by ±20%)
 
 OUTPUT FORMAT:
 Return ONLY the markdown content for this section. No title header, no preamble, no meta-commentary.
-"""
-
-RESEARCH_SYNTHESIS_PROMPT_V1 = """You are a research synthesis expert.
-
-TASK: Synthesize research findings into a comprehensive, structured summary for article writing.
 
 ARTICLE CONTEXT:
 Topic: {topic}
-Section: {section_title}
 
-WEB SEARCH RESULTS:
-{web_text}
+SECTION TO WRITE:
+Title: {section_title}
 
-ACADEMIC PAPERS:
-{papers_text}
+Subsections to cover:
+{subsections_list}
 
-CODE EXAMPLES:
-{code_text}
+TARGET LENGTH: Approximately {target_words} words
+"""
+)
+
+RESEARCH_SYNTHESIS_PROMPT_V1 = PromptTemplate(
+    """You are a research synthesis expert.
+
+TASK: Synthesize research findings into a comprehensive, structured summary for article writing.
+The article context and research sources are given at the end of this prompt.
 
 INSTRUCTIONS:
 - Synthesize all sources into a coherent summary
@@ -144,20 +179,26 @@ INSTRUCTIONS:
 
 OUTPUT:
 Provide a structured synthesis that a technical writer can use to write the section.
-"""
-
-ARTICLE_REVISION_PROMPT_V1 = """You are an expert technical editor specializing in revisions.
-
-TASK: Revise the following article based on specific user feedback.
 
 ARTICLE CONTEXT:
 Topic: {topic}
+Section: {section_title}
 
-CURRENT ARTICLE:
-{content}
+WEB SEARCH RESULTS:
+{web_text}
 
-USER FEEDBACK:
-{feedback}
+ACADEMIC PAPERS:
+{papers_text}
+
+CODE EXAMPLES:
+{code_text}
+"""
+)
+
+ARTICLE_REVISION_PROMPT_V1 = PromptTemplate(
+    """You are an expert technical editor specializing in revisions.
+
+TASK: Revise the article given at the end of this prompt based on the user feedback that follows it.
 
 YOUR REVISION SHOULD:
 1. **Address the feedback**: Make changes that directly respond to the user's requests
@@ -167,6 +208,13 @@ YOUR REVISION SHOULD:
 4. **Be surgical**: Only change what needs changing based on feedback
 5. **Enhance, don't replace**: Improve existing content rather than rewriting from scratch
 
+REQUIREMENTS:
+- Apply ALL points from the user feedback
+- Preserve any sections not mentioned in the feedback
+- Maintain markdown formatting and code blocks
+- Keep the same technical depth and style
+- Ensure the revised version is cohesive and flows well
+
 OUTPUT FORMAT (follow this structure exactly):
 
 Changes: [Brief summary of what you changed, 1-2 sentences]
@@ -175,10 +223,13 @@ Revised Content:
 [Insert the complete revised article here, with all changes applied.
 Use proper markdown formatting. Include all sections with modifications integrated.]
 
-REQUIREMENTS:
-- Apply ALL points from the user feedback
-- Preserve any sections not mentioned in the feedback
-- Maintain markdown formatting and code blocks
-- Keep the same technical depth and style
-- Ensure the revised version is cohesive and flows well
+ARTICLE CONTEXT:
+Topic: {topic}
+
+CURRENT ARTICLE:
+{content}
+
+USER FEEDBACK:
+{feedback}
 """
+)
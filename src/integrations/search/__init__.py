@@ -1,6 +1,7 @@
 """Search source clients for fetching raw data from external APIs."""
 
 from src.integrations.search.normalizer import (
+    normalize_all,
     normalize_arxiv,
     normalize_github_trending,
     normalize_google_trends,
@@ -9,6 +10,7 @@ from src.integrations.search.normalizer import (
 )
 
 __all__ = [
+    "normalize_all",
     "normalize_arxiv",
     "normalize_github_trending",
     "normalize_google_trends",
@@ -3,9 +3,25 @@
 Fetches recent papers from arXiv.org.
 """
 
+from datetime import datetime
+
 import arxiv
 
+from src.integrations.search.cache import cached
+
+# Newest-submission results change slowly; reuse them across runs for an hour
+_CACHE_TTL = 60 * 60
+
+# Largest page the arXiv API serves efficiently; bigger requests are paginated
+_MAX_PAGE_SIZE = 100
+
 
+def _isoformat(value: datetime | None) -> str | None:
+    """Format an optional timestamp as ISO 8601."""
+    return value.isoformat() if value else None
+
+
+@cached(ttl=_CACHE_TTL)
 async def fetch_arxiv(query: str, max_results: int = 20) -> list[dict]:
     """Fetch recent arXiv papers matching query.
 
@@ -25,28 +41,27 @@ async def fetch_arxiv(query: str, max_results: int = 20) -> list[dict]:
     if max_results <= 0:
         raise ValueError("Max results must be positive")
 
-    # Create search client
+    # Create search query and client; a page never needs to exceed max_results
     search = arxiv.Search(
         query=query,
         max_results=max_results,
         sort_by=arxiv.SortCriterion.SubmittedDate,
     )
+    client = arxiv.Client(page_size=min(max_results, _MAX_PAGE_SIZE), delay_seconds=3)
 
     # Fetch and parse results
-    papers = []
-    for result in search.results():
-        paper_dict = {
+    return [
+        {
             "entry_id": result.entry_id,
             "title": result.title,
             "summary": result.summary,
             "authors": [author.name for author in result.authors],
-            "published": result.published.isoformat() if result.published else None,
-            "updated": result.updated.isoformat() if result.updated else None,
+            "published": _isoformat(result.published),
+            "updated": _isoformat(result.updated),
             "primary_category": result.primary_category,
             "categories": result.categories,
             "pdf_url": result.pdf_url,
             "links": [link.href for link in result.links],
         }
-        papers.append(paper_dict)
-
-    return papers
+        for result in client.results(search)
+    ]
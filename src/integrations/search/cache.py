@@ -0,0 +1,104 @@
+"""Persistent TTL cache for search source fetchers.
+
+Sources like GitHub Trending (updated daily) and arXiv's newest submissions
+change slowly, so their raw results are kept on disk and reused across
+pipeline runs until the TTL expires. SEARCH_CACHE_ENABLED turns the cache
+off and SEARCH_CACHE_DIR chooses where it lives. The search clients do not
+otherwise need application settings, so when those cannot be loaded (APP_NAME
+or ENVIRONMENT unset) the cache falls back to its defaults.
+
+Public API:
+    cached: Decorator caching an async fetcher's result by its arguments
+    clear_search_cache: Drop every cached search result
+    reset_search_cache: Close the cache and re-read its settings on next use
+"""
+
+from functools import wraps
+from pathlib import Path
+
+import diskcache
+from pydantic import ValidationError
+
+from src.utils.config import Settings, get_settings
+
+# Cache directory and on/off switch, read from settings on first use
+_CACHE_DIR: Path | None = None
+_enabled: bool | None = None
+
+_cache: diskcache.Cache | None = None
+
+
+def _setting(name: str):
+    """Read a cache setting, or its default if settings cannot be loaded."""
+    try:
+        return getattr(get_settings(), name)
+    except ValidationError:
+        return Settings.model_fields[name].default
+
+
+def _cache_enabled() -> bool:
+    """Whether results are cached, per SEARCH_CACHE_ENABLED."""
+    global _enabled
+    if _enabled is None:
+        _enabled = _setting("SEARCH_CACHE_ENABLED")
+    return _enabled
+
+
+def _get_cache() -> diskcache.Cache:
+    """Open the on-disk cache on first use."""
+    global _cache, _CACHE_DIR
+    if _cache is None:
+        if _CACHE_DIR is None:
+            _CACHE_DIR = Path(_setting("SEARCH_CACHE_DIR")).expanduser()
+        _cache = diskcache.Cache(str(_CACHE_DIR))
+    return _cache
+
+
+def cached(ttl: int):
+    """Cache an async fetcher's return value on disk for ``ttl`` seconds.
+
+    The key is the function's qualified name plus its arguments, so arguments
+    must be picklable. Exceptions are never cached. When SEARCH_CACHE_ENABLED
+    is false the fetcher is called directly.
+
+    Args:
+        ttl: Seconds a cached result stays valid
+
+    Returns:
+        Decorated async function with on-disk caching
+    """
+
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not _cache_enabled():
+                return await func(*args, **kwargs)
+
+            key = (name, args, tuple(sorted(kwargs.items())))
+            cache = _get_cache()
+            result = cache.get(key)
+            if result is None:
+                result = await func(*args, **kwargs)
+                cache.set(key, result, expire=ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def clear_search_cache() -> None:
+    """Drop every cached search result."""
+    _get_cache().clear()
+
+
+def reset_search_cache() -> None:
+    """Close the cache and re-read its settings on next use. Useful for testing."""
+    global _cache, _CACHE_DIR, _enabled
+    if _cache is not None:
+        _cache.close()
+    _cache = None
+    _CACHE_DIR = None
+    _enabled = None
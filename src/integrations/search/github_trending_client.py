@@ -3,10 +3,23 @@
 Scrapes GitHub Trending page for popular repositories.
 """
 
-import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
+from src.integrations.search.cache import cached
+from src.integrations.search.http_client import get_http_client
 
+# Trending is computed daily; reuse a scrape across runs for a few hours
+_CACHE_TTL = 4 * 60 * 60
+
+# CSS selectors for one repository row and the fields read from it
+_ROW_SELECTOR = "article.Box-row"
+_NAME_LINK_SELECTOR = "h2 a"
+_DESCRIPTION_SELECTOR = "p.col-9"
+_STARS_SELECTOR = "span.d-inline-block.float-sm-right"
+_LANGUAGE_SELECTOR = 'span[itemprop="programmingLanguage"]'
+
+
+@cached(ttl=_CACHE_TTL)
 async def fetch_github_trending(language: str = "python") -> list[dict]:
     """Scrape GitHub Trending page.
 
@@ -24,43 +37,32 @@ async def fetch_github_trending(language: str = "python") -> list[dict]:
 
     url = f"https://github.com/trending/{language.lower()}?since=daily"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            url,
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=30.0,
-        )
-        response.raise_for_status()
+    response = await get_http_client().get(url)
+    response.raise_for_status()
 
-    # Parse HTML
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Parse HTML (selectolax/lexbor is much faster than BeautifulSoup's html.parser)
+    tree = LexborHTMLParser(response.text)
     repos = []
 
     # Find all repository articles
-    for article in soup.find_all("article", class_="Box-row"):
+    for article in tree.css(_ROW_SELECTOR):
         try:
-            # Extract repository name
-            h2 = article.find("h2")
-            if not h2:
-                continue
-
-            repo_link = h2.find("a")
+            # Extract repository name (first link inside the heading)
+            repo_link = article.css_first(_NAME_LINK_SELECTOR)
             if not repo_link:
                 continue
 
-            repo_name = repo_link.get("href", "").strip("/")
+            repo_name = (repo_link.attributes.get("href") or "").strip("/")
 
-            # Extract description
-            desc_elem = article.find("p", class_="col-9")
-            description = desc_elem.text.strip() if desc_elem else ""
+            # Extract description, stars, and language
+            desc_elem = article.css_first(_DESCRIPTION_SELECTOR)
+            description = desc_elem.text().strip() if desc_elem else ""
 
-            # Extract stars
-            stars_elem = article.find("span", class_="d-inline-block float-sm-right")
-            stars = stars_elem.text.strip() if stars_elem else "0"
+            stars_elem = article.css_first(_STARS_SELECTOR)
+            stars = stars_elem.text().strip() if stars_elem else "0"
 
-            # Extract language
-            lang_elem = article.find("span", {"itemprop": "programmingLanguage"})
-            repo_language = lang_elem.text.strip() if lang_elem else language
+            lang_elem = article.css_first(_LANGUAGE_SELECTOR)
+            repo_language = lang_elem.text().strip() if lang_elem else language
 
             repo_dict = {
                 "name": repo_name,
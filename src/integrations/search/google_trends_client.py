@@ -5,13 +5,72 @@ Fetches interest data from Google Trends with rate limiting and retry logic.
 
 import asyncio
 import logging
-from typing import Optional
+import random
+import re
+from typing import TYPE_CHECKING, Optional
 
 from pytrends.request import TrendReq
 
+from src.integrations.search.cache import cached
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Three-month interest curves barely move within an hour, and Google Trends is
+# the most aggressively rate-limited source, so reuse results across runs
+_CACHE_TTL = 60 * 60
+
+# Error text that marks a rate-limit response worth retrying
+_RATE_LIMIT_PATTERN = re.compile(r"429|too many requests|rate limit", re.IGNORECASE)
+
+# Longest Retry-After we are willing to honor (seconds)
+_MAX_RETRY_AFTER = 60.0
 
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds Google asked us to wait, from a numeric Retry-After on the failed response.
+
+    pytrends' ResponseError carries the requests.Response it failed on; other
+    errors have no response and yield None.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return min(max(float(value), 0.0), _MAX_RETRY_AFTER)
+    except ValueError:
+        return None
+
+
+def _fetch_interest_over_time(keywords: list[str]) -> "pd.DataFrame":
+    """Query pytrends for three months of interest in keywords (blocking)."""
+    # Initialize pytrends with timeout
+    pytrends = TrendReq(
+        hl="en-US",
+        tz=360,
+        timeout=(10, 30),  # (connect timeout, read timeout)
+        retries=0,  # We handle retries ourselves
+        backoff_factor=0,
+    )
+
+    # Build payload
+    pytrends.build_payload(
+        keywords,
+        cat=0,
+        timeframe="today 3-m",
+        geo="",
+        gprop="",
+    )
+
+    # Get interest over time
+    return pytrends.interest_over_time()
+
+
+@cached(ttl=_CACHE_TTL)
 async def fetch_google_trends(
     keywords: list[str],
     max_retries: int = 3,
@@ -19,6 +78,9 @@ async def fetch_google_trends(
 ) -> dict:
     """Fetch Google Trends interest data with rate limiting and retry logic.
 
+    Results are cached on disk for an hour, so repeated queries skip both the
+    upstream call and its rate-limit retries.
+
     Args:
         keywords: List of keywords to query (max 5)
         max_retries: Maximum number of retry attempts for rate limiting (default: 3)
@@ -38,63 +100,51 @@ async def fetch_google_trends(
         raise ValueError("Google Trends supports maximum 5 keywords")
 
     last_exception: Optional[Exception] = None
+    retry_after: float | None = None
 
     for attempt in range(max_retries):
         try:
             # Add delay before request (except first attempt)
             if attempt > 0:
-                # Exponential backoff: 2s, 4s, 8s, etc.
-                delay = base_delay * (2**attempt)
+                # Honor Retry-After; otherwise pick a random delay within an
+                # exponentially growing window (4s, 8s, ...) so concurrent
+                # workflows do not retry in lockstep
+                if retry_after is not None:
+                    delay = retry_after
+                else:
+                    delay = random.uniform(0, base_delay * (2**attempt))
                 logger.warning(
-                    f"Rate limited by Google Trends. Retrying in {delay}s "
+                    f"Rate limited by Google Trends. Retrying in {delay:.2f}s "
                     f"(attempt {attempt + 1}/{max_retries})"
                 )
                 await asyncio.sleep(delay)
 
-            # Initialize pytrends with timeout
-            pytrends = TrendReq(
-                hl="en-US",
-                tz=360,
-                timeout=(10, 30),  # (connect timeout, read timeout)
-                retries=0,  # We handle retries ourselves
-                backoff_factor=0,
-            )
-
-            # Build payload
-            pytrends.build_payload(
-                keywords,
-                cat=0,
-                timeframe="today 3-m",
-                geo="",
-                gprop="",
-            )
-
-            # Get interest over time
-            interest_df = pytrends.interest_over_time()
+            # pytrends is blocking (requests); keep the event loop free meanwhile
+            interest_df = await asyncio.to_thread(_fetch_interest_over_time, keywords)
 
             # Convert DataFrame to dictionary
             if interest_df.empty:
                 return {"keywords": keywords, "data": []}
 
-            # Convert to list of dictionaries with date and values
+            # Convert to list of dictionaries of keyword values, one per date. Going
+            # through a single ndarray skips pandas' per-row boxing in to_dict().
+            columns = interest_df.columns.tolist()
             result = {
                 "keywords": keywords,
-                "data": interest_df.to_dict(orient="records"),
+                "data": [dict(zip(columns, row)) for row in interest_df.to_numpy().tolist()],
             }
 
             return result
 
         except Exception as e:
             last_exception = e
-            error_msg = str(e).lower()
 
             # Check if it's a rate limit error (429 or related messages)
-            is_rate_limit = (
-                "429" in error_msg or "too many requests" in error_msg or "rate limit" in error_msg
-            )
+            is_rate_limit = _RATE_LIMIT_PATTERN.search(str(e)) is not None
 
             if is_rate_limit and attempt < max_retries - 1:
                 # Continue to next retry attempt
+                retry_after = _retry_after(e)
                 continue
             elif is_rate_limit:
                 # Last attempt failed with rate limit
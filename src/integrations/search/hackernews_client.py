@@ -3,17 +3,95 @@
 Fetches top stories from Hacker News API.
 """
 
+import asyncio
+import logging
+import random
+
 import httpx
+import orjson
+
+from src.integrations.search.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Attempts per request, and the backoff window base for retries (seconds)
+_MAX_ATTEMPTS = 4
+_BASE_DELAY = 0.5
+# Longest Retry-After we are willing to honor (seconds)
+_MAX_RETRY_AFTER = 30.0
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait, from a numeric Retry-After header."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(max(float(value), 0.0), _MAX_RETRY_AFTER)
+    except ValueError:
+        return None
+
+
+async def _get_with_retry(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """GET a URL, retrying throttling (429), 5xx responses and transport errors.
+
+    Waits as long as Retry-After asks, else a random delay within an
+    exponentially growing window ("full jitter") so concurrent item fetches
+    do not retry in lockstep.
+
+    Args:
+        client: HTTP client to send the request with
+        url: URL to fetch
+
+    Returns:
+        The final response; callers still check its status
 
+    Raises:
+        httpx.TransportError: If the last attempt fails to connect or times out
+    """
+    for attempt in range(_MAX_ATTEMPTS):
+        final_attempt = attempt == _MAX_ATTEMPTS - 1
+        delay = None
+        try:
+            response = await client.get(url, timeout=30.0)
+        except httpx.TransportError:
+            if final_attempt:
+                raise
+        else:
+            transient = response.status_code == 429 or response.status_code >= 500
+            if not transient or final_attempt:
+                return response
+            delay = _retry_after(response)
+
+        if delay is None:
+            delay = random.uniform(0, _BASE_DELAY * 2**attempt)
+        logger.warning(
+            "Hacker News request failed, retrying in %.2fs (attempt %d/%d): %s",
+            delay,
+            attempt + 2,
+            _MAX_ATTEMPTS,
+            url,
+        )
+        await asyncio.sleep(delay)
 
-async def fetch_hackernews_top(limit: int = 30) -> list[dict]:
+    # Unreachable: the final attempt always returns or raises
+    raise AssertionError("retry loop exited without a response")
+
+
+async def fetch_hackernews_top(limit: int = 30, *, concurrency: int = 16) -> list[dict]:
     """Fetch top Hacker News stories.
 
+    Story items are fetched concurrently, at most ``concurrency`` at a time,
+    so the fetch stays fast without flooding the Firebase API. Throttled
+    (429), 5xx and failed-connection requests are retried with jittered
+    exponential backoff, honoring Retry-After.
+
     Args:
         limit: Maximum number of stories to return
+        concurrency: Maximum item requests in flight at once
 
     Returns:
-        List of raw HN API story dictionaries
+        List of raw HN API story dictionaries, in top-stories order
 
     Raises:
         httpx.HTTPError: If API request fails
@@ -21,25 +99,36 @@ async def fetch_hackernews_top(limit: int = 30) -> list[dict]:
     if limit <= 0:
         raise ValueError("Limit must be positive")
 
-    async with httpx.AsyncClient() as client:
-        # Get list of top story IDs
-        response = await client.get(
-            "https://hacker-news.firebaseio.com/v0/topstories.json",
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        story_ids = (await response.json())[:limit]
-
-        # Fetch full story data for each ID
-        stories = []
-        for story_id in story_ids:
-            story_response = await client.get(
-                f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json",
-                timeout=30.0,
+    if concurrency <= 0:
+        raise ValueError("Concurrency must be positive")
+
+    client = get_http_client()
+
+    # Get list of top story IDs
+    response = await _get_with_retry(
+        client, "https://hacker-news.firebaseio.com/v0/topstories.json"
+    )
+    response.raise_for_status()
+    story_ids = orjson.loads(response.content)[:limit]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_story(story_id: int) -> dict | None:
+        async with semaphore:
+            story_response = await _get_with_retry(
+                client, f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
             )
-            story_response.raise_for_status()
-            story_data = await story_response.json()
-            if story_data:
-                stories.append(story_data)
+        story_response.raise_for_status()
+        return orjson.loads(story_response.content)
+
+    # Fetch full story data for every ID concurrently; deleted items come back null.
+    # If one fails, cancel the rest so they stop retrying against the API.
+    tasks = [asyncio.ensure_future(fetch_story(story_id)) for story_id in story_ids]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
 
-    return stories
+    return [story for story in results if story]
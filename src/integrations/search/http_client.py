@@ -0,0 +1,78 @@
+"""Shared HTTP client for search source clients.
+
+Keeps one pooled httpx.AsyncClient per event loop so repeated fetches (Tavily
+searches, Hacker News fan-outs, GitHub Trending scrapes) reuse TCP/TLS
+connections and HTTP/2 multiplexing instead of paying a new handshake on
+every call.
+
+Public API:
+    get_http_client: Get the shared client for the running event loop
+    close_http_client: Close the shared client (call on shutdown)
+"""
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = "Mozilla/5.0"
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+# Closes of clients left behind by a previous event loop, kept referenced until done
+_closing: set[asyncio.Task] = set()
+
+
+async def _aclose_stale(client: httpx.AsyncClient) -> None:
+    """Close a client replaced after an event loop change."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug("Failed to close stale HTTP client: %s", e)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Pooled connections belong to the event loop that opened them, so a new
+    client is created when called from a different loop than the last one.
+    The replaced client is closed in the background so its sockets are
+    released rather than leaked.
+
+    Returns:
+        Shared httpx.AsyncClient with HTTP/2, a 30s timeout, and a browser
+        User-Agent
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            task = loop.create_task(_aclose_stale(_client))
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers={"User-Agent": _USER_AGENT},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its connections.
+
+    Safe to call when no client has been created. Call this once when the
+    application shuts down.
+    """
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -7,8 +7,74 @@ NO business logic, ranking, scoring, or deduplication.
 """
 
 from datetime import datetime
+from functools import lru_cache
+from typing import Any
 from urllib.parse import quote_plus
 
+# Summaries are cut to this many characters
+_SUMMARY_MAX_LENGTH = 500
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, including a trailing ``Z``.
+
+    Cached because result batches repeat timestamps (same-day publications,
+    the same paper from several queries).
+
+    Raises:
+        ValueError: If value is not ISO 8601
+        TypeError: If value is not a string
+    """
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _from_unix(timestamp: int) -> datetime:
+    """Convert a unix timestamp to a local datetime (cached like _parse_iso).
+
+    Raises:
+        ValueError: If timestamp is out of range
+        TypeError: If timestamp is not a number
+        OSError: If the platform cannot represent timestamp
+    """
+    return datetime.fromtimestamp(timestamp)
+
+
+def _normalize_each(normalize_one, results: list) -> list[dict]:
+    """Apply a per-record normalizer, dropping records it rejects."""
+    return [record for record in map(normalize_one, results) if record is not None]
+
+
+def _normalize_tavily_one(raw_result: dict) -> dict | None:
+    """Normalize one Tavily search result, or return None if it lacks required fields."""
+    # Skip if missing required fields
+    title = raw_result.get("title", "").strip()
+    url = raw_result.get("url", "").strip()
+
+    if not title or not url:
+        return None
+
+    # Extract and truncate summary
+    summary = raw_result.get("content", "").strip()[:_SUMMARY_MAX_LENGTH]
+
+    # Parse published date if available
+    published_at = None
+    if raw_result.get("published_date"):
+        try:
+            published_at = _parse_iso(raw_result["published_date"])
+        except (ValueError, TypeError):
+            pass
+
+    return {
+        "title": title,
+        "summary": summary,
+        "url": url,
+        "source": "tavily",
+        "published_at": published_at,
+        "raw": raw_result,
+    }
+
 
 def normalize_tavily(results: list[dict]) -> list[dict]:
     """Normalize Tavily search results.
@@ -25,42 +91,51 @@ def normalize_tavily(results: list[dict]) -> list[dict]:
     if not isinstance(results, list):
         raise ValueError("Results must be a list")
 
-    normalized = []
-    for raw_result in results:
-        # Skip if missing required fields
-        title = raw_result.get("title", "").strip()
-        url = raw_result.get("url", "").strip()
-
-        if not title or not url:
-            continue
-
-        # Extract and truncate summary
-        summary = raw_result.get("content", "").strip()
-        if len(summary) > 500:
-            summary = summary[:500]
-
-        # Parse published date if available
-        published_at = None
-        if raw_result.get("published_date"):
-            try:
-                published_at = datetime.fromisoformat(
-                    raw_result["published_date"].replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                pass
-
-        normalized.append(
-            {
-                "title": title,
-                "summary": summary,
-                "url": url,
-                "source": "tavily",
-                "published_at": published_at,
-                "raw": raw_result,
-            }
-        )
-
-    return normalized
+    return _normalize_each(_normalize_tavily_one, results)
+
+
+def _normalize_hackernews_one(raw_result: dict) -> dict | None:
+    """Normalize one Hacker News story, or return None if it lacks required fields."""
+    # Skip if missing title
+    title = raw_result.get("title", "").strip()
+    if not title:
+        return None
+
+    # HN stories may not have URL (self-posts)
+    url = raw_result.get("url", "").strip()
+    text = raw_result.get("text", "").strip()
+
+    # Skip if no URL and no text
+    if not url and not text:
+        return None
+
+    # Use HN item URL if no external URL
+    if not url:
+        story_id = raw_result.get("id")
+        if story_id:
+            url = f"https://news.ycombinator.com/item?id={story_id}"
+        else:
+            return None
+
+    # Use text as summary for self-posts, empty otherwise
+    summary = text[:_SUMMARY_MAX_LENGTH]
+
+    # Parse unix timestamp
+    published_at = None
+    if raw_result.get("time"):
+        try:
+            published_at = _from_unix(raw_result["time"])
+        except (ValueError, TypeError, OSError):
+            pass
+
+    return {
+        "title": title,
+        "summary": summary,
+        "url": url,
+        "source": "hackernews",
+        "published_at": published_at,
+        "raw": raw_result,
+    }
 
 
 def normalize_hackernews(results: list[dict]) -> list[dict]:
@@ -78,54 +153,37 @@ def normalize_hackernews(results: list[dict]) -> list[dict]:
     if not isinstance(results, list):
         raise ValueError("Results must be a list")
 
-    normalized = []
-    for raw_result in results:
-        # Skip if missing title
-        title = raw_result.get("title", "").strip()
-        if not title:
-            continue
-
-        # HN stories may not have URL (self-posts)
-        url = raw_result.get("url", "").strip()
-        text = raw_result.get("text", "").strip()
+    return _normalize_each(_normalize_hackernews_one, results)
 
-        # Skip if no URL and no text
-        if not url and not text:
-            continue
 
-        # Use HN item URL if no external URL
-        if not url:
-            story_id = raw_result.get("id")
-            if story_id:
-                url = f"https://news.ycombinator.com/item?id={story_id}"
-            else:
-                continue
+def _normalize_arxiv_one(raw_result: dict) -> dict | None:
+    """Normalize one arXiv paper, or return None if it lacks required fields."""
+    # Skip if missing required fields
+    title = raw_result.get("title", "").strip()
+    entry_id = raw_result.get("entry_id", "").strip()
 
-        # Use text as summary for self-posts, empty otherwise
-        summary = text if text else ""
-        if len(summary) > 500:
-            summary = summary[:500]
+    if not title or not entry_id:
+        return None
 
-        # Parse unix timestamp
-        published_at = None
-        if raw_result.get("time"):
-            try:
-                published_at = datetime.fromtimestamp(raw_result["time"])
-            except (ValueError, TypeError, OSError):
-                pass
+    # Extract and truncate summary
+    summary = raw_result.get("summary", "").strip()[:_SUMMARY_MAX_LENGTH]
 
-        normalized.append(
-            {
-                "title": title,
-                "summary": summary,
-                "url": url,
-                "source": "hackernews",
-                "published_at": published_at,
-                "raw": raw_result,
-            }
-        )
+    # Parse published date
+    published_at = None
+    if raw_result.get("published"):
+        try:
+            published_at = _parse_iso(raw_result["published"])
+        except (ValueError, TypeError):
+            pass
 
-    return normalized
+    return {
+        "title": title,
+        "summary": summary,
+        "url": entry_id,  # arXiv entry_id is the canonical URL
+        "source": "arxiv",
+        "published_at": published_at,
+        "raw": raw_result,
+    }
 
 
 def normalize_arxiv(results: list[dict]) -> list[dict]:
@@ -143,42 +201,35 @@ def normalize_arxiv(results: list[dict]) -> list[dict]:
     if not isinstance(results, list):
         raise ValueError("Results must be a list")
 
-    normalized = []
-    for raw_result in results:
-        # Skip if missing required fields
-        title = raw_result.get("title", "").strip()
-        entry_id = raw_result.get("entry_id", "").strip()
+    return _normalize_each(_normalize_arxiv_one, results)
 
-        if not title or not entry_id:
-            continue
 
-        # Extract and truncate summary
-        summary = raw_result.get("summary", "").strip()
-        if len(summary) > 500:
-            summary = summary[:500]
+def _normalize_github_trending_one(raw_result: dict) -> dict | None:
+    """Normalize one GitHub Trending repository, or return None if it lacks required fields."""
+    # Skip if missing required fields
+    name = raw_result.get("name", "").strip()
+    url = raw_result.get("url", "").strip()
 
-        # Parse published date
-        published_at = None
-        if raw_result.get("published"):
-            try:
-                published_at = datetime.fromisoformat(
-                    raw_result["published"].replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                pass
+    if not name or not url:
+        return None
 
-        normalized.append(
-            {
-                "title": title,
-                "summary": summary,
-                "url": entry_id,  # arXiv entry_id is the canonical URL
-                "source": "arxiv",
-                "published_at": published_at,
-                "raw": raw_result,
-            }
-        )
+    # Use repo name as title
+    title = name
 
-    return normalized
+    # Extract and truncate description as summary
+    summary = raw_result.get("description", "").strip()[:_SUMMARY_MAX_LENGTH]
+
+    # GitHub Trending has no published date
+    published_at = None
+
+    return {
+        "title": title,
+        "summary": summary,
+        "url": url,
+        "source": "github",
+        "published_at": published_at,
+        "raw": raw_result,
+    }
 
 
 def normalize_github_trending(results: list[dict]) -> list[dict]:
@@ -196,44 +247,15 @@ def normalize_github_trending(results: list[dict]) -> list[dict]:
     if not isinstance(results, list):
         raise ValueError("Results must be a list")
 
-    normalized = []
-    for raw_result in results:
-        # Skip if missing required fields
-        name = raw_result.get("name", "").strip()
-        url = raw_result.get("url", "").strip()
-
-        if not name or not url:
-            continue
-
-        # Use repo name as title
-        title = name
-
-        # Extract and truncate description as summary
-        summary = raw_result.get("description", "").strip()
-        if len(summary) > 500:
-            summary = summary[:500]
-
-        # GitHub Trending has no published date
-        published_at = None
-
-        normalized.append(
-            {
-                "title": title,
-                "summary": summary,
-                "url": url,
-                "source": "github",
-                "published_at": published_at,
-                "raw": raw_result,
-            }
-        )
-
-    return normalized
+    return _normalize_each(_normalize_github_trending_one, results)
 
 
 def normalize_google_trends(results: dict) -> list[dict]:
     """Normalize Google Trends results.
 
-    Creates one record per keyword with aggregate trend data.
+    Creates one record per keyword. Each record's raw payload holds only
+    that keyword's interest series, so the aggregate payload is not
+    referenced (and re-serialized) once per keyword.
 
     Args:
         results: Raw Google Trends dictionary with keywords and data
@@ -251,12 +273,14 @@ def normalize_google_trends(results: dict) -> list[dict]:
     if not keywords:
         return []
 
+    data = results.get("data", [])
+
     normalized = []
-    for keyword in keywords:
-        if not keyword or not keyword.strip():
+    for raw_keyword in keywords:
+        if not raw_keyword or not raw_keyword.strip():
             continue
 
-        keyword = keyword.strip()
+        keyword = raw_keyword.strip()
 
         # Create deterministic Google Trends URL
         url = f"https://trends.google.com/trends/explore?q={quote_plus(keyword)}"
@@ -277,8 +301,54 @@ def normalize_google_trends(results: dict) -> list[dict]:
                 "url": url,
                 "source": "google_trends",
                 "published_at": published_at,
-                "raw": results,  # Full aggregate payload for all keywords
+                "raw": {
+                    "keyword": keyword,
+                    "interest": [row.get(raw_keyword) for row in data],
+                },
             }
         )
 
     return normalized
+
+
+# Per-record normalizers for list-shaped sources, keyed by canonical source name
+_RECORD_NORMALIZERS = {
+    "tavily": _normalize_tavily_one,
+    "hackernews": _normalize_hackernews_one,
+    "arxiv": _normalize_arxiv_one,
+    "github": _normalize_github_trending_one,
+}
+
+
+def normalize_all(payloads: dict[str, Any]) -> list[dict]:
+    """Normalize raw results from several sources into one list.
+
+    Equivalent to calling each normalize_* function and concatenating the
+    results, but records from every source are emitted into a single list.
+
+    Args:
+        payloads: Raw results keyed by source name: "tavily", "hackernews",
+            "arxiv" and "github" map to result lists, "google_trends" to the
+            raw trends dict
+
+    Returns:
+        Normalized records, grouped by source in payload order
+
+    Raises:
+        ValueError: If a source name is unknown or its payload has the wrong type
+    """
+    normalized: list[dict] = []
+    for source, results in payloads.items():
+        if source == "google_trends":
+            normalized.extend(normalize_google_trends(results))
+            continue
+
+        normalize_one = _RECORD_NORMALIZERS.get(source)
+        if normalize_one is None:
+            raise ValueError(f"Unknown source: {source}")
+        if not isinstance(results, list):
+            raise ValueError(f"Results for {source} must be a list")
+
+        normalized.extend(record for record in map(normalize_one, results) if record is not None)
+
+    return normalized
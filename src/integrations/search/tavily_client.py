@@ -5,12 +5,41 @@ Provides raw search results from Tavily API.
 
 import os
 
-import httpx
+import orjson
+
+from src.integrations.inflight import InflightCall
+from src.integrations.search.http_client import get_http_client
+
+# Searches currently awaiting a response, by (query, limit). Identical
+# concurrent searches (the same keyword from several planners) share one request.
+_inflight_searches: dict[tuple[str, int], InflightCall] = {}
+
+
+async def _post_search(query: str, limit: int, api_key: str) -> list[dict]:
+    """Send one search request to Tavily and return its results array."""
+    response = await get_http_client().post(
+        "https://api.tavily.com/search",
+        json={
+            "api_key": api_key,
+            "query": query,
+            "search_depth": "basic",
+            "max_results": limit,
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    # Return raw results array
+    return data.get("results", [])
 
 
 async def search_tavily(query: str, limit: int = 10) -> list[dict]:
     """Perform a web search using Tavily API.
 
+    Concurrent calls with the same query and limit share a single request,
+    which is cancelled if every caller is cancelled.
+
     Args:
         query: Search query string
         limit: Maximum number of results to return
@@ -29,19 +58,11 @@ async def search_tavily(query: str, limit: int = 10) -> list[dict]:
     if not api_key:
         raise ValueError("TAVILY_API_KEY environment variable not set")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.tavily.com/search",
-            json={
-                "api_key": api_key,
-                "query": query,
-                "search_depth": "basic",
-                "max_results": limit,
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        data = response.json()  # httpx.json() is synchronous, not async
+    query = query.strip()
+    key = (query, limit)
+    search = _inflight_searches.get(key)
+    if search is None:
+        search = InflightCall(_inflight_searches, key, _post_search(query, limit, api_key))
 
-    # Return raw results array
-    return data.get("results", [])
+    # Each caller gets its own list
+    return list(await search.wait())
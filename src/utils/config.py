@@ -74,6 +74,11 @@ class Settings(BaseSettings):
 
     LLM_API_KEY: SecretStr | None = Field(default=None, description="API key for LLM provider")
 
+    LLM_KEY_POOL: list[SecretStr] = Field(
+        default_factory=list,
+        description="JSON list of API keys to load-balance hosted LLM requests across",
+    )
+
     LLM_DEFAULT_MODEL: str = Field(
         default="gemini-1.5-flash", description="Default LLM model to use (plain model ID)"
     )
@@ -88,6 +93,30 @@ class Settings(BaseSettings):
 
     LLM_TIMEOUT: int = Field(default=30, description="LLM API timeout in seconds", gt=0)
 
+    LLM_CACHE_TTL: int = Field(
+        default=0,
+        description="Seconds to reuse identical low-temperature LLM responses (0 disables)",
+        ge=0,
+    )
+
+    LLM_CACHE_PERSIST: bool = Field(
+        default=False,
+        description="Also keep cached LLM responses on disk so they survive restarts",
+    )
+
+    LLM_RATE_LIMIT: bool = Field(
+        default=False,
+        description="Throttle LLM requests client-side to stay under provider RPM/TPM limits",
+    )
+
+    LLM_RPM_LIMIT: int | None = Field(
+        default=None, description="Requests per minute (overrides the provider default)", gt=0
+    )
+
+    LLM_TPM_LIMIT: int | None = Field(
+        default=None, description="Tokens per minute (overrides the provider default)", gt=0
+    )
+
     # Custom LLM Endpoint (optional) - for self-hosted/local LLMs
     CUSTOM_LLM_BASE_URL: str | None = Field(
         default=None,
@@ -105,6 +134,17 @@ class Settings(BaseSettings):
         ),
     )
 
+    # Search source configuration
+    SEARCH_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Keep slow-changing search results on disk and reuse them across runs",
+    )
+
+    SEARCH_CACHE_DIR: str = Field(
+        default="~/.cache/agentic-blogger/search",
+        description="Directory holding the on-disk search result cache",
+    )
+
     @field_validator("LOG_LEVEL")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -143,6 +183,14 @@ class Settings(BaseSettings):
             )
         return self.LLM_API_KEY.get_secret_value()
 
+    def get_llm_key_pool(self) -> list[str]:
+        """Get the LLM API key pool values.
+
+        Returns:
+            list[str]: Configured pool keys (empty when no pool is set)
+        """
+        return [key.get_secret_value() for key in self.LLM_KEY_POOL]
+
     def get_custom_llm_api_key(self) -> str | None:
         """Get the custom LLM API key value if set.
 
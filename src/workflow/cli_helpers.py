@@ -4,8 +4,41 @@ This module provides utilities for displaying information and collecting user in
 during workflow execution. Used by interrupt nodes to pause and gather decisions.
 """
 
+import sys
 from typing import Literal, Optional
 
+# Panel borders, built once instead of on every display call
+_SEPARATOR = "=" * 70
+_DIVIDER = "-" * 70
+
+# Answers accepted as "yes" at a confirmation prompt
+_YES = frozenset({"yes", "y"})
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """Cut text to max_length characters, marking the cut with an ellipsis."""
+    return text if len(text) <= max_length else text[:max_length] + "…"
+
+
+def _ask(prompt: str) -> str:
+    """Read a one-word answer from stdin without input()'s line-editing setup.
+
+    Used for yes/no confirmations; prompts that take free text keep input().
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of lines to stdout with a single write and flush.
+
+    Display panels are built up front and emitted at once, rather than with
+    one print() (and one lock round trip and syscall on a TTY) per line.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
 def display_topics_for_selection(scored_topics: list[dict]) -> None:
     """Display scored topics in a formatted list for user selection.
@@ -23,22 +56,24 @@ def display_topics_for_selection(scored_topics: list[dict]) -> None:
         print("\n⚠️  No topics available for selection")
         return
 
-    print("\n" + "=" * 70)
-    print("📊 AVAILABLE TOPICS (sorted by relevance)")
-    print("=" * 70)
+    lines = [
+        "",
+        _SEPARATOR,
+        "📊 AVAILABLE TOPICS (sorted by relevance)",
+        _SEPARATOR,
+    ]
 
     for idx, topic_data in enumerate(scored_topics, start=1):
         topic = topic_data.get("topic", "Unknown")
         score = topic_data.get("score", 0.0)
         reasoning = topic_data.get("reasoning", "")
 
-        print(f"\n{idx}. [Score: {score:.1f}] {topic}")
+        lines.append(f"\n{idx}. [Score: {score:.1f}] {topic}")
         if reasoning:
-            # Truncate long reasoning
-            short_reasoning = reasoning[:100] + "..." if len(reasoning) > 100 else reasoning
-            print(f"   💡 {short_reasoning}")
+            lines.append(f"   💡 {_truncate(reasoning, 100)}")
 
-    print("\n" + "=" * 70)
+    lines += ["", _SEPARATOR]
+    _write_lines(lines)
 
 
 def prompt_user_topic_selection(num_topics: int) -> int:
@@ -51,7 +86,7 @@ def prompt_user_topic_selection(num_topics: int) -> int:
         Selected topic index (1-based)
 
     Raises:
-        ValueError: If user input is invalid
+        KeyboardInterrupt: If user cancels
     """
     while True:
         try:
@@ -61,6 +96,11 @@ def prompt_user_topic_selection(num_topics: int) -> int:
                 print("❌ Please enter a number")
                 continue
 
+            # Reject non-numeric input up front instead of via int()'s ValueError
+            if not choice.isdecimal():
+                print("❌ Please enter a valid number")
+                continue
+
             choice_num = int(choice)
 
             if 1 <= choice_num <= num_topics:
@@ -68,8 +108,6 @@ def prompt_user_topic_selection(num_topics: int) -> int:
 
             print(f"❌ Please enter a number between 1 and {num_topics}")
 
-        except ValueError:
-            print("❌ Please enter a valid number")
         except KeyboardInterrupt:
             print("\n\n⚠️  Selection cancelled")
             raise
@@ -91,41 +129,48 @@ def display_article_for_review(reviewed_article: dict) -> None:
 
         [Article content preview...]
     """
-    print("\n" + "=" * 70)
-    print("📄 ARTICLE REVIEW")
-    print("=" * 70)
+    lines = [
+        "",
+        _SEPARATOR,
+        "📄 ARTICLE REVIEW",
+        _SEPARATOR,
+    ]
 
     # Display metadata
     seo_title = reviewed_article.get("seo_title", "No title")
     seo_subtitle = reviewed_article.get("seo_subtitle", "No subtitle")
-    tags = reviewed_article.get("tags", [])
+    tags = reviewed_article.get("tags") or ()
     word_count = reviewed_article.get("word_count", 0)
     readability_score = reviewed_article.get("readability_score", 0.0)
 
-    print(f"\n📌 Title: {seo_title}")
-    print(f"📝 Subtitle: {seo_subtitle}")
-    print(f"🏷️  Tags: {', '.join(tags)}")
-    print(f"📊 Word Count: {word_count}")
-    print(f"📈 Readability Score: {readability_score:.1f}")
+    lines += [
+        f"\n📌 Title: {seo_title}",
+        f"📝 Subtitle: {seo_subtitle}",
+        f"🏷️  Tags: {', '.join(tags) if tags else '(none)'}",
+        f"📊 Word Count: {word_count}",
+        f"📈 Readability Score: {readability_score:.1f}",
+    ]
 
     # Display article content (truncated)
-    polished_content = reviewed_article.get("polished_content", "")
+    polished_content = reviewed_article.get("polished_content") or ""
     if polished_content:
         preview_length = 500
-        content_preview = polished_content[:preview_length]
-        if len(polished_content) > preview_length:
-            content_preview += "..."
+        content_length = len(polished_content)
 
-        print("\n" + "-" * 70)
-        print("CONTENT PREVIEW:")
-        print("-" * 70)
-        print(content_preview)
-        print("-" * 70)
+        lines += [
+            "",
+            _DIVIDER,
+            "CONTENT PREVIEW:",
+            _DIVIDER,
+            _truncate(polished_content, preview_length),
+            _DIVIDER,
+        ]
 
-        if len(polished_content) > preview_length:
-            print(f"\n(Showing first {preview_length} characters of {len(polished_content)} total)")
+        if content_length > preview_length:
+            lines.append(f"\n(Showing first {preview_length} characters of {content_length} total)")
 
-    print("\n" + "=" * 70)
+    lines += ["", _SEPARATOR]
+    _write_lines(lines)
 
 
 def prompt_user_approval() -> tuple[Literal["approve", "revise"], Optional[str]]:
@@ -139,21 +184,26 @@ def prompt_user_approval() -> tuple[Literal["approve", "revise"], Optional[str]]
     Raises:
         KeyboardInterrupt: If user cancels
     """
-    print("\n" + "=" * 70)
-    print("🔍 ARTICLE APPROVAL")
-    print("=" * 70)
-    print("\nOptions:")
-    print("  1. Approve - Proceed to publish")
-    print("  2. Revise - Request changes with feedback")
-    print("=" * 70)
+    _write_lines(
+        [
+            "",
+            _SEPARATOR,
+            "🔍 ARTICLE APPROVAL",
+            _SEPARATOR,
+            "\nOptions:",
+            "  1. Approve - Proceed to publish",
+            "  2. Revise - Request changes with feedback",
+            _SEPARATOR,
+        ]
+    )
 
     while True:
         try:
             choice = input("\n👉 Enter your choice (1 or 2): ").strip()
 
             if choice == "1":
-                confirm = input("\n✅ Confirm approval? (yes/no): ").strip().lower()
-                if confirm in ("yes", "y"):
+                confirm = _ask("\n✅ Confirm approval? (yes/no): ").lower()
+                if confirm in _YES:
                     print("\n✅ Article approved for publication!")
                     return "approve", None
                 print("❌ Approval cancelled")
@@ -168,8 +218,8 @@ def prompt_user_approval() -> tuple[Literal["approve", "revise"], Optional[str]]
                     print("❌ Feedback cannot be empty")
                     continue
 
-                confirm = input("\n✅ Confirm revision request? (yes/no): ").strip().lower()
-                if confirm in ("yes", "y"):
+                confirm = _ask("\n✅ Confirm revision request? (yes/no): ").lower()
+                if confirm in _YES:
                     print("\n✅ Revision requested!")
                     return "revise", feedback
                 print("❌ Revision cancelled")
@@ -189,11 +239,7 @@ def display_error(message: str) -> None:
     Args:
         message: Error message to display
     """
-    print("\n" + "=" * 70)
-    print("❌ ERROR")
-    print("=" * 70)
-    print(f"\n{message}")
-    print("\n" + "=" * 70)
+    _write_lines(["", _SEPARATOR, "❌ ERROR", _SEPARATOR, "", message, "", _SEPARATOR])
 
 
 def display_info(message: str) -> None:
@@ -202,11 +248,7 @@ def display_info(message: str) -> None:
     Args:
         message: Info message to display
     """
-    print("\n" + "=" * 70)
-    print("ℹ️  INFO")
-    print("=" * 70)
-    print(f"\n{message}")
-    print("\n" + "=" * 70)
+    _write_lines(["", _SEPARATOR, "ℹ️  INFO", _SEPARATOR, "", message, "", _SEPARATOR])
 
 
 def display_success(message: str) -> None:
@@ -215,8 +257,4 @@ def display_success(message: str) -> None:
     Args:
         message: Success message to display
     """
-    print("\n" + "=" * 70)
-    print("✅ SUCCESS")
-    print("=" * 70)
-    print(f"\n{message}")
-    print("\n" + "=" * 70)
+    _write_lines(["", _SEPARATOR, "✅ SUCCESS", _SEPARATOR, "", message, "", _SEPARATOR])
@@ -146,30 +146,32 @@ def retry_with_backoff(
     """
 
     def decorator(func: Callable) -> Callable:
+        # Delay before each retry, computed once per decorated function
+        delays = tuple(initial_delay * backoff_factor**i for i in range(max_retries))
+        name = func.__name__
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            delay = initial_delay
-            last_exception = None
-
-            for attempt in range(max_retries + 1):
+            for attempt, delay in enumerate(delays, start=1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {e}. "
-                            f"Retrying in {delay}s..."
-                        )
-                        time.sleep(delay)
-                        delay *= backoff_factor
-                    else:
-                        logger.error(
-                            f"All {max_retries} retry attempts failed for {func.__name__}: {e}"
-                        )
-
-            # If we get here, all retries failed
-            raise last_exception
+                    logger.warning(
+                        "Attempt %d/%d failed for %s: %s. Retrying in %ss...",
+                        attempt,
+                        max_retries,
+                        name,
+                        e,
+                        delay,
+                    )
+                    time.sleep(delay)
+
+            # Final attempt; its exception propagates
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                logger.error("All %d retry attempts failed for %s: %s", max_retries, name, e)
+                raise
 
         return wrapper
 
@@ -186,6 +188,8 @@ class ErrorContext:
             ctx.add_info("key", "value")
     """
 
+    __slots__ = ("operation", "workflow_id", "info", "start_ns")
+
     def __init__(self, operation: str, workflow_id: Optional[str] = None):
         """Initialize error context.
 
@@ -195,25 +199,29 @@ class ErrorContext:
         """
         self.operation = operation
         self.workflow_id = workflow_id
-        self.info: dict[str, Any] = {}
-        self.start_time = None
+        # Allocated by the first add_info call; most contexts never add any
+        self.info: Optional[dict[str, Any]] = None
+        self.start_ns: Optional[int] = None
 
     def __enter__(self):
-        """Enter context, recording start time."""
-        self.start_time = time.time()
-        logger.debug(f"Starting operation: {self.operation}")
+        """Enter context, recording start time on the monotonic clock."""
+        self.start_ns = time.monotonic_ns()
+        logger.debug("Starting operation: %s", self.operation)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context, logging duration and any errors."""
-        duration = time.time() - self.start_time if self.start_time else 0
+        duration = (time.monotonic_ns() - self.start_ns) / 1e9 if self.start_ns else 0
 
         if exc_type is None:
-            logger.debug(f"Operation '{self.operation}' completed successfully in {duration:.2f}s")
+            logger.debug("Operation '%s' completed successfully in %.2fs", self.operation, duration)
         else:
             logger.error(
-                f"Operation '{self.operation}' failed after {duration:.2f}s: {exc_val}",
-                extra={"workflow_id": self.workflow_id, "context": self.info},
+                "Operation '%s' failed after %.2fs: %s",
+                self.operation,
+                duration,
+                exc_val,
+                extra={"workflow_id": self.workflow_id, "context": self.info or {}},
             )
 
         # Don't suppress the exception
@@ -226,6 +234,8 @@ class ErrorContext:
             key: Information key
             value: Information value
         """
+        if self.info is None:
+            self.info = {}
         self.info[key] = value
 
 
@@ -282,7 +292,7 @@ class FallbackRecovery(RecoveryStrategy):
         Returns:
             Configured fallback value
         """
-        logger.info(f"Using fallback recovery for error: {error}")
+        logger.info("Using fallback recovery for error: %s", error)
         return self.fallback_value
 
 
@@ -298,6 +308,8 @@ class RetryRecovery(RecoveryStrategy):
         """
         self.max_attempts = max_attempts
         self.delay = delay
+        # Linearly increasing delay before each attempt
+        self._schedule = tuple(delay * (i + 1) for i in range(max_attempts))
 
     def can_recover(self, error: Exception) -> bool:
         """Check if error is recoverable (not UnrecoverableError)."""
@@ -314,23 +326,27 @@ class RetryRecovery(RecoveryStrategy):
             Result of successful retry
 
         Raises:
+            UnrecoverableError: As soon as an attempt raises one
             Exception: If all retry attempts fail
         """
         operation = context.get("operation")
         if not operation or not callable(operation):
             raise ValueError("Recovery context must contain 'operation' callable")
 
-        logger.info(f"Attempting retry recovery for error: {error}")
+        logger.info("Attempting retry recovery for error: %s", error)
 
-        for attempt in range(self.max_attempts):
+        for attempt, pause in enumerate(self._schedule, start=1):
+            time.sleep(pause)
             try:
-                time.sleep(self.delay * (attempt + 1))  # Increasing delay
                 return operation()
+            except UnrecoverableError:
+                # Retrying cannot help; see can_recover
+                raise
             except Exception as e:
-                if attempt == self.max_attempts - 1:
-                    logger.error(f"All {self.max_attempts} retry attempts failed: {e}")
+                if attempt == self.max_attempts:
+                    logger.error("All %d retry attempts failed: %s", self.max_attempts, e)
                     raise
-                logger.warning(f"Retry attempt {attempt + 1} failed: {e}")
+                logger.warning("Retry attempt %d failed: %s", attempt, e)
 
 
 # Error Handler
@@ -360,28 +376,34 @@ def handle_node_error(
         def wrapper(*args, **kwargs):
             # Extract state from args or kwargs
             state = args[0] if len(args) > 0 else kwargs.get("state", {})
+            state_dict = state if isinstance(state, dict) else None
 
             # Get workflow_id from state, kwargs, or fallback to decorator param
-            wf_id = None
-            if isinstance(state, dict):
-                wf_id = state.get("workflow_id")
+            wf_id = state_dict.get("workflow_id") if state_dict is not None else None
             if wf_id is None:
                 wf_id = kwargs.get("workflow_id", workflow_id)
 
+            # Timed inline rather than with ErrorContext: the success path only
+            # needs the start time, and a failure is logged once, below
+            start_ns = time.monotonic_ns()
             try:
-                with ErrorContext(f"{node_name}.execute", wf_id) as ctx:
-                    # Add current step to context if available
-                    if isinstance(state, dict):
-                        ctx.add_info("current_step", state.get("current_step"))
-
-                    result = func(*args, **kwargs)
-                    return result
+                return func(*args, **kwargs)
 
             except Exception as e:
+                duration = (time.monotonic_ns() - start_ns) / 1e9
+                context = (
+                    {"current_step": state_dict.get("current_step")}
+                    if state_dict is not None
+                    else {}
+                )
+                # No exc_info: the traceback travels with the chained
+                # NodeExecutionError to whoever handles it
                 logger.error(
-                    f"Node '{node_name}' failed: {e}",
-                    exc_info=True,
-                    extra={"workflow_id": wf_id, "node": node_name},
+                    "Node '%s' failed after %.2fs: %s",
+                    node_name,
+                    duration,
+                    e,
+                    extra={"workflow_id": wf_id, "node": node_name, "context": context},
                 )
                 # Re-raise as NodeExecutionError for better error tracking
                 raise NodeExecutionError(
@@ -408,12 +430,13 @@ def validate_state_field(
     Raises:
         StateValidationError: If validation fails
     """
-    if field not in state:
+    try:
+        value = state[field]
+    except KeyError:
         raise StateValidationError(
             f"Required field '{field}' missing from state", field=field, workflow_id=workflow_id
-        )
+        ) from None
 
-    value = state[field]
     if not isinstance(value, expected_type):
         raise StateValidationError(
             f"Field '{field}' has type {type(value).__name__}, expected {expected_type.__name__}",
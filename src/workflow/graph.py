@@ -12,25 +12,60 @@ The workflow follows this flow:
 6. revise_article → review_article (loop, max 3 times)
 """
 
+import asyncio
 import logging
-from typing import Literal
+import threading
+from typing import Literal, Optional
 
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph
 
 from src.workflow.graph_state import ArticleWorkflowState
-from src.workflow.nodes.analyze_trends import AnalyzeTrendsNode
-from src.workflow.nodes.plan_structure import PlanStructureNode
-from src.workflow.nodes.publish import PublishNode
-from src.workflow.nodes.research import ResearchNode
-from src.workflow.nodes.review import ReviewNode
-from src.workflow.nodes.revision import RevisionNode
-from src.workflow.nodes.scout_topics import ScoutTopicsNode
-from src.workflow.nodes.user_interaction import UserApprovalNode, UserSelectionNode
-from src.workflow.nodes.write_draft import WriteDraftNode
 
 logger = logging.getLogger(__name__)
 
+# Graph shared by create_default_workflow callers, compiled on first use
+_default_workflow: Optional[StateGraph] = None
+_default_workflow_lock = threading.Lock()
+
+# Text diagram returned by get_workflow_visualization
+_WORKFLOW_VISUALIZATION = """
+    Article Generation Workflow:
+    ============================
+
+    START
+      ↓
+    scout_topics
+      ↓
+    analyze_trends
+      ↓
+    user_selection [INTERRUPT]
+      ↓
+    plan_structure
+      ↓
+    research_sections
+      ↓
+    write_sections
+      ↓
+    review_article
+      ↓
+    user_approval [INTERRUPT]
+      ↓
+      ├─[approve]→ save_article → END
+      │
+      └─[revise]→ revise_article
+                      ↓
+                 review_article (loop back)
+
+    Interrupts:
+    - user_selection: Manual topic selection from analyzed trends
+    - user_approval: Approve article or request revision with feedback
+
+    Revision Loop:
+    - Max revisions: 3 (configured in initial state)
+    - After max: Auto-approves and proceeds to publish
+    """
+
 
 def should_continue_after_approval(
     state: ArticleWorkflowState,
@@ -45,16 +80,14 @@ def should_continue_after_approval(
     Returns:
         "save_article" if approved, "revise_article" if revision requested
     """
-    user_approval = state.get("user_approval", False)
-
-    if user_approval:
-        logger.info(f"[{state.get('workflow_id')}] User approved → routing to save_article")
+    if state.get("user_approval", False):
+        logger.info("[%s] User approved → routing to save_article", state.get("workflow_id"))
         return "save_article"
-    else:
-        logger.info(
-            f"[{state.get('workflow_id')}] User requested revision → routing to revise_article"
-        )
-        return "revise_article"
+
+    logger.info(
+        "[%s] User requested revision → routing to revise_article", state.get("workflow_id")
+    )
+    return "revise_article"
 
 
 def create_workflow_graph(checkpointer=None) -> StateGraph:
@@ -84,6 +117,18 @@ def create_workflow_graph(checkpointer=None) -> StateGraph:
         >>> # Resume with user input
         >>> result = graph.invoke({"selected_topic": "..."}, config)
     """
+    # Node modules pull in the LLM, search and database clients; import them
+    # here so importing this module (e.g. for the visualization) stays cheap
+    from src.workflow.nodes.analyze_trends import AnalyzeTrendsNode
+    from src.workflow.nodes.plan_structure import PlanStructureNode
+    from src.workflow.nodes.publish import PublishNode
+    from src.workflow.nodes.research import ResearchNode
+    from src.workflow.nodes.review import ReviewNode
+    from src.workflow.nodes.revision import RevisionNode
+    from src.workflow.nodes.scout_topics import ScoutTopicsNode
+    from src.workflow.nodes.user_interaction import UserApprovalNode, UserSelectionNode
+    from src.workflow.nodes.write_draft import WriteDraftNode
+
     # Initialize graph with state schema
     workflow = StateGraph(ArticleWorkflowState)
 
@@ -163,50 +208,16 @@ def get_workflow_visualization() -> str:
         Article Generation Workflow:
         ...
     """
-    visualization = """
-    Article Generation Workflow:
-    ============================
-
-    START
-      ↓
-    scout_topics
-      ↓
-    analyze_trends
-      ↓
-    user_selection [INTERRUPT]
-      ↓
-    plan_structure
-      ↓
-    research_sections
-      ↓
-    write_sections
-      ↓
-    review_article
-      ↓
-    user_approval [INTERRUPT]
-      ↓
-      ├─[approve]→ save_article → END
-      │
-      └─[revise]→ revise_article
-                      ↓
-                 review_article (loop back)
-
-    Interrupts:
-    - user_selection: Manual topic selection from analyzed trends
-    - user_approval: Approve article or request revision with feedback
-
-    Revision Loop:
-    - Max revisions: 3 (configured in initial state)
-    - After max: Auto-approves and proceeds to publish
-    """
-    return visualization
+    return _WORKFLOW_VISUALIZATION
 
 
 # Convenience function for quick setup
 def create_default_workflow() -> StateGraph:
     """Create workflow with default configuration (MemorySaver).
 
-    Convenience function for quick setup without configuration.
+    Convenience function for quick setup without configuration. The graph is
+    compiled once and shared by every caller, along with its MemorySaver, so
+    give each run its own thread_id.
 
     Returns:
         Compiled workflow graph with in-memory checkpointing
@@ -216,12 +227,52 @@ def create_default_workflow() -> StateGraph:
         >>> config = {"configurable": {"thread_id": "my-thread"}}
         >>> result = workflow.invoke(initial_state, config)
     """
-    return create_workflow_graph()
+    global _default_workflow
+    if _default_workflow is None:
+        with _default_workflow_lock:
+            if _default_workflow is None:
+                _default_workflow = create_workflow_graph()
+    return _default_workflow
+
+
+def reset_default_workflow() -> None:
+    """Drop the shared default workflow so the next call compiles a new one.
+
+    Useful for testing to clear state between tests.
+    """
+    global _default_workflow
+    with _default_workflow_lock:
+        _default_workflow = None
+
+
+async def shutdown_workflow() -> None:
+    """Release resources the workflow nodes hold open between runs.
+
+    Closes the shared search HTTP client and the persistent LLM response
+    cache. Await this once from the event loop that ran the workflow before
+    the application exits.
+
+    Example:
+        >>> async def main():
+        ...     workflow = create_default_workflow()
+        ...     try:
+        ...         await workflow.ainvoke(initial_state, config)
+        ...     finally:
+        ...         await shutdown_workflow()
+    """
+    # Imported here so importing the graph module stays light (see create_workflow_graph)
+    from src.integrations.llm_cache import close_llm_cache
+    from src.integrations.search.http_client import close_http_client
+
+    await close_http_client()
+    await asyncio.to_thread(close_llm_cache)
 
 
 __all__ = [
     "create_workflow_graph",
     "create_default_workflow",
     "get_workflow_visualization",
+    "reset_default_workflow",
     "should_continue_after_approval",
+    "shutdown_workflow",
 ]
@@ -32,7 +32,7 @@ Example:
 """
 
 from operator import add
-from typing import Annotated, Literal, TypedDict
+from typing import Annotated, Literal, TypedDict, get_args
 
 # Type aliases for clarity
 WorkflowStep = Literal[
@@ -51,7 +51,19 @@ WorkflowStep = Literal[
 ]
 
 
-class ArticleWorkflowState(TypedDict, total=False):
+class _RequiredWorkflowState(TypedDict):
+    """Fields every workflow state must carry; see ArticleWorkflowState."""
+
+    workflow_id: str
+    user_query: str
+    current_step: WorkflowStep
+    revision_count: int
+    max_revisions: int
+    errors: Annotated[list[str], add]  # Accumulates errors
+    retry_count: int
+
+
+class ArticleWorkflowState(_RequiredWorkflowState, total=False):
     """Complete state for article generation workflow.
 
     This TypedDict defines all possible state fields. Fields marked as required
@@ -87,14 +99,7 @@ class ArticleWorkflowState(TypedDict, total=False):
         final_article: Complete final article data
     """
 
-    # Required fields - must be present in initial state
-    workflow_id: str
-    user_query: str
-    current_step: WorkflowStep
-    revision_count: int
-    max_revisions: int
-    errors: Annotated[list[str], add]  # Accumulates errors
-    retry_count: int
+    # Required fields are inherited from _RequiredWorkflowState
 
     # Optional fields - User inputs
     selected_topic: str
@@ -118,6 +123,17 @@ class ArticleWorkflowState(TypedDict, total=False):
     final_article: dict
 
 
+# Fields every state must carry, in declaration order (__required_keys__ is unordered)
+_REQUIRED_FIELDS = tuple(
+    field
+    for field in ArticleWorkflowState.__annotations__
+    if field in ArticleWorkflowState.__required_keys__
+)
+
+# Every WorkflowStep value, for membership checks on arbitrary strings
+_VALID_STEPS = frozenset(get_args(WorkflowStep))
+
+
 # Validation helpers
 
 
@@ -138,17 +154,7 @@ def validate_required_fields(state: dict) -> tuple[bool, list[str]]:
         >>> "current_step" in missing
         True
     """
-    required = {
-        "workflow_id",
-        "user_query",
-        "current_step",
-        "revision_count",
-        "max_revisions",
-        "errors",
-        "retry_count",
-    }
-
-    missing = [field for field in required if field not in state]
+    missing = [field for field in _REQUIRED_FIELDS if field not in state]
     return len(missing) == 0, missing
 
 
@@ -167,21 +173,7 @@ def validate_workflow_step(step: str) -> bool:
         >>> validate_workflow_step("invalid_step")
         False
     """
-    valid_steps = {
-        "scout_topics",
-        "analyze_trends",
-        "get_user_selection",
-        "plan_structure",
-        "research_sections",
-        "write_sections",
-        "review_article",
-        "get_user_approval",
-        "revise_article",
-        "save_article",
-        "completed",
-        "failed",
-    }
-    return step in valid_steps
+    return step in _VALID_STEPS
 
 
 def validate_revision_count(state: dict) -> tuple[bool, str]:
@@ -246,18 +238,21 @@ def create_initial_state(
         >>> state["revision_count"]
         0
     """
-    if not workflow_id or not workflow_id.strip():
+    # Strip once; str.strip() returns the same object when nothing is trimmed
+    workflow_id = workflow_id.strip() if workflow_id else ""
+    if not workflow_id:
         raise ValueError("workflow_id cannot be empty")
 
-    if not user_query or not user_query.strip():
+    user_query = user_query.strip() if user_query else ""
+    if not user_query:
         raise ValueError("user_query cannot be empty")
 
     if max_revisions < 1:
         raise ValueError("max_revisions must be at least 1")
 
     return ArticleWorkflowState(
-        workflow_id=workflow_id.strip(),
-        user_query=user_query.strip(),
+        workflow_id=workflow_id,
+        user_query=user_query,
         current_step="scout_topics",
         revision_count=0,
         max_revisions=max_revisions,
@@ -31,6 +31,8 @@ Example Usage:
 
 import asyncio
 import functools
+import importlib
+import inspect
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -43,6 +45,20 @@ logger = logging.getLogger(__name__)
 # Type variable for decorated functions
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Modules defining the built-in nodes, imported by NodeRegistry.get on first lookup
+_NODE_MODULES = {
+    "scout_topics": "src.workflow.nodes.scout_topics",
+    "analyze_trends": "src.workflow.nodes.analyze_trends",
+    "user_selection": "src.workflow.nodes.user_interaction",
+    "plan_structure": "src.workflow.nodes.plan_structure",
+    "research": "src.workflow.nodes.research",
+    "write_draft": "src.workflow.nodes.write_draft",
+    "review": "src.workflow.nodes.review",
+    "user_approval": "src.workflow.nodes.user_interaction",
+    "revision": "src.workflow.nodes.revision",
+    "publish": "src.workflow.nodes.publish",
+}
+
 
 class BaseNode(ABC):
     """Abstract base class for workflow nodes.
@@ -64,6 +80,8 @@ class BaseNode(ABC):
         ...         return {"current_step": "next_step"}
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def execute(self, state: ArticleWorkflowState) -> dict[str, Any]:
         """Execute node logic and return state updates.
@@ -94,6 +112,25 @@ class BaseNode(ABC):
         pass
 
 
+def _is_method(func: Callable) -> bool:
+    """Whether func takes ``self`` first, i.e. is a node's execute method.
+
+    Decorated wrappers keep ``__wrapped__``, so stacked decorators report the
+    original signature.
+    """
+    return next(iter(inspect.signature(func).parameters), None) == "self"
+
+
+def _error_update(node_name: str, error: Exception) -> dict[str, Any]:
+    """Log a node failure and build the state update that records it."""
+    error_msg = f"Node '{node_name}' failed: {type(error).__name__}: {str(error)}"
+    logger.error(error_msg, exc_info=True)
+    return {
+        "errors": [error_msg],
+        "current_step": "failed",
+    }
+
+
 def handle_node_errors(func: F) -> F:
     """Decorator to handle node execution errors gracefully.
 
@@ -119,35 +156,27 @@ def handle_node_errors(func: F) -> F:
         'failed'
     """
 
-    @functools.wraps(func)
-    async def wrapper(self_or_state, *args, **kwargs) -> dict[str, Any]:
-        # Handle both instance methods (self, state) and functions (state)
-        if isinstance(self_or_state, BaseNode):
-            # Instance method: self_or_state is self, first arg is state
-            state = args[0] if args else kwargs.get("state", {})
-            try:
-                return await func(self_or_state, state, *args[1:], **kwargs)
-            except Exception as e:
-                node_name = self_or_state.name
-                error_msg = f"Node '{node_name}' failed: {type(e).__name__}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                return {
-                    "errors": [error_msg],
-                    "current_step": "failed",
-                }
-        else:
-            # Regular function: self_or_state is state
-            state = self_or_state
+    # Instance methods (self, state) and plain functions (state) get separate
+    # wrappers, chosen once here rather than on every call
+    if _is_method(func):
+
+        @functools.wraps(func)
+        async def method_wrapper(self, state, *args, **kwargs) -> dict[str, Any]:
             try:
-                return await func(state, *args, **kwargs)
+                return await func(self, state, *args, **kwargs)
             except Exception as e:
-                node_name = getattr(func, "__name__", "unknown_node")
-                error_msg = f"Node '{node_name}' failed: {type(e).__name__}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                return {
-                    "errors": [error_msg],
-                    "current_step": "failed",
-                }
+                return _error_update(self.name, e)
+
+        return method_wrapper  # type: ignore
+
+    node_name = getattr(func, "__name__", "unknown_node")
+
+    @functools.wraps(func)
+    async def wrapper(state, *args, **kwargs) -> dict[str, Any]:
+        try:
+            return await func(state, *args, **kwargs)
+        except Exception as e:
+            return _error_update(node_name, e)
 
     return wrapper  # type: ignore
 
@@ -178,49 +207,64 @@ def log_node_execution(func: F) -> F:
         >>> # INFO: [wf-123] Completed node: my_node (0.05s)
     """
 
-    @functools.wraps(func)
-    async def wrapper(self_or_state, *args, **kwargs) -> dict[str, Any]:
-        # Handle both instance methods (self, state) and functions (state)
-        if isinstance(self_or_state, BaseNode):
-            # Instance method: self_or_state is self, first arg is state
-            state = args[0] if args else kwargs.get("state", {})
-            node_name = self_or_state.name
+    # Instance methods (self, state) and plain functions (state) get separate
+    # wrappers, chosen once here rather than on every call
+    if _is_method(func):
+
+        @functools.wraps(func)
+        async def method_wrapper(self, state, *args, **kwargs) -> dict[str, Any]:
+            node_name = self.name
             workflow_id = state.get("workflow_id", "unknown")
 
-            logger.info(f"[{workflow_id}] Starting execution of node: {node_name}")
-            start_time = time.time()
+            logger.info("[%s] Starting execution of node: %s", workflow_id, node_name)
+            start_time = time.perf_counter()
 
             try:
-                result = await func(self_or_state, state, *args[1:], **kwargs)
-                duration = time.time() - start_time
+                result = await func(self, state, *args, **kwargs)
                 logger.info(
-                    f"[{workflow_id}] Completed execution of node: {node_name} ({duration:.2f}s)"
+                    "[%s] Completed execution of node: %s (%.2fs)",
+                    workflow_id,
+                    node_name,
+                    time.perf_counter() - start_time,
                 )
                 return result
             except Exception:
-                duration = time.time() - start_time
                 logger.error(
-                    f"[{workflow_id}] Failed execution of node: {node_name} ({duration:.2f}s)"
+                    "[%s] Failed execution of node: %s (%.2fs)",
+                    workflow_id,
+                    node_name,
+                    time.perf_counter() - start_time,
                 )
                 raise
-        else:
-            # Regular function: self_or_state is state
-            state = self_or_state
-            node_name = getattr(func, "__name__", "unknown_node")
-            workflow_id = state.get("workflow_id", "unknown")
 
-            logger.info(f"[{workflow_id}] Starting node: {node_name}")
-            start_time = time.time()
+        return method_wrapper  # type: ignore
 
-            try:
-                result = await func(state, *args, **kwargs)
-                duration = time.time() - start_time
-                logger.info(f"[{workflow_id}] Completed node: {node_name} ({duration:.2f}s)")
-                return result
-            except Exception:
-                duration = time.time() - start_time
-                logger.error(f"[{workflow_id}] Failed node: {node_name} ({duration:.2f}s)")
-                raise
+    node_name = getattr(func, "__name__", "unknown_node")
+
+    @functools.wraps(func)
+    async def wrapper(state, *args, **kwargs) -> dict[str, Any]:
+        workflow_id = state.get("workflow_id", "unknown")
+
+        logger.info("[%s] Starting node: %s", workflow_id, node_name)
+        start_time = time.perf_counter()
+
+        try:
+            result = await func(state, *args, **kwargs)
+            logger.info(
+                "[%s] Completed node: %s (%.2fs)",
+                workflow_id,
+                node_name,
+                time.perf_counter() - start_time,
+            )
+            return result
+        except Exception:
+            logger.error(
+                "[%s] Failed node: %s (%.2fs)",
+                workflow_id,
+                node_name,
+                time.perf_counter() - start_time,
+            )
+            raise
 
     return wrapper  # type: ignore
 
@@ -262,36 +306,40 @@ def retry_on_error(
     """
 
     def decorator(func: F) -> F:
+        node_name = getattr(func, "__name__", "unknown_node")
+        total_attempts = max_retries + 1
+        # Wait before each retry, computed once per decorated node
+        delays = tuple(backoff_factor**attempt for attempt in range(max_retries))
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            node_name = getattr(func, "__name__", "unknown_node")
-            last_exception = None
-
-            for attempt in range(max_retries + 1):
+            for attempt, wait_time in enumerate(delays, start=1):
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-
-                    if attempt < max_retries:
-                        wait_time = backoff_factor**attempt
-                        logger.warning(
-                            f"Node '{node_name}' failed "
-                            f"(attempt {attempt + 1}/{max_retries + 1}). "
-                            f"Retrying in {wait_time:.1f}s... "
-                            f"Error: {type(e).__name__}: {str(e)}"
-                        )
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logger.error(
-                            f"Node '{node_name}' failed after "
-                            f"{max_retries + 1} attempts. "
-                            f"Final error: {type(e).__name__}: {str(e)}"
-                        )
-
-            # All retries exhausted, re-raise last exception
-            if last_exception:
-                raise last_exception
+                    logger.warning(
+                        "Node '%s' failed (attempt %d/%d). Retrying in %.1fs... Error: %s: %s",
+                        node_name,
+                        attempt,
+                        total_attempts,
+                        wait_time,
+                        type(e).__name__,
+                        e,
+                    )
+                    await asyncio.sleep(wait_time)
+
+            # Final attempt; its exception propagates
+            try:
+                return await func(*args, **kwargs)
+            except exceptions as e:
+                logger.error(
+                    "Node '%s' failed after %d attempts. Final error: %s: %s",
+                    node_name,
+                    total_attempts,
+                    type(e).__name__,
+                    e,
+                )
+                raise
 
         return wrapper  # type: ignore
 
@@ -328,6 +376,9 @@ class NodeRegistry:
     """
 
     _nodes: dict[str, type[BaseNode]] = {}
+    # Built-in node classes registered by their own module; kept across clear()
+    # because a module only runs its @register decorators on first import
+    _builtin_nodes: dict[str, type[BaseNode]] = {}
 
     @classmethod
     def register(cls, name: str) -> Callable[[type[BaseNode]], type[BaseNode]]:
@@ -353,7 +404,9 @@ class NodeRegistry:
                 raise ValueError(f"Node '{name}' is already registered")
 
             cls._nodes[name] = node_class
-            logger.debug(f"Registered node: {name} -> {node_class.__name__}")
+            if node_class.__module__ == _NODE_MODULES.get(name):
+                cls._builtin_nodes[name] = node_class
+            logger.debug("Registered node: %s -> %s", name, node_class.__name__)
             return node_class
 
         return decorator
@@ -362,6 +415,11 @@ class NodeRegistry:
     def get(cls, name: str) -> type[BaseNode]:
         """Get a registered node class by name.
 
+        Built-in nodes are registered when their module is imported, so a
+        lookup of one that is not registered yet imports its module first.
+        A built-in dropped by clear() is registered again from its
+        already-imported class.
+
         Args:
             name: Name of the node to retrieve
 
@@ -375,10 +433,21 @@ class NodeRegistry:
             >>> node_class = NodeRegistry.get("my_node")
             >>> node = node_class()
         """
-        if name not in cls._nodes:
-            available = ", ".join(cls._nodes.keys()) or "none"
-            raise KeyError(f"Node '{name}' not registered. Available nodes: {available}")
-        return cls._nodes[name]
+        try:
+            return cls._nodes[name]
+        except KeyError:
+            pass
+
+        module = _NODE_MODULES.get(name)
+        if module is not None:
+            importlib.import_module(module)
+            node_class = cls._nodes.get(name) or cls._builtin_nodes.get(name)
+            if node_class is not None:
+                cls._nodes[name] = node_class
+                return node_class
+
+        available = ", ".join(cls._nodes) or "none"
+        raise KeyError(f"Node '{name}' not registered. Available nodes: {available}")
 
     @classmethod
     def list_nodes(cls) -> list[str]:
@@ -397,7 +466,8 @@ class NodeRegistry:
     def clear(cls) -> None:
         """Clear all registered nodes.
 
-        Useful for testing to ensure a clean state between tests.
+        Useful for testing to ensure a clean state between tests. Built-in
+        nodes remain available through get(), which registers them again.
 
         Example:
             >>> NodeRegistry.clear()
@@ -6,7 +6,8 @@ scoring and ranking topics to select the most valuable one for article generatio
 Node Behavior:
 - Input: scouted_topics from state
 - Process: Score topics using heuristic analysis, select best
-- Output: analyzed_trends (all scored topics), selected_topic
+- Output: selected_topic (plus analyzed_trends, all scored topics, when the
+  node is built with include_full_ranking=True)
 - Next Step: plan_structure
 
 Error Handling:
@@ -39,6 +40,10 @@ class AnalyzeTrendsNode(BaseNode):
     - Specificity bonuses (concrete terms)
     - Generic penalties (beginner phrases)
 
+    Only the best topic is needed downstream, so by default the analyzer is
+    asked for the top result alone and the ranking is left out of the state
+    update. Pass include_full_ranking=True to also return every scored topic.
+
     The node is stateless and thread-safe - all state is passed via the
     ArticleWorkflowState parameter.
 
@@ -55,6 +60,17 @@ class AnalyzeTrendsNode(BaseNode):
         'plan_structure'
     """
 
+    __slots__ = ("_include_full_ranking",)
+
+    def __init__(self, *, include_full_ranking: bool = False) -> None:
+        """Initialize the node.
+
+        Args:
+            include_full_ranking: Return every scored topic as analyzed_trends
+                instead of only selecting the best one (default: False)
+        """
+        self._include_full_ranking = include_full_ranking
+
     @property
     def name(self) -> str:
         """Return the node's unique identifier.
@@ -77,8 +93,9 @@ class AnalyzeTrendsNode(BaseNode):
         """Analyze scouted topics and select the best one.
 
         Scores all topics using deterministic heuristics and selects the
-        highest-scoring topic for article generation. Returns both the
-        full analysis and the selected topic.
+        highest-scoring topic for article generation. The full ranking is
+        only built and returned when the node was created with
+        include_full_ranking=True.
 
         Args:
             state: Current workflow state containing:
@@ -89,7 +106,8 @@ class AnalyzeTrendsNode(BaseNode):
             State updates dict containing either:
 
             Success case:
-                - analyzed_trends: List of ScoredTopic objects (all topics ranked)
+                - analyzed_trends: List of ScoredTopic objects (all topics
+                  ranked; only with include_full_ranking=True)
                 - selected_topic: The highest-scoring topic string
                 - current_step: "plan_structure" (next workflow step)
 
@@ -116,7 +134,8 @@ class AnalyzeTrendsNode(BaseNode):
                     "current_step": "analyze_trends"
                 }
 
-            Output:
+            Output (include_full_ranking=True; otherwise analyzed_trends is
+            omitted):
                 {
                     "analyzed_trends": [
                         ScoredTopic(topic="Advanced Python Performance...", score=0.95),
@@ -143,18 +162,26 @@ class AnalyzeTrendsNode(BaseNode):
                 "current_step": "failed",
             }
 
+        # A single usable topic is the winner; scoring it cannot change that.
+        # Blank topics fall through so the analyzer's filtering still applies.
+        if not self._include_full_ranking and len(scouted_topics) == 1:
+            topic = scouted_topics[0]
+            if topic and topic.strip():
+                return {"selected_topic": topic, "current_step": "plan_structure"}
+
         # Analyze topics using TrendAnalyzerAgent
         # This is a pure function call with no side effects
-        # Returns list of ScoredTopic objects sorted by descending score
-        analyzed = analyze_trends(topics=scouted_topics, max_topics=len(scouted_topics))
+        # Returns list of ScoredTopic objects sorted by descending score; when
+        # only the winner is needed, ask for one so the analyzer skips the sort
+        max_topics = len(scouted_topics) if self._include_full_ranking else 1
+        analyzed = analyze_trends(topics=scouted_topics, max_topics=max_topics)
 
         # Select the best topic (first in sorted list)
         # analyze_trends guarantees at least one result if input is non-empty
-        selected = analyzed[0].topic
-
-        # Return state updates
-        return {
-            "analyzed_trends": analyzed,
-            "selected_topic": selected,
+        updates = {
+            "selected_topic": analyzed[0].topic,
             "current_step": "plan_structure",
         }
+        if self._include_full_ranking:
+            updates["analyzed_trends"] = analyzed
+        return updates
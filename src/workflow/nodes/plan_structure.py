@@ -11,6 +11,8 @@ from src.workflow.nodes import BaseNode, NodeRegistry, handle_node_errors, log_n
 class PlanStructureNode(BaseNode):
     """Workflow node that generates article outline from selected topic."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node identifier."""
@@ -30,8 +32,9 @@ class PlanStructureNode(BaseNode):
                 - article_outline: Generated outline structure
                 - current_step: Transition to "research"
         """
-        # Extract selected topic
-        selected_topic = state.get("selected_topic", "").strip()
+        # Extract selected topic; strip() returns the same string when it is
+        # already clean, and None is treated like a missing topic
+        selected_topic = (state.get("selected_topic") or "").strip()
 
         # Validate input
         if not selected_topic:
@@ -13,6 +13,8 @@ from src.workflow.nodes import BaseNode, NodeRegistry, handle_node_errors, log_n
 class PublishNode(BaseNode):
     """Workflow node that persists reviewed article to database."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node identifier."""
@@ -3,14 +3,22 @@
 Integrates ResearcherAgent into the LangGraph workflow.
 """
 
-from src.agents.researcher import research_section
+import asyncio
+
+from src.agents.researcher import ResearchDossier, research_section
+from src.agents.structure_planner import Section
 from src.workflow.nodes import BaseNode, NodeRegistry, handle_node_errors, log_node_execution
 
+# Sections researched at once; each one fans out to several search APIs and the LLM
+_MAX_CONCURRENT_SECTIONS = 4
+
 
 @NodeRegistry.register("research")
 class ResearchNode(BaseNode):
     """Workflow node that conducts research for all article sections."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node identifier."""
@@ -41,11 +49,21 @@ class ResearchNode(BaseNode):
         if not hasattr(outline, "sections") or not outline.sections:
             raise ValueError("article_outline must have sections")
 
-        # Research each section
-        research_data = []
-        for section in outline.sections:
-            dossier = await research_section(outline, section)
-            research_data.append(dossier)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SECTIONS)
+
+        async def research(section: Section) -> ResearchDossier:
+            async with semaphore:
+                return await research_section(outline, section)
+
+        # Research sections concurrently; gather keeps results in outline order.
+        # If one fails, cancel the rest so they stop spending API quota.
+        tasks = [asyncio.ensure_future(research(section)) for section in outline.sections]
+        try:
+            research_data = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         # Return state updates
         return {
@@ -11,6 +11,8 @@ from src.workflow.nodes import BaseNode, NodeRegistry, handle_node_errors, log_n
 class ReviewNode(BaseNode):
     """Workflow node that reviews and optimizes article draft."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node identifier."""
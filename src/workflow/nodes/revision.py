@@ -11,6 +11,8 @@ from src.workflow.nodes import BaseNode, NodeRegistry, handle_node_errors, log_n
 class RevisionNode(BaseNode):
     """Workflow node that applies user feedback to revise article."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node identifier."""
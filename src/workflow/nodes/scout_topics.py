@@ -46,6 +46,8 @@ class ScoutTopicsNode(BaseNode):
         'analyze_trends'
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return the node's unique identifier.
@@ -58,6 +58,8 @@ class UserSelectionNode(BaseNode):
         >>> # Workflow pauses here until user responds
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node name."""
@@ -170,6 +172,8 @@ class UserApprovalNode(BaseNode):
         >>> # Workflow pauses here until user responds
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node name."""
@@ -3,14 +3,22 @@
 Integrates WriterAgent into the LangGraph workflow.
 """
 
-from src.agents.writer import write_section
+import asyncio
+
+from src.agents.structure_planner import Section
+from src.agents.writer import WrittenSection, write_section
 from src.workflow.nodes import BaseNode, NodeRegistry, handle_node_errors, log_node_execution
 
+# Sections drafted at once, keeping the burst of LLM requests within provider rate limits
+_MAX_CONCURRENT_SECTIONS = 4
+
 
 @NodeRegistry.register("write_draft")
 class WriteDraftNode(BaseNode):
     """Workflow node that generates article draft from outline and research."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Return node identifier."""
@@ -52,11 +60,21 @@ class WriteDraftNode(BaseNode):
                 f"sections length ({len(outline.sections)})"
             )
 
-        # Write each section
-        draft_sections = []
-        for section in outline.sections:
-            written = await write_section(outline, section, target_words=500)
-            draft_sections.append(written)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SECTIONS)
+
+        async def write(section: Section) -> WrittenSection:
+            async with semaphore:
+                return await write_section(outline, section, target_words=500)
+
+        # Write sections concurrently; gather keeps results in outline order.
+        # If one fails, cancel the rest so they stop spending API quota.
+        tasks = [asyncio.ensure_future(write(section)) for section in outline.sections]
+        try:
+            draft_sections = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         # Combine all sections into full article
         combined_parts = [f"# {outline.topic}\n"]
@@ -1,10 +1,14 @@
 """Pytest configuration for LLM tests."""
 
+import os
 import shutil
 from pathlib import Path
 
 import pytest
 
+# Use LiteLLM's bundled model cost map instead of fetching it on (lazy) import
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
 # Import all node modules to trigger registration
 # This must happen at module level before any tests run
 from src.workflow.nodes import (  # noqa: F401
@@ -36,3 +40,27 @@ def backup_env_file():
     # Restore
     if backup_file.exists():
         shutil.move(backup_file, env_file)
+
+
+@pytest.fixture(autouse=True)
+def isolated_search_cache(tmp_path, monkeypatch):
+    """Give each test an empty on-disk search cache."""
+    from src.integrations.search import cache
+
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path / "search-cache")
+    monkeypatch.setattr(cache, "_enabled", True)
+    monkeypatch.setattr(cache, "_cache", None)
+    yield
+    if cache._cache is not None:
+        cache._cache.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Point the persistent LLM response cache at a per-test database."""
+    from src.integrations import llm_cache
+
+    llm_cache.close_llm_cache()
+    monkeypatch.setattr(llm_cache, "_CACHE_PATH", tmp_path / "llm-cache" / "llm.db")
+    yield
+    llm_cache.close_llm_cache()
@@ -12,14 +12,17 @@ Tests cover:
 import pytest
 
 from src.agents.researcher import (
+    _CODE_TOKEN_BUDGET,
     ResearchDossier,
     _build_citations,
+    _build_synthesis_prompt,
     _extract_language_from_topic,
     _should_search_code,
     _should_search_papers,
     research_section,
 )
 from src.agents.structure_planner import Section, generate_outline
+from src.integrations.llm_client import truncate_to_tokens
 
 
 class TestHelperFunctions:
@@ -109,6 +112,20 @@ class TestHelperFunctions:
         # Should only include top 5 web results
         assert len(citations) == 5
 
+    def test_synthesis_prompt_truncates_oversized_sources(self):
+        """Each source is cut to its token budget, keeping the top-ranked items."""
+        code_examples = [
+            {"name": "top/repo", "description": "word " * 5000},
+            {"name": "tail/repo", "description": "never reached"},
+        ]
+
+        prompt = _build_synthesis_prompt("Python", "Intro", [], [], code_examples)
+
+        assert "Repository: top/repo" in prompt
+        assert "tail/repo" not in prompt
+        assert len(prompt) < len("word " * 5000)
+        assert truncate_to_tokens(prompt, _CODE_TOKEN_BUDGET * 2) == prompt
+
 
 class TestResearchSection:
     """Tests for the main research_section function."""
@@ -173,6 +173,14 @@ class TestMaxTopics:
 
         assert len(results) == 1
 
+    def test_top_n_matches_full_ranking_prefix(self):
+        """Test that a partial selection equals the head of the full ranking."""
+        topics = ["Python Guide", "Java Guide", "Rust Guide", "Go", "Intro to Python"]
+        full = analyze_trends(topics, max_topics=len(topics))
+
+        for max_val in range(1, len(topics)):
+            assert analyze_trends(topics, max_topics=max_val) == full[:max_val]
+
 
 class TestEmptyAndSmallInputs:
     """Test edge cases with empty and small inputs."""
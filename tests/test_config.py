@@ -112,6 +112,17 @@ class TestSettings:
         assert settings.get_api_key() == "my-api-key"
         assert settings.get_secret_key() == "my-secret"
 
+    def test_llm_key_pool_parsed_from_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that LLM_KEY_POOL is read as a JSON list of masked keys."""
+        monkeypatch.setenv("APP_NAME", "test-app")
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        monkeypatch.setenv("LLM_KEY_POOL", '["key-a", "key-b"]')
+
+        settings = Settings()
+
+        assert settings.get_llm_key_pool() == ["key-a", "key-b"]
+        assert "key-a" not in repr(settings)
+
     def test_environment_validation(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that ENVIRONMENT field only accepts valid values."""
         monkeypatch.setenv("APP_NAME", "test-app")
@@ -63,6 +63,21 @@ class TestDatabaseInitialization:
             assert kwargs["pool_timeout"] == 30
             assert kwargs["pool_pre_ping"] is True
 
+    def test_init_db_uses_orjson_for_jsonb(self):
+        """Test that init_db configures orjson-backed JSON (de)serialization."""
+        with patch("src.database.db.create_engine") as mock_create_engine:
+            init_db()
+
+            _, kwargs = mock_create_engine.call_args
+            serialize = kwargs["json_serializer"]
+            deserialize = kwargs["json_deserializer"]
+
+            payload = {"messages": [{"body": "Hello 世界"}], 1: None}
+            encoded = serialize(payload)
+
+            assert isinstance(encoded, str)
+            assert deserialize(encoded) == {"messages": [{"body": "Hello 世界"}], "1": None}
+
     def test_init_db_raises_error_without_database_url(self, monkeypatch, tmp_path):
         """Test that init_db raises error when DATABASE_URL is not set."""
         monkeypatch.delenv("DATABASE_URL", raising=False)
@@ -133,6 +148,46 @@ class TestSessionManagement:
                 mock_session.commit.assert_called_once()
                 mock_session.close.assert_called_once()
 
+    def test_get_session_retries_transient_connection_errors(self):
+        """Test that connection acquisition is retried before the session is yielded."""
+        with patch("src.database.db.create_engine"):
+            init_db()
+
+            with patch("src.database.db._session_factory") as mock_factory:
+                mock_session = MagicMock()
+                mock_session.connection.side_effect = [
+                    exc.OperationalError("statement", {}, Exception("connection refused")),
+                    None,
+                ]
+                mock_factory.return_value = mock_session
+
+                with patch("src.database.db.time.sleep"):
+                    with get_session() as session:
+                        assert session is mock_session
+
+                assert mock_session.connection.call_count == 2
+                mock_session.commit.assert_called_once()
+                mock_session.close.assert_called_once()
+
+    def test_get_session_does_not_retry_body_errors(self):
+        """Test that errors raised inside the with-block are not replayed."""
+        with patch("src.database.db.create_engine"):
+            init_db()
+
+            with patch("src.database.db._session_factory") as mock_factory:
+                mock_session = MagicMock()
+                mock_factory.return_value = mock_session
+                body_calls = 0
+
+                with pytest.raises(exc.OperationalError):
+                    with get_session():
+                        body_calls += 1
+                        raise exc.OperationalError("statement", {}, Exception("connection lost"))
+
+                assert body_calls == 1
+                assert mock_factory.call_count == 1
+                mock_session.commit.assert_not_called()
+
     def test_get_session_rolls_back_on_error(self):
         """Test that session rolls back on error."""
         with patch("src.database.db.create_engine"):
@@ -342,6 +397,19 @@ class TestDatabaseCleanup:
             with pytest.raises(DatabaseError):
                 get_engine()
 
+    def test_close_db_clears_engine_kwargs_cache(self, monkeypatch):
+        """Test that settings changes are picked up after close_db."""
+        with patch("src.database.db.create_engine") as mock_create_engine:
+            init_db()
+            assert mock_create_engine.call_args.kwargs["pool_size"] == 5
+
+            close_db()
+            monkeypatch.setenv("DB_POOL_SIZE", "12")
+            reset_settings()
+
+            init_db()
+            assert mock_create_engine.call_args.kwargs["pool_size"] == 12
+
     def test_close_db_handles_uninitialized_state(self):
         """Test that close_db handles being called without initialization."""
         # Should not raise an error
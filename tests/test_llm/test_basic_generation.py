@@ -1,10 +1,18 @@
 """Tests for LLM client basic text generation."""
 
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.integrations.llm_client import LLMRetryExhausted, generate_text
+from src.integrations import llm_client
+from src.integrations.llm_client import (
+    LLMRetryExhausted,
+    clear_response_cache,
+    generate_text,
+    truncate_to_tokens,
+)
 from src.utils.config import reset_settings
 
 
@@ -75,6 +83,17 @@ class TestBasicGeneration:
             assert result == "Generated text from LLM"
             mock_completion.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_prompt_whitespace_canonicalized(self, env_vars_gemini, mock_litellm_response):
+        """Test that trailing whitespace is stripped before the prompt is sent."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("\nInstructions:   \n  keep indent\t\n\n")
+
+            messages = mock_completion.call_args.kwargs["messages"]
+            assert messages[0]["content"] == "Instructions:\n  keep indent"
+
     @pytest.mark.asyncio
     async def test_provider_switching_via_env_gemini(self, env_vars_gemini, mock_litellm_response):
         """Test Gemini provider selection from environment."""
@@ -120,6 +139,27 @@ class TestBasicGeneration:
             # Should be called 3 times (2 failures + 1 success)
             assert mock_completion.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_litellm_retries_disabled(self, env_vars_gemini, mock_litellm_response):
+        """Test that LiteLLM/SDK retries are off so only our loop retries."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+
+            call_kwargs = mock_completion.call_args.kwargs
+            assert call_kwargs["num_retries"] == 0
+            assert call_kwargs["max_retries"] == 0
+
+    def test_import_does_not_load_litellm(self):
+        """Test that importing the client defers the (slow) LiteLLM import."""
+        code = "import sys, src.integrations.llm_client; print('litellm' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
     @pytest.mark.asyncio
     async def test_raises_exception_after_max_retries(self, env_vars_gemini):
         """Test that LLMRetryExhausted is raised after all retries fail."""
@@ -134,6 +174,23 @@ class TestBasicGeneration:
             # Should be called 4 times (1 initial + 3 retries)
             assert mock_completion.call_count == 4
 
+    @pytest.mark.asyncio
+    async def test_no_delay_computed_after_final_attempt(self, env_vars_gemini):
+        """Test that the last failed attempt raises without sleeping or computing a delay."""
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion,
+            patch.object(llm_client, "_backoff_delay", return_value=0) as mock_backoff,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_completion.side_effect = ConnectionError("Network error")
+
+            with pytest.raises(LLMRetryExhausted):
+                await generate_text("Test prompt")
+
+            assert mock_completion.call_count == 4
+            assert mock_backoff.call_count == 3
+            assert mock_sleep.await_count == 3
+
     @pytest.mark.asyncio
     async def test_uses_custom_model_when_provided(self, env_vars_gemini, mock_litellm_response):
         """Test model override parameter."""
@@ -190,7 +247,7 @@ class TestBasicGeneration:
 
     @pytest.mark.asyncio
     async def test_exponential_backoff(self, env_vars_gemini, mock_litellm_response):
-        """Test that retry delays follow exponential backoff."""
+        """Test that retry delays follow jittered exponential backoff."""
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
             with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
                 # Fail twice, succeed on third
@@ -202,11 +259,21 @@ class TestBasicGeneration:
 
                 await generate_text("Test prompt")
 
-                # Verify exponential backoff: 0.1 * (2^0), 0.1 * (2^1)
+                # Verify jittered backoff: uniform(0.1, 0.1 * 3 * 2^attempt)
                 assert mock_sleep.call_count == 2
                 delays = [call.args[0] for call in mock_sleep.call_args_list]
-                assert delays[0] == 0.1  # 0.1 * (2^0)
-                assert delays[1] == 0.2  # 0.1 * (2^1)
+                assert 0.1 <= delays[0] <= 0.3
+                assert 0.1 <= delays[1] <= 0.6
+
+    def test_backoff_delay_window_grows_and_is_capped(self):
+        """Test the jitter window doubles per attempt and never exceeds the cap."""
+        with patch("src.integrations.llm_client.random.uniform", side_effect=lambda a, b: b):
+            assert llm_client._backoff_delay(0, 0.1) == pytest.approx(0.3)
+            assert llm_client._backoff_delay(1, 0.1) == pytest.approx(0.6)
+            assert llm_client._backoff_delay(20, 1.0) == llm_client._MAX_RETRY_DELAY
+
+        with patch("src.integrations.llm_client.random.uniform", side_effect=lambda a, b: a):
+            assert llm_client._backoff_delay(5, 0.1) == 0.1
 
     @pytest.mark.asyncio
     async def test_rate_limit_error_is_retryable(self, env_vars_gemini, mock_litellm_response):
@@ -406,3 +473,377 @@ class TestCustomEndpoint:
             call_kwargs = mock_completion.call_args.kwargs
             assert call_kwargs["model"] == "default-model"
             assert call_kwargs["base_url"] == "http://localhost:11434/v1"
+
+
+class TestResponseCache:
+    """Test the generate_text response cache."""
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self):
+        """Start and finish each test with an empty cache."""
+        clear_response_cache()
+        yield
+        clear_response_cache()
+
+    @pytest.fixture
+    def env_cache_enabled(self, env_vars_gemini, monkeypatch):
+        """Enable the response cache on top of the Gemini environment."""
+        monkeypatch.setenv("LLM_CACHE_TTL", "60")
+        reset_settings()
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, env_vars_gemini, mock_litellm_response):
+        """Test that identical calls hit the provider when caching is off."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+            await generate_text("Test prompt")
+
+            assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache(
+        self, env_cache_enabled, mock_litellm_response
+    ):
+        """Test that a repeated (model, temperature, prompt) request is cached."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            first = await generate_text("Test prompt")
+            second = await generate_text("Test prompt")
+
+            assert first == second == "Generated text from LLM"
+            mock_completion.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_whitespace_variants_share_cache_entry(
+        self, env_cache_enabled, mock_litellm_response
+    ):
+        """Test that prompts differing only in outer or trailing whitespace hit the same entry."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("\nSummarize:   \n  the topic\n\n")
+            await generate_text("Summarize:\n  the topic")
+
+            mock_completion.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_indentation_changes_are_cached_separately(
+        self, env_cache_enabled, mock_litellm_response
+    ):
+        """Test that indentation and line breaks inside a prompt are significant."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Fix this YAML:\na:\n  b: 1")
+            await generate_text("Fix this YAML:\na:\nb: 1")
+            await generate_text("Fix this YAML: a: b: 1")
+
+            assert mock_completion.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_reworded_prompt_not_served_from_cache(
+        self, env_cache_enabled, mock_litellm_response
+    ):
+        """Test that any wording change is treated as a new request."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Write a section about Rust")
+            await generate_text("Write a section about Go")
+
+            assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_model_and_temperature(
+        self, env_cache_enabled, mock_litellm_response
+    ):
+        """Test that different models or temperatures are cached separately."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+            await generate_text("Test prompt", model="gemini-1.5-pro")
+            await generate_text("Test prompt", temperature=0.1)
+
+            assert mock_completion.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_not_cached(self, env_cache_enabled, mock_litellm_response):
+        """Test that stochastic (temperature > 0.3) responses bypass the cache."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt", temperature=0.7)
+            await generate_text("Test prompt", temperature=0.7)
+
+            assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(
+        self, env_cache_enabled, mock_litellm_response, monkeypatch
+    ):
+        """Test that entries older than LLM_CACHE_TTL are not served."""
+        clock = [1000.0]
+        monkeypatch.setattr("src.integrations.llm_client.time.monotonic", lambda: clock[0])
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+            clock[0] += 61
+            await generate_text("Test prompt")
+
+            assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, env_cache_enabled, mock_litellm_response):
+        """Test that an exhausted request does not poison the cache."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = [
+                Exception("Authentication failed: 401"),
+                mock_litellm_response,
+            ]
+
+            with pytest.raises(LLMRetryExhausted):
+                await generate_text("Test prompt")
+
+            result = await generate_text("Test prompt")
+
+            assert result == "Generated text from LLM"
+            assert mock_completion.call_count == 2
+
+
+class TestKeyPool:
+    """Test load balancing across LLM_KEY_POOL."""
+
+    @pytest.fixture
+    def env_key_pool(self, env_vars_gemini, monkeypatch):
+        """Replace the single Gemini key with a two-key pool."""
+        monkeypatch.delenv("LLM_API_KEY")
+        monkeypatch.setenv("LLM_KEY_POOL", '["pool-key-1", "pool-key-2"]')
+        monkeypatch.setattr(llm_client, "_router", None)
+        monkeypatch.setattr(llm_client, "_router_signature", None)
+        reset_settings()
+
+    @pytest.mark.asyncio
+    async def test_single_key_bypasses_router(self, env_vars_gemini, mock_litellm_response):
+        """Test that without a pool requests go straight to litellm.acompletion."""
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion,
+            patch("litellm.Router") as mock_router,
+        ):
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+
+            mock_router.assert_not_called()
+            assert mock_completion.call_args.kwargs["api_key"] == "test-gemini-key"
+
+    @pytest.mark.asyncio
+    async def test_pool_requests_use_pool_keys(self, env_key_pool, mock_litellm_response):
+        """Test that pooled requests are routed with a pool key and no LLM_API_KEY."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            result = await generate_text("Test prompt")
+
+            assert result == "Generated text from LLM"
+            call_kwargs = mock_completion.call_args.kwargs
+            assert call_kwargs["api_key"] in {"pool-key-1", "pool-key-2"}
+            assert call_kwargs["max_retries"] == 0
+            assert call_kwargs["custom_llm_provider"] == "gemini"
+            assert call_kwargs["model"] == "gemini-1.5-flash"
+
+    @pytest.mark.asyncio
+    async def test_router_reused_until_pool_changes(
+        self, env_key_pool, monkeypatch, mock_litellm_response
+    ):
+        """Test that the router is built once per (model, provider, pool)."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+            first_router = llm_client._router
+            await generate_text("Another prompt")
+            assert llm_client._router is first_router
+
+            monkeypatch.setenv("LLM_KEY_POOL", '["pool-key-3"]')
+            reset_settings()
+            await generate_text("Test prompt")
+
+            assert llm_client._router is not first_router
+            assert mock_completion.call_args.kwargs["api_key"] == "pool-key-3"
+
+    @pytest.mark.asyncio
+    async def test_pool_errors_use_client_retry(self, env_key_pool, mock_litellm_response):
+        """Test that the router does not retry on its own; the client loop does."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = [
+                Exception("Connection timeout"),
+                mock_litellm_response,
+            ]
+
+            result = await generate_text("Test prompt")
+
+            assert result == "Generated text from LLM"
+            assert mock_completion.call_count == 2
+
+
+class _RateLimited(Exception):
+    """Provider error carrying response headers, like litellm.RateLimitError."""
+
+    def __init__(self, headers):
+        super().__init__("Rate limit exceeded: 429")
+        self.response = MagicMock(headers=headers)
+
+
+class TestRetryAfterHeaders:
+    """Test that retries wait for the time the provider asks for."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_header_sets_delay(self, env_vars_gemini, mock_litellm_response):
+        """Test that Retry-After seconds replace the backoff schedule."""
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_completion.side_effect = [
+                _RateLimited({"Retry-After": "0.8"}),
+                mock_litellm_response,
+            ]
+
+            await generate_text("Test prompt")
+
+            mock_sleep.assert_awaited_once_with(0.8)
+
+    @pytest.mark.asyncio
+    async def test_openai_reset_headers_use_longest(self, env_vars_openai, mock_litellm_response):
+        """Test that OpenAI reset durations are parsed and the longest wins."""
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_completion.side_effect = [
+                _RateLimited(
+                    {"x-ratelimit-reset-requests": "20ms", "x-ratelimit-reset-tokens": "1m2.5s"}
+                ),
+                mock_litellm_response,
+            ]
+
+            await generate_text("Test prompt")
+
+            mock_sleep.assert_awaited_once_with(60.0)  # 62.5s capped at _MAX_RETRY_DELAY
+
+    def test_reset_headers_ignored_for_other_providers(self):
+        """Test that provider profiles gate which reset headers are trusted."""
+        error = _RateLimited({"x-ratelimit-reset-requests": "2s"})
+
+        assert llm_client._retry_after_delay(error, "openai") == 2.0
+        assert llm_client._retry_after_delay(error, "gemini") is None
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({"retry-after-ms": "250"}, 0.25),
+            ({"retry-after": "3"}, 3.0),
+            ({"retry-after": "soon"}, None),
+            ({}, None),
+        ],
+    )
+    def test_retry_after_parsing(self, headers, expected):
+        """Test Retry-After variants, including unparseable values."""
+        assert llm_client._retry_after_delay(_RateLimited(headers), "gemini") == expected
+
+    def test_headers_read_from_exception_cause(self):
+        """Test that headers on a chained provider exception are found."""
+        try:
+            try:
+                raise _RateLimited({"retry-after": "1"})
+            except _RateLimited as inner:
+                raise RuntimeError("wrapped") from inner
+        except RuntimeError as outer:
+            assert llm_client._retry_after_delay(outer, "openai") == 1.0
+
+
+class TestTruncateToTokens:
+    """Test token-budget truncation."""
+
+    def test_short_text_unchanged(self):
+        """Test that text within budget is returned as-is."""
+        assert truncate_to_tokens("hello world", 100) == "hello world"
+
+    def test_long_text_keeps_head(self):
+        """Test that over-budget text is cut from the end."""
+        text = " ".join(f"word{i}" for i in range(2000))
+
+        result = truncate_to_tokens(text, 50, model="gpt-4o")
+
+        assert text.startswith(result)
+        assert "word0" in result
+        assert len(result) < len(text)
+
+    def test_invalid_budget(self):
+        """Test that a non-positive budget is rejected."""
+        with pytest.raises(ValueError, match="max_tokens must be positive"):
+            truncate_to_tokens("text", 0)
+
+
+class TestErrorClassification:
+    """Test retryable vs non-retryable error classification."""
+
+    @pytest.mark.parametrize(
+        "message",
+        ["Rate limit exceeded", "Request TIMEOUT", "502 Bad Gateway", "Internal Server Error"],
+    )
+    def test_retryable_messages(self, message):
+        """Test that transient failures are retried, regardless of case."""
+        assert llm_client._is_retryable_error(RuntimeError(message)) is True
+
+    @pytest.mark.parametrize(
+        "message",
+        ["Authentication failed", "Invalid API key", "HTTP 403 Forbidden", "Invalid request"],
+    )
+    def test_non_retryable_messages(self, message):
+        """Test that client errors are not retried."""
+        assert llm_client._is_retryable_error(RuntimeError(message)) is False
+
+    def test_unknown_errors_retry(self):
+        """Test that unrecognized errors default to retrying."""
+        assert llm_client._is_retryable_error(RuntimeError("something odd")) is True
+
+    @pytest.mark.parametrize(
+        ("error_name", "retryable"),
+        [
+            ("RateLimitError", True),
+            ("InternalServerError", True),
+            ("ServiceUnavailableError", True),
+            ("AuthenticationError", False),
+            ("BadRequestError", False),
+            ("PermissionDeniedError", False),
+            ("NotFoundError", False),
+        ],
+    )
+    def test_litellm_errors_classified_by_type(self, error_name, retryable):
+        """Test that LiteLLM exception types decide retryability, not their message."""
+        import litellm  # pylint: disable=import-outside-toplevel
+
+        error_class = getattr(litellm.exceptions, error_name)
+        # Message deliberately contradicts the type
+        message = "invalid request" if retryable else "rate limit timeout"
+        kwargs = {"response": MagicMock()} if error_name == "PermissionDeniedError" else {}
+        error = error_class(message=message, llm_provider="openai", model="gpt-4o", **kwargs)
+
+        assert llm_client._is_retryable_error(error) is retryable
+
+    def test_litellm_timeout_is_retryable(self):
+        """Test that LiteLLM timeouts are retried."""
+        import litellm  # pylint: disable=import-outside-toplevel
+
+        error = litellm.exceptions.Timeout(
+            message="Request timed out", model="gpt-4o", llm_provider="openai"
+        )
+
+        assert llm_client._is_retryable_error(error) is True
@@ -0,0 +1,370 @@
+"""Tests for bounded-concurrency batch text generation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.integrations import llm_client
+from src.integrations.llm_client import (
+    LLMRetryExhausted,
+    _AIMDLimiter,
+    generate_text,
+    generate_text_batch,
+)
+from src.utils.config import reset_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """Reset configuration before each test."""
+    reset_settings()
+    yield
+    reset_settings()
+
+
+@pytest.fixture
+def env_vars_test(monkeypatch):
+    """Set up test environment variables."""
+    monkeypatch.setenv("APP_NAME", "test-app")
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.setenv("LLM_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_DEFAULT_MODEL", "gemini-1.5-flash")
+    monkeypatch.setenv("LLM_MAX_RETRIES", "3")
+    monkeypatch.setenv("LLM_RETRY_DELAY", "0.1")
+    monkeypatch.delenv("CUSTOM_LLM_BASE_URL", raising=False)
+    monkeypatch.delenv("CUSTOM_LLM_API_KEY", raising=False)
+    monkeypatch.delenv("CUSTOM_LLM_MODEL", raising=False)
+    reset_settings()
+
+
+def _response(text: str) -> MagicMock:
+    """Build a mock LiteLLM response carrying ``text``."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = text
+    return response
+
+
+class _ConcurrencyProbe:
+    """Fake acompletion that records the peak number of in-flight calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return _response(f"echo: {kwargs['messages'][0]['content']}")
+
+
+class TestGenerateTextBatch:
+    """Test generate_text_batch behavior."""
+
+    @pytest.mark.asyncio
+    async def test_results_preserve_prompt_order(self, env_vars_test):
+        """Test that results line up with the input prompts."""
+        with patch("litellm.acompletion", new=_ConcurrencyProbe()):
+            results = await generate_text_batch(["one", "two", "three"])
+
+        assert results == ["echo: one", "echo: two", "echo: three"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, env_vars_test):
+        """Test that no more than ``concurrency`` requests run at once."""
+        probe = _ConcurrencyProbe()
+        with patch("litellm.acompletion", new=probe):
+            await generate_text_batch([f"prompt {i}" for i in range(8)], concurrency=3)
+
+        assert probe.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_hold_slot(self, env_vars_test):
+        """Test that a prompt sleeping before a retry frees its slot for others."""
+        calls = []
+        sleeping = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_completion(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            calls.append(prompt)
+            if prompt == "flaky" and calls.count("flaky") == 1:
+                raise ConnectionError("Network error")
+            return _response(prompt)
+
+        real_sleep = asyncio.sleep
+
+        async def slow_backoff(delay):
+            sleeping.set()
+            await release.wait()
+
+        async def run_batch():
+            with patch("asyncio.sleep", new=slow_backoff):
+                return await generate_text_batch(["flaky", "steady"], concurrency=1)
+
+        with patch("litellm.acompletion", new=fake_completion):
+            batch = asyncio.ensure_future(run_batch())
+            await sleeping.wait()
+            for _ in range(5):
+                await real_sleep(0)
+            # "steady" ran while "flaky" was backing off with the only slot free
+            assert calls == ["flaky", "steady"]
+            release.set()
+            results = await batch
+
+        assert results == ["flaky", "steady"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_prompt_rejected_before_any_call(self, env_vars_test):
+        """Test that validation happens up front for the whole batch."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            with pytest.raises(ValueError, match="Prompt cannot be empty"):
+                await generate_text_batch(["fine", "  "])
+
+            mock_completion.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, env_vars_test):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency must be >= 1"):
+            await generate_text_batch(["prompt"], concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_prompts(self, env_vars_test):
+        """Test that one exhausted prompt fails the batch and cancels the rest."""
+        started = []
+        cancelled = []
+
+        async def fake_completion(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            started.append(prompt)
+            if prompt == "bad":
+                raise Exception("Authentication failed: 401")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(prompt)
+                raise
+            return _response(prompt)
+
+        with patch("litellm.acompletion", new=fake_completion):
+            with pytest.raises(LLMRetryExhausted):
+                await generate_text_batch(["bad", "slow"], concurrency=2)
+            # Let the cancellation propagate to the in-flight provider call
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        assert started == ["bad", "slow"]
+        assert cancelled == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, env_vars_test):
+        """Test that an empty batch returns an empty list."""
+        assert await generate_text_batch([]) == []
+
+
+class _RateLimitError(Exception):
+    """Provider error with an HTTP status code, like litellm.RateLimitError."""
+
+    status_code = 429
+
+
+class TestAdaptiveConcurrency:
+    """Test the AIMD limiter used by generate_text_batch(adaptive=True)."""
+
+    @pytest.mark.asyncio
+    async def test_overload_halves_limit(self):
+        """Test multiplicative decrease on 429, floored at one."""
+        limiter = _AIMDLimiter(8)
+
+        for expected in (4.0, 2.0, 1.0, 1.0):
+            with pytest.raises(_RateLimitError):
+                async with limiter:
+                    raise _RateLimitError("Rate limit exceeded")
+            assert limiter.limit == expected
+
+    @pytest.mark.asyncio
+    async def test_fast_success_grows_limit_up_to_maximum(self):
+        """Test additive increase while latency is under target."""
+        limiter = _AIMDLimiter(4)
+        limiter.limit = 2.0
+
+        for _ in range(2):
+            async with limiter:
+                pass
+        assert limiter.limit == pytest.approx(2.0 + 1 / 2 + 1 / 2.5)
+
+        for _ in range(20):
+            async with limiter:
+                pass
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_slow_success_holds_limit(self, monkeypatch):
+        """Test that the limit does not grow once median latency exceeds target."""
+        clock = [0.0]
+        monkeypatch.setattr("src.integrations.llm_client.time.monotonic", lambda: clock[0])
+        limiter = _AIMDLimiter(4)
+        limiter.limit = 2.0
+
+        async with limiter:
+            clock[0] += 5.0
+
+        assert limiter.limit == 2.0
+
+    @pytest.mark.asyncio
+    async def test_other_errors_leave_limit(self):
+        """Test that non-overload errors such as auth failures do not shrink the limit."""
+        limiter = _AIMDLimiter(4)
+
+        with pytest.raises(ValueError):
+            async with limiter:
+                raise ValueError("Authentication failed: 401")
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_adaptive_batch_backs_off_after_rate_limit(self, env_vars_test):
+        """Test that a 429 in an adaptive batch lowers the number of concurrent calls."""
+        probe = _ConcurrencyProbe()
+        failed = []
+
+        async def fake_completion(**kwargs):
+            if not failed:
+                failed.append(True)
+                raise _RateLimitError("Rate limit exceeded")
+            return await probe(**kwargs)
+
+        with (
+            patch("litellm.acompletion", new=fake_completion),
+            patch("src.integrations.llm_client._retry_after_delay", return_value=0.0),
+        ):
+            results = await generate_text_batch(
+                [f"prompt {i}" for i in range(6)], concurrency=4, adaptive=True
+            )
+
+        assert results == [f"echo: prompt {i}" for i in range(6)]
+        assert probe.peak <= 2
+
+
+class TestInflightDeduplication:
+    """Test that concurrent identical requests share one provider call."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_coalesce(self, env_vars_test):
+        """Test that two overlapping identical calls hit the provider once."""
+        probe = _ConcurrencyProbe()
+        with patch("litellm.acompletion", new=probe):
+            first, second = await asyncio.gather(
+                generate_text("Shared prompt"), generate_text("Shared prompt ")
+            )
+
+        assert first == second == "echo: Shared prompt"
+        assert probe.calls == 1
+        assert llm_client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_duplicates_coalesce(self, env_vars_test):
+        """Test that duplicate prompts inside a batch are sent once."""
+        probe = _ConcurrencyProbe()
+        with patch("litellm.acompletion", new=probe):
+            results = await generate_text_batch(["same", "same", "other"])
+
+        assert results == ["echo: same", "echo: same", "echo: other"]
+        assert probe.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_not_coalesced(self, env_vars_test):
+        """Test that sampled (high temperature) requests stay independent."""
+        probe = _ConcurrencyProbe()
+        with patch("litellm.acompletion", new=probe):
+            await asyncio.gather(
+                generate_text("Shared prompt", temperature=0.9),
+                generate_text("Shared prompt", temperature=0.9),
+            )
+
+        assert probe.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter(self, env_vars_test):
+        """Test that a shared failure is raised to all callers and not kept."""
+
+        async def fail(**kwargs):
+            await asyncio.sleep(0.01)
+            raise Exception("Authentication failed: 401")
+
+        with patch("litellm.acompletion", new=AsyncMock(side_effect=fail)) as mock_completion:
+            results = await asyncio.gather(
+                generate_text("Shared prompt"),
+                generate_text("Shared prompt"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, LLMRetryExhausted) for result in results)
+        mock_completion.assert_called_once()
+        assert llm_client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self, env_vars_test):
+        """Test that the shared call survives one caller being cancelled."""
+        with patch("litellm.acompletion", new=_ConcurrencyProbe()):
+            first = asyncio.ensure_future(generate_text("Shared prompt"))
+            second = asyncio.ensure_future(generate_text("Shared prompt"))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert await second == "echo: Shared prompt"
+            assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancel_cancels_call(self, env_vars_test):
+        """Test that the provider call is cancelled once nobody awaits it."""
+        cancelled = []
+
+        async def hang(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with patch("litellm.acompletion", new=hang):
+            caller = asyncio.ensure_future(generate_text("Shared prompt"))
+            await asyncio.sleep(0)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            await asyncio.sleep(0)
+
+        assert cancelled == [True]
+        assert llm_client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_caller_after_last_cancel_starts_fresh_call(self, env_vars_test):
+        """Test that a request arriving while the old call is cancelling does not join it."""
+        calls = 0
+
+        async def hang_then_echo(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)
+            return _response("fresh")
+
+        with patch("litellm.acompletion", new=hang_then_echo):
+            caller = asyncio.ensure_future(generate_text("Shared prompt"))
+            await asyncio.sleep(0)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+
+            # The cancelled call's done callback has not run yet
+            assert await generate_text("Shared prompt") == "fresh"
+
+        assert calls == 2
@@ -0,0 +1,164 @@
+"""Tests for the persistent LLM response cache."""
+
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.integrations import llm_cache
+from src.integrations.llm_client import clear_response_cache, generate_text
+from src.utils.config import reset_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """Reset configuration and the in-memory cache before each test."""
+    reset_settings()
+    clear_response_cache()
+    yield
+    reset_settings()
+    clear_response_cache()
+
+
+@pytest.fixture
+def env_persistent_cache(monkeypatch):
+    """Enable the persistent cache for a Gemini configuration."""
+    monkeypatch.setenv("APP_NAME", "test-app")
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.setenv("LLM_API_KEY", "test-gemini-key")
+    monkeypatch.setenv("LLM_DEFAULT_MODEL", "gemini-1.5-flash")
+    monkeypatch.setenv("LLM_MAX_RETRIES", "3")
+    monkeypatch.setenv("LLM_RETRY_DELAY", "0.1")
+    monkeypatch.setenv("LLM_CACHE_TTL", "60")
+    monkeypatch.setenv("LLM_CACHE_PERSIST", "true")
+    monkeypatch.delenv("CUSTOM_LLM_BASE_URL", raising=False)
+    monkeypatch.delenv("CUSTOM_LLM_API_KEY", raising=False)
+    monkeypatch.delenv("CUSTOM_LLM_MODEL", raising=False)
+
+
+@pytest.fixture
+def mock_litellm_response():
+    """Create a mock LiteLLM response."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "Generated text from LLM"
+    return response
+
+
+class TestLLMCacheStore:
+    """Test the SQLite store directly."""
+
+    def test_round_trip(self):
+        """Test that a stored response is returned while fresh."""
+        llm_cache.store_response("key", "gemini-1.5-flash", "Response text", ttl=60)
+
+        assert llm_cache.get_cached_response("key", ttl=60) == "Response text"
+
+    def test_missing_key(self):
+        """Test that unknown keys miss."""
+        assert llm_cache.get_cached_response("missing", ttl=60) is None
+
+    def test_stale_entry_misses(self, monkeypatch):
+        """Test that entries older than the TTL are not returned."""
+        clock = [1_000_000.0]
+        monkeypatch.setattr(llm_cache.time, "time", lambda: clock[0])
+        llm_cache.store_response("key", "gemini-1.5-flash", "Response text", ttl=120)
+
+        clock[0] += 61
+
+        assert llm_cache.get_cached_response("key", ttl=60) is None
+        assert llm_cache.get_cached_response("key", ttl=120) == "Response text"
+
+    def test_store_prunes_expired_entries(self, monkeypatch):
+        """Test that storing a response deletes entries older than the TTL."""
+        clock = [1_000_000.0]
+        monkeypatch.setattr(llm_cache.time, "time", lambda: clock[0])
+        llm_cache.store_response("old", "m", "old text", ttl=60)
+        clock[0] += 30
+        llm_cache.store_response("recent", "m", "recent text", ttl=60)
+        clock[0] += 31
+
+        llm_cache.store_response("new", "m", "new text", ttl=60)
+
+        with sqlite3.connect(llm_cache._CACHE_PATH) as conn:
+            keys = {key for (key,) in conn.execute("SELECT key FROM responses")}
+        assert keys == {"recent", "new"}
+
+    def test_values_are_compressed(self):
+        """Test that responses are stored zlib-compressed with their model."""
+        text = "repetitive " * 200
+        llm_cache.store_response("key", "gemini-1.5-flash", text, ttl=60)
+
+        with sqlite3.connect(llm_cache._CACHE_PATH) as conn:
+            model, blob = conn.execute("SELECT model, response FROM responses").fetchone()
+
+        assert model == "gemini-1.5-flash"
+        assert len(blob) < len(text)
+
+    def test_uses_wal_journal(self):
+        """Test that the database runs in WAL mode for concurrent readers."""
+        llm_cache.store_response("key", "m", "text", ttl=60)
+
+        with sqlite3.connect(llm_cache._CACHE_PATH) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_clear(self):
+        """Test that clearing drops every entry."""
+        llm_cache.store_response("key", "m", "text", ttl=60)
+
+        llm_cache.clear_llm_cache()
+
+        assert llm_cache.get_cached_response("key", ttl=60) is None
+
+
+class TestPersistentGeneration:
+    """Test generate_text with LLM_CACHE_PERSIST enabled."""
+
+    @pytest.mark.asyncio
+    async def test_response_survives_restart(self, env_persistent_cache, mock_litellm_response):
+        """Test that a fresh process (empty memory cache) is served from disk."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+            clear_response_cache()
+            llm_cache.close_llm_cache()
+            result = await generate_text("Test prompt")
+
+            assert result == "Generated text from LLM"
+            mock_completion.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_endpoint_is_part_of_the_key(
+        self, env_persistent_cache, monkeypatch, mock_litellm_response
+    ):
+        """Test that a custom endpoint with the same model name is not served the response."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+            clear_response_cache()
+            monkeypatch.setenv("CUSTOM_LLM_BASE_URL", "http://localhost:8000/v1")
+            monkeypatch.setenv("CUSTOM_LLM_API_KEY", "local-key")
+            monkeypatch.setenv("CUSTOM_LLM_MODEL", "gemini-1.5-flash")
+            reset_settings()
+            await generate_text("Test prompt")
+
+            assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_persisted_by_default(
+        self, env_persistent_cache, monkeypatch, mock_litellm_response
+    ):
+        """Test that only the in-memory cache is used without LLM_CACHE_PERSIST."""
+        monkeypatch.delenv("LLM_CACHE_PERSIST")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+            clear_response_cache()
+            await generate_text("Test prompt")
+
+            assert mock_completion.call_count == 2
+        assert not llm_cache._CACHE_PATH.exists()
@@ -0,0 +1,77 @@
+"""Tests for the prompt template registry."""
+
+import pytest
+
+from src.integrations import prompts
+from src.integrations.prompts import PromptTemplate
+
+TEMPLATE_FIELDS = {
+    "ARTICLE_REVIEW_PROMPT_V1": {
+        "topic": "Python Async",
+        "content": "# Intro\nBody {with braces}",
+        "min_tags": 5,
+        "max_tags": 8,
+    },
+    "SECTION_WRITING_PROMPT_V1": {
+        "topic": "Python Async",
+        "section_title": "Event Loops",
+        "subsections_list": "- Basics\n- Tasks",
+        "target_words": 400,
+    },
+    "RESEARCH_SYNTHESIS_PROMPT_V1": {
+        "topic": "Python Async",
+        "section_title": "Event Loops",
+        "web_text": "web",
+        "papers_text": "papers",
+        "code_text": "code",
+    },
+    "ARTICLE_REVISION_PROMPT_V1": {
+        "topic": "Python Async",
+        "content": "# Draft",
+        "feedback": "More examples",
+    },
+}
+
+
+class TestPromptTemplate:
+    """Test PromptTemplate formatting."""
+
+    @pytest.mark.parametrize("name", sorted(TEMPLATE_FIELDS))
+    def test_matches_str_format(self, name):
+        """Test that precompiled formatting is byte-identical to str.format."""
+        template = getattr(prompts, name)
+        fields = TEMPLATE_FIELDS[name]
+
+        assert isinstance(template, PromptTemplate)
+        assert template.format(**fields) == str.format(str(template), **fields)
+
+    @pytest.mark.parametrize("name", sorted(TEMPLATE_FIELDS))
+    def test_static_prefix_leads_every_render(self, name):
+        """Test that the static instructions come first in every rendered prompt."""
+        template = getattr(prompts, name)
+
+        assert len(template.static_prefix) > 200
+        assert template.format(**TEMPLATE_FIELDS[name]).startswith(template.static_prefix)
+
+    def test_escaped_braces(self):
+        """Test that doubled braces render as literal braces."""
+        template = PromptTemplate('Return {{"name": "{name}"}}')
+
+        assert template.format(name="x") == 'Return {"name": "x"}'
+
+    def test_missing_field_raises_key_error(self):
+        """Test that a missing field fails like str.format."""
+        with pytest.raises(KeyError):
+            PromptTemplate("Hello {name}").format()
+
+    def test_format_spec_falls_back_to_str_format(self):
+        """Test that templates with specs or positional fields still work."""
+        assert PromptTemplate("{value:.2f}").format(value=1.234) == "1.23"
+        assert PromptTemplate("{} and {}").format("a", "b") == "a and b"
+
+    def test_behaves_like_str(self):
+        """Test that templates remain ordinary strings."""
+        template = PromptTemplate("Topic: {topic}")
+
+        assert template == "Topic: {topic}"
+        assert "{topic}" in template
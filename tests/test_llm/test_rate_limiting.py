@@ -0,0 +1,181 @@
+"""Tests for client-side LLM rate limiting."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.integrations import llm_client
+from src.integrations.llm_client import _RateLimiter, generate_text, reset_rate_limiter
+from src.utils.config import reset_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """Reset configuration and limiter state before each test."""
+    reset_settings()
+    reset_rate_limiter()
+    yield
+    reset_settings()
+    reset_rate_limiter()
+
+
+@pytest.fixture
+def env_vars_test(monkeypatch):
+    """Set up test environment variables."""
+    monkeypatch.setenv("APP_NAME", "test-app")
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.setenv("LLM_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_DEFAULT_MODEL", "gemini-1.5-flash")
+    monkeypatch.setenv("LLM_MAX_RETRIES", "3")
+    monkeypatch.setenv("LLM_RETRY_DELAY", "0.1")
+    monkeypatch.delenv("CUSTOM_LLM_BASE_URL", raising=False)
+    monkeypatch.delenv("CUSTOM_LLM_API_KEY", raising=False)
+    monkeypatch.delenv("CUSTOM_LLM_MODEL", raising=False)
+    reset_settings()
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the monotonic clock and make asyncio.sleep advance it instantly."""
+    clock = [1000.0]
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr("src.integrations.llm_client.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("src.integrations.llm_client.asyncio.sleep", fake_sleep)
+    return clock, sleeps
+
+
+@pytest.fixture
+def mock_litellm_response():
+    """Create a mock LiteLLM response reporting token usage."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "Generated text from LLM"
+    response.usage.total_tokens = 42
+    return response
+
+
+class TestRateLimiter:
+    """Test the sliding-window limiter in isolation."""
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute(self, fake_clock):
+        """Test that the (rpm + 1)th request waits for the window to slide."""
+        _, sleeps = fake_clock
+        limiter = _RateLimiter(rpm=2, tpm=1_000_000)
+
+        await limiter.acquire(10)
+        await limiter.acquire(10)
+        assert sleeps == []
+
+        await limiter.acquire(10)
+        assert sleeps == [60.0]
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute(self, fake_clock):
+        """Test that a request waits until its tokens fit in the budget."""
+        clock, sleeps = fake_clock
+        limiter = _RateLimiter(rpm=100, tpm=100)
+
+        await limiter.acquire(60)
+        clock[0] += 15
+        await limiter.acquire(30)
+        await limiter.acquire(30)
+
+        assert sleeps == [45.0]
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_admitted_when_idle(self, fake_clock):
+        """Test that a request above the token budget does not wait forever."""
+        _, sleeps = fake_clock
+        limiter = _RateLimiter(rpm=10, tpm=100)
+
+        await limiter.acquire(500)
+
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_record_usage_corrects_estimate(self, fake_clock):
+        """Test that reported usage replaces the admission estimate."""
+        _, sleeps = fake_clock
+        limiter = _RateLimiter(rpm=10, tpm=100)
+
+        entry = await limiter.acquire(90)
+        limiter.record_usage(entry, 20)
+        await limiter.acquire(70)
+
+        assert sleeps == []
+
+    def test_estimate_tokens(self):
+        """Test the admission estimate: ~4 chars per token plus framing overhead."""
+        assert llm_client._estimate_tokens("") == 16
+        assert llm_client._estimate_tokens("x" * 400) == 116
+
+
+class TestRateLimitedGeneration:
+    """Test that generate_text goes through the limiter when enabled."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, env_vars_test, mock_litellm_response):
+        """Test that no limiter is built unless LLM_RATE_LIMIT is set."""
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+
+        assert llm_client._rate_limiter is None
+
+    @pytest.mark.asyncio
+    async def test_uses_provider_defaults(self, env_vars_test, monkeypatch, mock_litellm_response):
+        """Test that Gemini's default limits apply and usage is recorded."""
+        monkeypatch.setenv("LLM_RATE_LIMIT", "true")
+        reset_settings()
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+
+        limiter = llm_client._rate_limiter
+        assert (limiter.rpm, limiter.tpm) == (60, 100_000)
+        assert [entry[1] for entry in limiter._entries] == [42.0]
+
+    @pytest.mark.asyncio
+    async def test_explicit_limits_throttle_requests(
+        self, env_vars_test, monkeypatch, fake_clock, mock_litellm_response
+    ):
+        """Test that LLM_RPM_LIMIT delays requests beyond the per-minute budget."""
+        _, sleeps = fake_clock
+        monkeypatch.setenv("LLM_RATE_LIMIT", "true")
+        monkeypatch.setenv("LLM_RPM_LIMIT", "1")
+        reset_settings()
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("First prompt")
+            await generate_text("Second prompt")
+
+        assert sleeps == [60.0]
+        assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_custom_endpoint_requires_explicit_limits(
+        self, env_vars_test, monkeypatch, mock_litellm_response
+    ):
+        """Test that custom endpoints are not throttled with hosted defaults."""
+        monkeypatch.setenv("LLM_RATE_LIMIT", "true")
+        monkeypatch.setenv("CUSTOM_LLM_BASE_URL", "http://localhost:11434/v1")
+        reset_settings()
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_litellm_response
+
+            await generate_text("Test prompt")
+
+        assert llm_client._rate_limiter is None
@@ -2,9 +2,15 @@
 
 import json
 import logging
+import logging.handlers
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from src.utils import logging_config
 from src.utils.config import reset_settings
 from src.utils.logging_config import (
     JsonFormatter,
@@ -15,6 +21,21 @@ from src.utils.logging_config import (
 )
 
 
+def _stdout_handlers() -> list[logging.Handler]:
+    """Return the stdout handlers fed by our root QueueHandler."""
+    queue_handlers = [
+        h for h in logging.getLogger().handlers if isinstance(h, logging.handlers.QueueHandler)
+    ]
+    assert len(queue_handlers) == 1
+    listener = logging_config._listener
+    assert listener is not None and listener.queue is queue_handlers[0].queue
+    return [
+        h
+        for h in listener.handlers
+        if isinstance(h, logging.StreamHandler) and h.stream == sys.stdout
+    ]
+
+
 class TestLoggingSetup:
     """Test logging setup and configuration."""
 
@@ -39,13 +60,8 @@ class TestLoggingSetup:
         root_logger = logging.getLogger()
         assert root_logger.level == logging.INFO
 
-        # Check our StreamHandler was added (pytest may have its own handlers)
-        stream_handlers = [
-            h
-            for h in root_logger.handlers
-            if isinstance(h, logging.StreamHandler) and h.stream == logging.sys.stdout
-        ]
-        assert len(stream_handlers) == 1
+        # Check our stdout handler was added (pytest may have its own handlers)
+        assert len(_stdout_handlers()) == 1
 
     def test_setup_logging_prevents_duplicate_handlers(
         self, monkeypatch: pytest.MonkeyPatch
@@ -59,14 +75,8 @@ class TestLoggingSetup:
         setup_logging()
         setup_logging()
 
-        root_logger = logging.getLogger()
-        # Should only have 1 StreamHandler to stdout, not 3
-        stream_handlers = [
-            h
-            for h in root_logger.handlers
-            if isinstance(h, logging.StreamHandler) and h.stream == logging.sys.stdout
-        ]
-        assert len(stream_handlers) == 1
+        # Should only have 1 handler to stdout, not 3
+        assert len(_stdout_handlers()) == 1
 
     def test_setup_logging_with_force_reconfigure(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that force_reconfigure allows reconfiguration."""
@@ -86,13 +96,40 @@ class TestLoggingSetup:
         root_logger = logging.getLogger()
         assert root_logger.level == logging.DEBUG
 
-        # Check we still have only 1 StreamHandler to stdout
-        stream_handlers = [
-            h
-            for h in root_logger.handlers
-            if isinstance(h, logging.StreamHandler) and h.stream == logging.sys.stdout
-        ]
-        assert len(stream_handlers) == 1
+        # Check we still have only 1 handler to stdout
+        assert len(_stdout_handlers()) == 1
+
+    def test_records_are_written_by_listener(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that queued records reach stdout once the listener is stopped."""
+        monkeypatch.setenv("APP_NAME", "test-app")
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+
+        setup_logging(use_json=True)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test.queue").exception("Failed with %s", "args")
+        reset_logging()
+
+        log_data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert log_data["message"] == "Failed with args"
+        assert "ValueError: boom" in log_data["exception"]
+
+    def test_reset_logging_stops_listener(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that reset_logging stops the listener and removes the QueueHandler."""
+        monkeypatch.setenv("APP_NAME", "test-app")
+        monkeypatch.setenv("ENVIRONMENT", "development")
+
+        setup_logging()
+        reset_logging()
+
+        assert logging_config._listener is None
+        assert not any(
+            isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers
+        )
 
 
 class TestLogLevels:
@@ -278,6 +315,64 @@ class TestLogFormatters:
         assert "exception" in log_data
         assert "ValueError: Test error" in log_data["exception"]
 
+    def test_json_formatter_reads_settings_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that app fields are captured when the formatter is created."""
+        monkeypatch.setenv("APP_NAME", "test-app")
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test.module",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+
+        with patch("src.utils.logging_config.get_settings") as mock_get_settings:
+            log_data = json.loads(formatter.format(record))
+
+        mock_get_settings.assert_not_called()
+        assert log_data["app_name"] == "test-app"
+        assert list(log_data)[:6] == [
+            "timestamp",
+            "level",
+            "name",
+            "message",
+            "app_name",
+            "environment",
+        ]
+
+    def test_json_formatter_serializes_rich_extra_fields(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that datetimes, non-string keys and arbitrary objects in extras serialize."""
+        monkeypatch.setenv("APP_NAME", "test-app")
+        monkeypatch.setenv("ENVIRONMENT", "development")
+
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test.module",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Stored",
+            args=(),
+            exc_info=None,
+        )
+        record.extra_fields = {
+            "published_at": datetime(2024, 1, 15, 10, 0),
+            "counts": {1: "one"},
+            "path": Path("/tmp/out"),
+        }
+
+        log_data = json.loads(formatter.format(record))
+
+        assert log_data["published_at"] == "2024-01-15T10:00:00"
+        assert log_data["counts"] == {"1": "one"}
+        assert log_data["path"] == "/tmp/out"
+
 
 class TestGetLogger:
     """Test get_logger function."""
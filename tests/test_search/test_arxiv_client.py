@@ -32,8 +32,8 @@ async def test_fetch_arxiv_success():
         ),
     ]
 
-    with patch("arxiv.Search") as mock_search:
-        mock_search.return_value.results.return_value = mock_results
+    with patch("arxiv.Search"), patch("arxiv.Client") as mock_client:
+        mock_client.return_value.results.return_value = iter(mock_results)
 
         results = await fetch_arxiv("machine learning", max_results=1)
 
@@ -61,10 +61,50 @@ async def test_fetch_arxiv_invalid_max_results():
 @pytest.mark.asyncio
 async def test_fetch_arxiv_empty_results():
     """Test handling of empty results."""
-    with patch("arxiv.Search") as mock_search:
-        mock_search.return_value.results.return_value = []
+    with patch("arxiv.Search"), patch("arxiv.Client") as mock_client:
+        mock_client.return_value.results.return_value = iter([])
 
         results = await fetch_arxiv("obscure query")
 
         assert isinstance(results, list)
         assert len(results) == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_arxiv_page_size_follows_max_results():
+    """Test that the client pages no more than needed, capped at the API page size."""
+    with patch("arxiv.Search") as mock_search, patch("arxiv.Client") as mock_client:
+        mock_client.return_value.results.return_value = iter([])
+
+        await fetch_arxiv("agents", max_results=5)
+        assert mock_client.call_args.kwargs["page_size"] == 5
+
+        await fetch_arxiv("agents", max_results=250)
+        assert mock_client.call_args.kwargs["page_size"] == 100
+
+        mock_client.return_value.results.assert_called_with(mock_search.return_value)
+
+
+@pytest.mark.asyncio
+async def test_fetch_arxiv_missing_dates():
+    """Test that absent timestamps are returned as None."""
+    paper = MagicMock(
+        entry_id="http://arxiv.org/abs/2301.00002v1",
+        title="Undated",
+        summary="",
+        authors=[],
+        published=None,
+        updated=None,
+        primary_category="cs.AI",
+        categories=["cs.AI"],
+        pdf_url=None,
+        links=[],
+    )
+
+    with patch("arxiv.Search"), patch("arxiv.Client") as mock_client:
+        mock_client.return_value.results.return_value = iter([paper])
+
+        results = await fetch_arxiv("agents")
+
+    assert results[0]["published"] is None
+    assert results[0]["updated"] is None
@@ -0,0 +1,188 @@
+"""Tests for the persistent search result cache."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.integrations.search import cache
+from src.integrations.search.cache import cached, clear_search_cache, reset_search_cache
+from src.integrations.search.github_trending_client import fetch_github_trending
+from src.utils.config import reset_settings
+
+
+def _cached_mock(mock: AsyncMock, ttl: int = 60):
+    """Wrap an AsyncMock in a real function and apply the cache decorator."""
+
+    async def fetch(*args, **kwargs):
+        return await mock(*args, **kwargs)
+
+    return cached(ttl=ttl)(fetch)
+
+
+@pytest.mark.asyncio
+async def test_result_reused_for_same_arguments():
+    """Test that a second call with the same arguments skips the fetch."""
+    fetch = AsyncMock(return_value=[{"id": 1}])
+    cached_fetch = _cached_mock(fetch)
+
+    assert await cached_fetch("python", limit=5) == [{"id": 1}]
+    assert await cached_fetch("python", limit=5) == [{"id": 1}]
+
+    fetch.assert_awaited_once_with("python", limit=5)
+
+
+@pytest.mark.asyncio
+async def test_different_arguments_cached_separately():
+    """Test that each argument combination gets its own entry."""
+    fetch = AsyncMock(side_effect=lambda language: [language])
+    cached_fetch = _cached_mock(fetch)
+
+    assert await cached_fetch("python") == ["python"]
+    assert await cached_fetch("rust") == ["rust"]
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    """Test that results are stored with the decorator's TTL."""
+    fetch = AsyncMock(return_value=[])
+    cached_fetch = _cached_mock(fetch, ttl=123)
+
+    with patch.object(cache._get_cache(), "set") as mock_set:
+        await cached_fetch("python")
+
+    assert mock_set.call_args.kwargs["expire"] == 123
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    """Test that a failed fetch is retried on the next call."""
+    fetch = AsyncMock(side_effect=[RuntimeError("boom"), ["ok"]])
+    cached_fetch = _cached_mock(fetch)
+
+    with pytest.raises(RuntimeError):
+        await cached_fetch("python")
+
+    assert await cached_fetch("python") == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_clear_search_cache():
+    """Test that clearing forces a fresh fetch."""
+    fetch = AsyncMock(return_value=["first"])
+    cached_fetch = _cached_mock(fetch)
+
+    await cached_fetch("python")
+    clear_search_cache()
+    await cached_fetch("python")
+
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_github_trending_scrape_is_cached():
+    """Test that fetch_github_trending reuses a scrape across calls."""
+    mock_html = '<article class="Box-row"><h2><a href="/user/repo">repo</a></h2></article>'
+
+    with patch("src.integrations.search.github_trending_client.get_http_client") as mock_get_client:
+        mock_instance = mock_get_client.return_value
+        mock_instance.get = AsyncMock()
+        mock_instance.get.return_value.raise_for_status = lambda: None
+        mock_instance.get.return_value.text = mock_html
+
+        first = await fetch_github_trending("python")
+        second = await fetch_github_trending("python")
+
+    assert first == second
+    mock_instance.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_arguments_are_cached():
+    """Test that unhashable but picklable arguments such as lists work as keys."""
+    fetch = AsyncMock(return_value=["trend"])
+    cached_fetch = _cached_mock(fetch)
+
+    await cached_fetch(["python", "rust"])
+    await cached_fetch(["python", "rust"])
+
+    fetch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_calls_through(monkeypatch):
+    """Test that a disabled cache always fetches and never touches the disk."""
+    monkeypatch.setattr(cache, "_enabled", False)
+    fetch = AsyncMock(return_value=["fresh"])
+    cached_fetch = _cached_mock(fetch)
+
+    await cached_fetch("python")
+    await cached_fetch("python")
+
+    assert fetch.await_count == 2
+    assert cache._cache is None
+    assert not cache._CACHE_DIR.exists()
+
+
+@pytest.mark.asyncio
+async def test_settings_read_on_first_use(monkeypatch, tmp_path):
+    """Test that SEARCH_CACHE_ENABLED and SEARCH_CACHE_DIR come from settings."""
+    monkeypatch.setenv("APP_NAME", "test-app")
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("SEARCH_CACHE_ENABLED", "true")
+    monkeypatch.setenv("SEARCH_CACHE_DIR", str(tmp_path / "configured"))
+    monkeypatch.setattr(cache, "_enabled", None)
+    monkeypatch.setattr(cache, "_CACHE_DIR", None)
+    reset_settings()
+    try:
+        await _cached_mock(AsyncMock(return_value=[]))("python")
+    finally:
+        reset_settings()
+
+    assert cache._enabled is True
+    assert cache._CACHE_DIR == tmp_path / "configured"
+    assert (tmp_path / "configured").is_dir()
+
+
+def test_defaults_used_without_app_settings(monkeypatch):
+    """Test that the cache works when APP_NAME and ENVIRONMENT are unset."""
+    monkeypatch.delenv("APP_NAME", raising=False)
+    monkeypatch.delenv("ENVIRONMENT", raising=False)
+    monkeypatch.delenv("SEARCH_CACHE_ENABLED", raising=False)
+    monkeypatch.delenv("SEARCH_CACHE_DIR", raising=False)
+    monkeypatch.setattr(cache, "_enabled", None)
+    reset_settings()
+    try:
+        assert cache._cache_enabled() is True
+        assert cache._setting("SEARCH_CACHE_DIR") == "~/.cache/agentic-blogger/search"
+    finally:
+        reset_settings()
+
+
+@pytest.mark.asyncio
+async def test_reset_rereads_settings(monkeypatch, tmp_path):
+    """Test that reset_search_cache closes the cache and re-reads its settings."""
+    monkeypatch.setenv("APP_NAME", "test-app")
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("SEARCH_CACHE_DIR", str(tmp_path / "first"))
+    reset_search_cache()
+    reset_settings()
+    try:
+        await _cached_mock(AsyncMock(return_value=[]))("python")
+        assert cache._CACHE_DIR == tmp_path / "first"
+
+        monkeypatch.setenv("SEARCH_CACHE_DIR", str(tmp_path / "second"))
+        monkeypatch.setenv("SEARCH_CACHE_ENABLED", "false")
+        reset_search_cache()
+        reset_settings()
+        assert cache._cache is None
+
+        fetch = AsyncMock(return_value=[])
+        await _cached_mock(fetch)("python")
+        await _cached_mock(fetch)("python")
+    finally:
+        reset_search_cache()
+        reset_settings()
+
+    assert fetch.await_count == 2
+    assert not (tmp_path / "second").exists()
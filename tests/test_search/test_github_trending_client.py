@@ -27,8 +27,8 @@ async def test_fetch_github_trending_success():
     </html>
     """
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_instance = mock_client.return_value.__aenter__.return_value
+    with patch("src.integrations.search.github_trending_client.get_http_client") as mock_get_client:
+        mock_instance = mock_get_client.return_value
         mock_instance.get = AsyncMock()
         mock_instance.get.return_value.raise_for_status = lambda: None
         mock_instance.get.return_value.text = mock_html
@@ -54,8 +54,8 @@ async def test_fetch_github_trending_empty_results():
     """Test handling of empty results."""
     mock_html = "<html><body>No articles found</body></html>"
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_instance = mock_client.return_value.__aenter__.return_value
+    with patch("src.integrations.search.github_trending_client.get_http_client") as mock_get_client:
+        mock_instance = mock_get_client.return_value
         mock_instance.get = AsyncMock()
         mock_instance.get.return_value.raise_for_status = lambda: None
         mock_instance.get.return_value.text = mock_html
@@ -81,8 +81,8 @@ async def test_fetch_github_trending_malformed_html():
     </html>
     """
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_instance = mock_client.return_value.__aenter__.return_value
+    with patch("src.integrations.search.github_trending_client.get_http_client") as mock_get_client:
+        mock_instance = mock_get_client.return_value
         mock_instance.get = AsyncMock()
         mock_instance.get.return_value.raise_for_status = lambda: None
         mock_instance.get.return_value.text = mock_html
@@ -93,3 +93,46 @@ async def test_fetch_github_trending_malformed_html():
         assert isinstance(results, list)
         assert len(results) == 1
         assert results[0]["name"] == "valid/repo"
+
+
+@pytest.mark.asyncio
+async def test_fetch_github_trending_fields_and_defaults():
+    """Test nested text, language extraction, and fallbacks for missing fields."""
+    mock_html = """
+    <html>
+        <article class="Box-row extra">
+            <h2 class="h3"><a href="/org/tool/"> org / <span>tool</span> </a></h2>
+            <p class="col-9 color-fg-muted">  A <em>fast</em> tool  </p>
+            <span class="d-inline-block float-sm-right">1,234 stars today</span>
+            <span itemprop="programmingLanguage">Rust</span>
+        </article>
+        <article class="Box-row">
+            <h2><a href="/bare/repo">bare</a></h2>
+        </article>
+    </html>
+    """
+
+    with patch("src.integrations.search.github_trending_client.get_http_client") as mock_get_client:
+        mock_instance = mock_get_client.return_value
+        mock_instance.get = AsyncMock()
+        mock_instance.get.return_value.raise_for_status = lambda: None
+        mock_instance.get.return_value.text = mock_html
+
+        results = await fetch_github_trending("python")
+
+    assert results == [
+        {
+            "name": "org/tool",
+            "description": "A fast tool",
+            "stars": "1,234 stars today",
+            "language": "Rust",
+            "url": "https://github.com/org/tool",
+        },
+        {
+            "name": "bare/repo",
+            "description": "",
+            "stars": "0",
+            "language": "python",
+            "url": "https://github.com/bare/repo",
+        },
+    ]
@@ -1,9 +1,12 @@
 """Tests for Google Trends client."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 import pytest
+from pytrends.exceptions import TooManyRequestsError
 
 from src.integrations.search.google_trends_client import fetch_google_trends
 
@@ -32,6 +35,8 @@ async def test_fetch_google_trends_success():
         assert results["keywords"] == ["AI", "ML"]
         assert isinstance(results["data"], list)
         assert len(results["data"]) == 3
+        assert results["data"] == mock_df.to_dict(orient="records")
+        assert type(results["data"][0]["AI"]) is int
 
 
 @pytest.mark.asyncio
@@ -124,3 +129,85 @@ async def test_fetch_google_trends_non_rate_limit_error():
 
         # Should only be called once (no retries for non-rate-limit errors)
         assert mock_instance.interest_over_time.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_google_trends_backoff_is_jittered():
+    """Test that retry delays are drawn from a growing window, not fixed."""
+    mock_df = pd.DataFrame({"AI": [50], "isPartial": [False]})
+
+    with (
+        patch("src.integrations.search.google_trends_client.TrendReq") as mock_trends,
+        patch("src.integrations.search.google_trends_client.asyncio.sleep", new=AsyncMock()) as s,
+        patch("src.integrations.search.google_trends_client.random.uniform", return_value=0.5) as u,
+    ):
+        mock_trends.return_value.interest_over_time.side_effect = [
+            Exception("429 Too Many Requests"),
+            Exception("429 Too Many Requests"),
+            mock_df,
+        ]
+        await fetch_google_trends(["AI"], max_retries=3, base_delay=2.0)
+
+    assert [c.args for c in u.call_args_list] == [(0, 4.0), (0, 8.0)]
+    assert [c.args for c in s.call_args_list] == [(0.5,), (0.5,)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_google_trends_honors_retry_after():
+    """Test that a Retry-After header on the 429 response sets the delay."""
+    mock_df = pd.DataFrame({"AI": [50], "isPartial": [False]})
+    response = MagicMock(status_code=429, headers={"Retry-After": "7"})
+
+    with (
+        patch("src.integrations.search.google_trends_client.TrendReq") as mock_trends,
+        patch("src.integrations.search.google_trends_client.asyncio.sleep", new=AsyncMock()) as s,
+    ):
+        mock_trends.return_value.interest_over_time.side_effect = [
+            TooManyRequestsError.from_response(response),
+            mock_df,
+        ]
+        await fetch_google_trends(["AI"], max_retries=2)
+
+    s.assert_awaited_once_with(7.0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_google_trends_cached():
+    """Test that a repeated query is served from the cache."""
+    mock_df = pd.DataFrame({"AI": [50, 60], "isPartial": [False, False]})
+
+    with patch("src.integrations.search.google_trends_client.TrendReq") as mock_trends:
+        mock_trends.return_value.interest_over_time.return_value = mock_df
+
+        first = await fetch_google_trends(["AI"])
+        second = await fetch_google_trends(["AI"])
+        await fetch_google_trends(["ML"])
+
+    assert first == second
+    assert mock_trends.return_value.interest_over_time.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_google_trends_does_not_block_event_loop():
+    """Test that the blocking pytrends call runs off the event loop."""
+    mock_df = pd.DataFrame({"AI": [50], "isPartial": [False]})
+    ticks = 0
+
+    def slow_interest_over_time():
+        time.sleep(0.2)
+        return mock_df
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    with patch("src.integrations.search.google_trends_client.TrendReq") as mock_trends:
+        mock_trends.return_value.interest_over_time.side_effect = slow_interest_over_time
+        ticking = asyncio.create_task(ticker())
+
+        await fetch_google_trends(["AI"])
+        ticking.cancel()
+
+    assert ticks >= 5
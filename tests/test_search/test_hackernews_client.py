@@ -1,39 +1,50 @@
 """Tests for Hacker News client."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from src.integrations.search.hackernews_client import fetch_hackernews_top
 
+TOP_STORIES_URL = "https://hacker-news.firebaseio.com/v0/topstories.json"
+
+
+def _item_url(story_id: int) -> str:
+    return f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
+
+
+def _json_response(url: str, payload, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(status_code, json=payload, request=httpx.Request("GET", url))
+
+
+def _fake_get(responses: dict[str, httpx.Response], delay: float = 0.0):
+    """Build an AsyncClient.get replacement serving canned responses by URL."""
+
+    async def get(url, **kwargs):
+        if delay:
+            await asyncio.sleep(delay)
+        return responses[url]
+
+    return get
+
 
 @pytest.mark.asyncio
 async def test_fetch_hackernews_top_success():
     """Test successful Hacker News fetch."""
-    mock_story_ids = [1, 2, 3]
     mock_stories = [
         {"id": 1, "title": "Story 1", "by": "user1", "score": 100},
         {"id": 2, "title": "Story 2", "by": "user2", "score": 200},
         {"id": 3, "title": "Story 3", "by": "user3", "score": 300},
     ]
+    responses = {TOP_STORIES_URL: _json_response(TOP_STORIES_URL, [1, 2, 3])}
+    for story in mock_stories:
+        responses[_item_url(story["id"])] = _json_response(_item_url(story["id"]), story)
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_instance = mock_client.return_value.__aenter__.return_value
-
-        # Mock the story IDs response
-        ids_response = AsyncMock()
-        ids_response.raise_for_status = AsyncMock()
-        ids_response.json = AsyncMock(return_value=mock_story_ids)
-
-        # Mock individual story responses
-        story_responses = []
-        for story in mock_stories:
-            story_response = AsyncMock()
-            story_response.raise_for_status = AsyncMock()
-            story_response.json = AsyncMock(return_value=story)
-            story_responses.append(story_response)
-
-        mock_instance.get = AsyncMock(side_effect=[ids_response] + story_responses)
+    with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+        mock_instance = mock_client.return_value
+        mock_instance.get = AsyncMock(side_effect=_fake_get(responses))
 
         results = await fetch_hackernews_top(limit=3)
 
@@ -43,6 +54,129 @@ async def test_fetch_hackernews_top_success():
         assert results[0]["title"] == "Story 1"
 
 
+@pytest.mark.asyncio
+async def test_fetch_hackernews_top_fetches_items_concurrently():
+    """Test that story items are requested concurrently, keeping ranking order."""
+    story_ids = list(range(1, 11))
+    responses = {TOP_STORIES_URL: _json_response(TOP_STORIES_URL, story_ids)}
+    for story_id in story_ids:
+        url = _item_url(story_id)
+        responses[url] = _json_response(url, {"id": story_id})
+
+    with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+        mock_instance = mock_client.return_value
+        mock_instance.get = AsyncMock(side_effect=_fake_get(responses, delay=0.05))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await fetch_hackernews_top(limit=10)
+        elapsed = loop.time() - started
+
+    assert [story["id"] for story in results] == story_ids
+    # Sequential fetching would take 11 x 50ms
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_fetch_hackernews_top_caps_item_concurrency():
+    """Test that no more than `concurrency` item requests are in flight."""
+    story_ids = list(range(1, 21))
+    responses = {TOP_STORIES_URL: _json_response(TOP_STORIES_URL, story_ids)}
+    for story_id in story_ids:
+        url = _item_url(story_id)
+        responses[url] = _json_response(url, {"id": story_id})
+    in_flight = 0
+    peak = 0
+
+    async def get(url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return responses[url]
+
+    with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+        mock_client.return_value.get = get
+
+        results = await fetch_hackernews_top(limit=20, concurrency=4)
+
+    assert len(results) == 20
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_fetch_hackernews_top_invalid_concurrency():
+    """Test error handling for invalid concurrency."""
+    with pytest.raises(ValueError, match="Concurrency must be positive"):
+        await fetch_hackernews_top(concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_hackernews_top_skips_deleted_items():
+    """Test that null items (deleted stories) are dropped."""
+    responses = {
+        TOP_STORIES_URL: _json_response(TOP_STORIES_URL, [1, 2]),
+        _item_url(1): httpx.Response(
+            200, content=b"null", request=httpx.Request("GET", _item_url(1))
+        ),
+        _item_url(2): _json_response(_item_url(2), {"id": 2}),
+    }
+
+    with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+        mock_instance = mock_client.return_value
+        mock_instance.get = AsyncMock(side_effect=_fake_get(responses))
+
+        results = await fetch_hackernews_top(limit=2)
+
+    assert results == [{"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_fetch_hackernews_top_item_error_propagates():
+    """Test that a failed item request raises an HTTP error."""
+    responses = {
+        TOP_STORIES_URL: _json_response(TOP_STORIES_URL, [1]),
+        _item_url(1): _json_response(_item_url(1), {}, status_code=404),
+    }
+
+    with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+        mock_instance = mock_client.return_value
+        mock_instance.get = AsyncMock(side_effect=_fake_get(responses))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetch_hackernews_top(limit=1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_hackernews_top_item_error_cancels_other_fetches():
+    """Test that a failed item request cancels the item fetches still running."""
+    story_ids = [1, 2, 3]
+    cancelled = []
+
+    async def get(url, **kwargs):
+        if url == TOP_STORIES_URL:
+            return _json_response(url, story_ids)
+        if url == _item_url(1):
+            return _json_response(url, {}, status_code=404)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return _json_response(url, {"id": 0})
+
+    with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+        mock_client.return_value.get = get
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetch_hackernews_top(limit=3)
+        # Let the cancellations land
+        await asyncio.sleep(0)
+
+    assert sorted(cancelled) == [_item_url(2), _item_url(3)]
+
+
 @pytest.mark.asyncio
 async def test_fetch_hackernews_top_invalid_limit():
     """Test error handling for invalid limit."""
@@ -53,16 +187,85 @@ async def test_fetch_hackernews_top_invalid_limit():
 @pytest.mark.asyncio
 async def test_fetch_hackernews_top_empty_results():
     """Test handling of empty results."""
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_instance = mock_client.return_value.__aenter__.return_value
-
-        ids_response = AsyncMock()
-        ids_response.raise_for_status = AsyncMock()
-        ids_response.json = AsyncMock(return_value=[])
-
-        mock_instance.get = AsyncMock(return_value=ids_response)
+    with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+        mock_instance = mock_client.return_value
+        mock_instance.get = AsyncMock(
+            return_value=_json_response(TOP_STORIES_URL, []),
+        )
 
         results = await fetch_hackernews_top(limit=10)
 
         assert isinstance(results, list)
         assert len(results) == 0
+
+
+class TestRetry:
+    """Test retrying of throttled and failed Hacker News requests."""
+
+    @pytest.fixture
+    def no_sleep(self):
+        """Record backoff sleeps instead of waiting."""
+        with patch(
+            "src.integrations.search.hackernews_client.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            yield mock_sleep
+
+    @pytest.mark.asyncio
+    async def test_transient_status_is_retried(self, no_sleep):
+        """Test that a 503 on an item is retried until it succeeds."""
+        url = _item_url(1)
+        attempts = iter([_json_response(url, {}, status_code=503), _json_response(url, {"id": 1})])
+
+        async def get(request_url, **kwargs):
+            if request_url == TOP_STORIES_URL:
+                return _json_response(TOP_STORIES_URL, [1])
+            return next(attempts)
+
+        with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+            mock_client.return_value.get = get
+
+            results = await fetch_hackernews_top(limit=1)
+
+        assert results == [{"id": 1}]
+        no_sleep.assert_awaited_once()
+        assert 0 <= no_sleep.call_args.args[0] <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honored(self, no_sleep):
+        """Test that a 429 waits as long as Retry-After asks."""
+        throttled = httpx.Response(
+            429, headers={"Retry-After": "7"}, request=httpx.Request("GET", TOP_STORIES_URL)
+        )
+        responses = iter([throttled, _json_response(TOP_STORIES_URL, [])])
+
+        with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(side_effect=lambda *a, **k: next(responses))
+
+            assert await fetch_hackernews_top(limit=5) == []
+
+        no_sleep.assert_awaited_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, no_sleep):
+        """Test that persistent throttling surfaces as an HTTP error."""
+        throttled = httpx.Response(429, request=httpx.Request("GET", TOP_STORIES_URL))
+
+        with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=throttled)
+
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetch_hackernews_top(limit=5)
+
+            assert mock_client.return_value.get.await_count == 4
+        assert no_sleep.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_retried(self, no_sleep):
+        """Test that connection failures are retried and re-raised when exhausted."""
+        with patch("src.integrations.search.hackernews_client.get_http_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+            with pytest.raises(httpx.ConnectError):
+                await fetch_hackernews_top(limit=5)
+
+            assert mock_client.return_value.get.await_count == 4
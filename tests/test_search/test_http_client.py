@@ -0,0 +1,79 @@
+"""Tests for the shared search HTTP client."""
+
+import asyncio
+
+import pytest
+
+from src.integrations.search import http_client
+from src.integrations.search.http_client import close_http_client, get_http_client
+
+
+@pytest.fixture(autouse=True)
+def reset_client(monkeypatch):
+    """Run each test without a shared client left over from another test."""
+    monkeypatch.setattr(http_client, "_client", None)
+    monkeypatch.setattr(http_client, "_client_loop", None)
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused():
+    """Test that repeated calls share one pooled client."""
+    client = get_http_client()
+
+    assert get_http_client() is client
+    assert client.headers["User-Agent"] == "Mozilla/5.0"
+    assert client.timeout.read == 30.0
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_closed_client_is_replaced():
+    """Test that closing the client makes the next call create a fresh one."""
+    client = get_http_client()
+    await close_http_client()
+
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_new_event_loop_gets_new_client(monkeypatch):
+    """Test that a client is not reused across event loops and the old one is closed."""
+    client = get_http_client()
+    other_loop = asyncio.new_event_loop()
+    monkeypatch.setattr(http_client, "_client_loop", other_loop)
+
+    assert get_http_client() is not client
+    await asyncio.gather(*http_client._closing)
+
+    assert client.is_closed
+    assert not http_client._closing
+    other_loop.close()
+    await close_http_client()
+
+
+def test_requires_running_loop():
+    """Test that the client can only be created inside an event loop."""
+    with pytest.raises(RuntimeError):
+        get_http_client()
+
+
+@pytest.mark.asyncio
+async def test_pool_limits():
+    """Test that the pool keeps enough connections for concurrent fan-outs."""
+    client = get_http_client()
+    pool = client._transport._pool
+
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 20
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_http2_enabled():
+    """Test that the pool may multiplex requests over HTTP/2 connections."""
+    client = get_http_client()
+
+    assert client._transport._pool._http2 is True
+    await close_http_client()
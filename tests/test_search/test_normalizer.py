@@ -5,6 +5,7 @@ from datetime import datetime
 import pytest
 
 from src.integrations.search.normalizer import (
+    normalize_all,
     normalize_arxiv,
     normalize_github_trending,
     normalize_google_trends,
@@ -359,7 +360,7 @@ class TestNormalizeGoogleTrends:
         assert "Interest data for 'AI'" in normalized[0]["summary"]
         assert normalized[0]["source"] == "google_trends"
         assert normalized[0]["published_at"] is None
-        assert normalized[0]["raw"] == raw_results
+        assert normalized[0]["raw"] == {"keyword": "AI", "interest": [100, 95]}
 
     def test_valid_input_multiple_keywords(self):
         """Test normalization creates one record per keyword."""
@@ -374,9 +375,9 @@ class TestNormalizeGoogleTrends:
         assert normalized[0]["title"] == "Google Trends: AI"
         assert normalized[1]["title"] == "Google Trends: Machine Learning"
         assert normalized[1]["url"] == "https://trends.google.com/trends/explore?q=Machine+Learning"
-        # Both records share the same raw payload
-        assert normalized[0]["raw"] == raw_results
-        assert normalized[1]["raw"] == raw_results
+        # Each record carries only its own keyword's series
+        assert normalized[0]["raw"] == {"keyword": "AI", "interest": [100]}
+        assert normalized[1]["raw"] == {"keyword": "Machine Learning", "interest": [80]}
 
     def test_empty_keywords(self):
         """Test handling of empty keywords list."""
@@ -522,3 +523,84 @@ class TestCanonicalSchema:
             normalize_google_trends({"keywords": ["AI"], "data": []})[0]["source"]
             == "google_trends"
         )
+
+
+class TestTimestampParsing:
+    """Tests for the shared timestamp helpers."""
+
+    def test_z_suffix_parsed_as_utc(self):
+        """Test that a trailing Z is read as UTC."""
+        normalized = normalize_arxiv(
+            [
+                {
+                    "title": "T",
+                    "entry_id": "http://arxiv.org/abs/1",
+                    "published": "2024-01-01T00:00:00Z",
+                }
+            ]
+        )
+
+        assert normalized[0]["published_at"].utcoffset().total_seconds() == 0
+
+    def test_non_string_date_ignored(self):
+        """Test that a non-string date leaves published_at empty."""
+        normalized = normalize_tavily(
+            [{"title": "T", "url": "https://x.com", "published_date": ["2024"]}]
+        )
+
+        assert normalized[0]["published_at"] is None
+
+    def test_summary_truncated_to_limit(self):
+        """Test that long self-post text is cut to 500 characters."""
+        normalized = normalize_hackernews([{"id": 1, "title": "T", "text": "x" * 600}])
+
+        assert len(normalized[0]["summary"]) == 500
+
+
+class TestNormalizeAll:
+    """Tests for normalizing several sources at once."""
+
+    def test_matches_individual_normalizers(self):
+        """Test that the fused result equals concatenating each normalizer."""
+        tavily = [{"title": "T", "url": "https://x.com", "content": "C"}]
+        hackernews = [{"id": 1, "title": "H", "url": "https://h.com"}, {"id": 2}]
+        arxiv = [{"title": "P", "entry_id": "http://arxiv.org/abs/1", "summary": "S"}]
+        github = [{"name": "r", "url": "https://github.com/r", "description": "D"}]
+        trends = {"keywords": ["AI"], "data": [{"AI": 10}]}
+
+        normalized = normalize_all(
+            {
+                "tavily": tavily,
+                "hackernews": hackernews,
+                "arxiv": arxiv,
+                "github": github,
+                "google_trends": trends,
+            }
+        )
+
+        assert normalized == (
+            normalize_tavily(tavily)
+            + normalize_hackernews(hackernews)
+            + normalize_arxiv(arxiv)
+            + normalize_github_trending(github)
+            + normalize_google_trends(trends)
+        )
+        assert [record["source"] for record in normalized] == [
+            "tavily",
+            "hackernews",
+            "arxiv",
+            "github",
+            "google_trends",
+        ]
+
+    def test_unknown_source(self):
+        """Test that an unknown source name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown source: reddit"):
+            normalize_all({"reddit": []})
+
+    def test_wrong_payload_type(self):
+        """Test that a non-list payload for a list source raises ValueError."""
+        with pytest.raises(ValueError, match="tavily must be a list"):
+            normalize_all({"tavily": {"title": "T"}})
+        with pytest.raises(ValueError, match="must be a dict"):
+            normalize_all({"google_trends": []})
@@ -1,10 +1,14 @@
 """Tests for Tavily search client."""
 
+import asyncio
+import gc
 import os
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+from src.integrations.search import tavily_client
 from src.integrations.search.tavily_client import search_tavily
 
 
@@ -20,12 +24,12 @@ async def test_search_tavily_success():
 
     with (
         patch.dict(os.environ, {"TAVILY_API_KEY": "test-key"}),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("src.integrations.search.tavily_client.get_http_client") as mock_client,
     ):
-        mock_instance = mock_client.return_value.__aenter__.return_value
-        mock_response_obj = AsyncMock()
-        mock_response_obj.raise_for_status = Mock()  # httpx.raise_for_status() is synchronous
-        mock_response_obj.json = Mock(return_value=mock_response)  # httpx.json() is synchronous
+        mock_instance = mock_client.return_value
+        mock_response_obj = httpx.Response(
+            200, json=mock_response, request=httpx.Request("POST", "https://api.tavily.com/search")
+        )
         mock_instance.post = AsyncMock(return_value=mock_response_obj)
 
         results = await search_tavily("test query", limit=10)
@@ -55,15 +59,134 @@ async def test_search_tavily_empty_results():
     """Test handling of empty results."""
     with (
         patch.dict(os.environ, {"TAVILY_API_KEY": "test-key"}),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("src.integrations.search.tavily_client.get_http_client") as mock_client,
     ):
-        mock_instance = mock_client.return_value.__aenter__.return_value
-        mock_response_obj = AsyncMock()
-        mock_response_obj.raise_for_status = Mock()  # httpx.raise_for_status() is synchronous
-        mock_response_obj.json = Mock(return_value={"results": []})  # httpx.json() is synchronous
+        mock_instance = mock_client.return_value
+        mock_response_obj = httpx.Response(
+            200,
+            json={"results": []},
+            request=httpx.Request("POST", "https://api.tavily.com/search"),
+        )
         mock_instance.post = AsyncMock(return_value=mock_response_obj)
 
         results = await search_tavily("obscure query")
 
         assert isinstance(results, list)
         assert len(results) == 0
+
+
+@pytest.mark.asyncio
+async def test_search_tavily_http_error():
+    """Test that an error status raises an HTTP error."""
+    with (
+        patch.dict(os.environ, {"TAVILY_API_KEY": "test-key"}),
+        patch("src.integrations.search.tavily_client.get_http_client") as mock_client,
+    ):
+        mock_client.return_value.post = AsyncMock(
+            return_value=httpx.Response(
+                401, json={}, request=httpx.Request("POST", "https://api.tavily.com/search")
+            )
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await search_tavily("test query")
+
+
+@pytest.mark.asyncio
+async def test_search_tavily_dedupes_concurrent_queries():
+    """Test that identical concurrent searches share one request."""
+    request = httpx.Request("POST", "https://api.tavily.com/search")
+
+    async def slow_post(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"results": [{"title": "Shared"}]}, request=request)
+
+    with (
+        patch.dict(os.environ, {"TAVILY_API_KEY": "test-key"}),
+        patch("src.integrations.search.tavily_client.get_http_client") as mock_client,
+    ):
+        mock_client.return_value.post = AsyncMock(side_effect=slow_post)
+
+        first, second, other = await asyncio.gather(
+            search_tavily(" agents ", limit=5),
+            search_tavily("agents", limit=5),
+            search_tavily("agents", limit=10),
+        )
+        assert mock_client.return_value.post.await_count == 2
+        # The stripped query is sent, whichever caller started the search
+        sent = mock_client.return_value.post.await_args_list[0].kwargs["json"]["query"]
+        assert sent == "agents"
+
+        # Finished searches are not reused
+        await search_tavily("agents", limit=5)
+        assert mock_client.return_value.post.await_count == 3
+
+    assert first == second == other == [{"title": "Shared"}]
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_search_tavily_shared_error_reaches_every_caller():
+    """Test that a failed shared search raises for every waiting caller."""
+    request = httpx.Request("POST", "https://api.tavily.com/search")
+
+    async def failing_post(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return httpx.Response(500, json={}, request=request)
+
+    with (
+        patch.dict(os.environ, {"TAVILY_API_KEY": "test-key"}),
+        patch("src.integrations.search.tavily_client.get_http_client") as mock_client,
+    ):
+        mock_client.return_value.post = AsyncMock(side_effect=failing_post)
+
+        results = await asyncio.gather(
+            search_tavily("agents"), search_tavily("agents"), return_exceptions=True
+        )
+
+    assert mock_client.return_value.post.await_count == 1
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_search_tavily_cancelling_every_caller_cancels_search():
+    """Test that a shared search is cancelled once no caller awaits it."""
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    cancelled = []
+
+    async def hanging_post(*args, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    try:
+        with (
+            patch.dict(os.environ, {"TAVILY_API_KEY": "test-key"}),
+            patch("src.integrations.search.tavily_client.get_http_client") as mock_client,
+        ):
+            mock_client.return_value.post = hanging_post
+
+            callers = [asyncio.ensure_future(search_tavily("agents")) for _ in range(2)]
+            await asyncio.sleep(0)
+            assert len(tavily_client._inflight_searches) == 1
+
+            callers[0].cancel()
+            await asyncio.sleep(0)
+            # One caller is still waiting, so the search keeps running
+            assert cancelled == []
+
+            callers[1].cancel()
+            results = await asyncio.gather(*callers, return_exceptions=True)
+            await asyncio.sleep(0)
+            del callers, results
+            gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert cancelled == [True]
+    assert tavily_client._inflight_searches == {}
+    assert unhandled == []
@@ -13,9 +13,11 @@ Test Coverage:
 - Logging integration
 """
 
+from unittest.mock import patch
+
 import pytest
 
-from src.agents.trend_analyzer import ScoredTopic
+from src.agents.trend_analyzer import ScoredTopic, analyze_trends
 from src.workflow.nodes import NodeRegistry
 from src.workflow.nodes.analyze_trends import AnalyzeTrendsNode
 
@@ -49,7 +51,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_successful_trend_analysis(self) -> None:
         """Verify node successfully analyzes topics."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         state = {
             "scouted_topics": [
                 "Introduction to Python",
@@ -76,7 +78,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_selected_topic_is_highest_scoring(self) -> None:
         """Verify selected topic has the highest score."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         state = {
             "scouted_topics": [
                 "Introduction to Python",  # Low score (generic)
@@ -101,7 +103,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_analyzed_trends_sorted_by_score(self) -> None:
         """Verify analyzed_trends list is sorted by descending score."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         state = {
             "scouted_topics": [
                 "Python",
@@ -155,7 +157,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_single_topic_analysis(self) -> None:
         """Verify node handles single topic correctly."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         state = {
             "scouted_topics": ["Python Programming"],
             "workflow_id": "test-wf-006",
@@ -172,7 +174,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_all_topics_analyzed(self) -> None:
         """Verify all input topics are analyzed and included."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         topics = [
             "Python Basics",
             "Advanced Python",
@@ -244,7 +246,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_deterministic_scoring(self) -> None:
         """Verify same topics produce same scores (deterministic)."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         state = {
             "scouted_topics": ["Python", "Advanced Python", "Python 101"],
             "workflow_id": "test-wf-010",
@@ -277,7 +279,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_specific_topics_score_higher(self) -> None:
         """Verify specific topics score higher than generic ones."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         state = {
             "scouted_topics": [
                 "Introduction to Python",  # Generic
@@ -302,7 +304,7 @@ class TestAnalyzeTrendsNode:
     @pytest.mark.asyncio
     async def test_whitespace_topics_handled(self) -> None:
         """Verify topics with extra whitespace are handled correctly."""
-        node = AnalyzeTrendsNode()
+        node = AnalyzeTrendsNode(include_full_ranking=True)
         state = {
             "scouted_topics": [
                 "  Python  ",
@@ -322,3 +324,46 @@ class TestAnalyzeTrendsNode:
         analyzed = result["analyzed_trends"]
         assert all(item.topic.strip() for item in analyzed)
         assert all(item.topic.strip() for item in analyzed)
+
+    @pytest.mark.asyncio
+    async def test_default_omits_full_ranking(self) -> None:
+        """Verify only the best topic is requested and no ranking is returned."""
+        topics = [
+            "Introduction to Python",
+            "Advanced Python Performance Optimization",
+            "Python for Beginners",
+        ]
+        node = AnalyzeTrendsNode()
+
+        with patch(
+            "src.workflow.nodes.analyze_trends.analyze_trends", wraps=analyze_trends
+        ) as mock_analyze:
+            result = await node.execute({"scouted_topics": topics, "workflow_id": "test-wf-014"})
+
+        mock_analyze.assert_called_once_with(topics=topics, max_topics=1)
+        assert "analyzed_trends" not in result
+        assert result["selected_topic"] == "Advanced Python Performance Optimization"
+        assert result["current_step"] == "plan_structure"
+
+    @pytest.mark.asyncio
+    async def test_single_topic_skips_scoring(self) -> None:
+        """Verify a lone topic is selected without calling the analyzer."""
+        node = AnalyzeTrendsNode()
+
+        with patch("src.workflow.nodes.analyze_trends.analyze_trends") as mock_analyze:
+            result = await node.execute(
+                {"scouted_topics": ["Python Programming"], "workflow_id": "test-wf-015"}
+            )
+
+        mock_analyze.assert_not_called()
+        assert result == {"selected_topic": "Python Programming", "current_step": "plan_structure"}
+
+    @pytest.mark.asyncio
+    async def test_single_blank_topic_still_fails(self) -> None:
+        """Verify a lone whitespace topic is not selected by the fast path."""
+        node = AnalyzeTrendsNode()
+
+        result = await node.execute({"scouted_topics": ["   "], "workflow_id": "test-wf-016"})
+
+        assert result["current_step"] == "failed"
+        assert "selected_topic" not in result
@@ -0,0 +1,168 @@
+"""Tests for CLI display helpers."""
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+from src.workflow.cli_helpers import (
+    display_article_for_review,
+    display_error,
+    display_info,
+    display_success,
+    display_topics_for_selection,
+    prompt_user_approval,
+    prompt_user_topic_selection,
+)
+
+SEPARATOR = "=" * 70
+
+
+class TestDisplayTopics:
+    """Tests for display_topics_for_selection."""
+
+    def test_lists_topics_with_scores(self, capsys: pytest.CaptureFixture[str]):
+        """Test that each topic is numbered with its score and reasoning."""
+        display_topics_for_selection(
+            [
+                {"topic": "Async Python", "score": 8.46, "reasoning": "Trending"},
+                {"topic": "Type Hints", "score": 7},
+            ]
+        )
+
+        out = capsys.readouterr().out
+        assert "1. [Score: 8.5] Async Python" in out
+        assert "   💡 Trending" in out
+        assert "2. [Score: 7.0] Type Hints" in out
+        assert out.endswith(SEPARATOR + "\n")
+
+    def test_empty_topics(self, capsys: pytest.CaptureFixture[str]):
+        """Test the message shown when there is nothing to select."""
+        display_topics_for_selection([])
+
+        assert capsys.readouterr().out == "\n⚠️  No topics available for selection\n"
+
+    def test_long_reasoning_is_truncated(self, capsys: pytest.CaptureFixture[str]):
+        """Test that reasoning longer than 100 characters is cut short."""
+        display_topics_for_selection([{"topic": "T", "score": 1.0, "reasoning": "r" * 150}])
+
+        assert f"   💡 {'r' * 100}…\n" in capsys.readouterr().out
+
+    def test_panel_written_at_once(self):
+        """Test that the whole panel is emitted with a single write."""
+        topics = [{"topic": f"Topic {i}", "score": 1.0, "reasoning": "why"} for i in range(10)]
+
+        with patch("src.workflow.cli_helpers.sys.stdout") as stdout:
+            display_topics_for_selection(topics)
+
+        stdout.write.assert_called_once()
+        stdout.flush.assert_called_once()
+
+
+class TestPromptTopicSelection:
+    """Tests for prompt_user_topic_selection."""
+
+    def test_reprompts_until_valid_choice(self, capsys: pytest.CaptureFixture[str]):
+        """Test that empty, non-numeric and out-of-range input is rejected."""
+        with patch("builtins.input", side_effect=["", "abc", "²", "-1", "9", " 2 "]):
+            assert prompt_user_topic_selection(3) == 2
+
+        out = capsys.readouterr().out
+        assert out.count("❌ Please enter a number\n") == 1
+        assert out.count("❌ Please enter a valid number") == 3
+        assert out.count("❌ Please enter a number between 1 and 3") == 1
+
+    def test_cancel_propagates(self):
+        """Test that Ctrl+C cancels the selection."""
+        with patch("builtins.input", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                prompt_user_topic_selection(3)
+
+
+class TestPromptApproval:
+    """Tests for prompt_user_approval."""
+
+    def test_approve_after_confirmation(self, monkeypatch: pytest.MonkeyPatch, capsys):
+        """Test that approval needs a yes on the confirmation read from stdin."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("no\nY\n"))
+        with patch("builtins.input", side_effect=["1", "1"]):
+            assert prompt_user_approval() == ("approve", None)
+
+        out = capsys.readouterr().out
+        assert "❌ Approval cancelled" in out
+        assert "✅ Confirm approval? (yes/no): " in out
+
+    def test_revise_with_feedback(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a revision returns the entered feedback once confirmed."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("yes\n"))
+        with patch("builtins.input", side_effect=["2", "Add examples"]):
+            assert prompt_user_approval() == ("revise", "Add examples")
+
+
+class TestDisplayArticle:
+    """Tests for display_article_for_review."""
+
+    def test_shows_metadata_and_preview(self, capsys: pytest.CaptureFixture[str]):
+        """Test that metadata is shown and long content is previewed."""
+        display_article_for_review(
+            {
+                "seo_title": "Title",
+                "seo_subtitle": "Subtitle",
+                "tags": ["python", "async"],
+                "word_count": 1500,
+                "readability_score": 65.24,
+                "polished_content": "x" * 600,
+            }
+        )
+
+        out = capsys.readouterr().out
+        assert "📌 Title: Title\n" in out
+        assert "🏷️  Tags: python, async\n" in out
+        assert "📈 Readability Score: 65.2\n" in out
+        assert f"{'x' * 500}…\n" in out
+        assert "(Showing first 500 characters of 600 total)" in out
+
+    def test_short_content_not_truncated(self, capsys: pytest.CaptureFixture[str]):
+        """Test that content within the preview length is shown in full."""
+        display_article_for_review({"polished_content": "Short article"})
+
+        out = capsys.readouterr().out
+        assert "\nShort article\n" in out
+        assert "Showing first" not in out
+
+    def test_missing_fields_use_defaults(self, capsys: pytest.CaptureFixture[str]):
+        """Test that absent metadata falls back to placeholders."""
+        display_article_for_review({})
+
+        out = capsys.readouterr().out
+        assert "📌 Title: No title" in out
+        assert "🏷️  Tags: (none)\n" in out
+        assert "CONTENT PREVIEW" not in out
+
+    def test_null_tags_and_content(self, capsys: pytest.CaptureFixture[str]):
+        """Test that explicit None tags and content are treated as empty."""
+        display_article_for_review({"tags": None, "polished_content": None})
+
+        out = capsys.readouterr().out
+        assert "🏷️  Tags: (none)\n" in out
+        assert "CONTENT PREVIEW" not in out
+
+
+class TestDisplayMessages:
+    """Tests for the error, info and success panels."""
+
+    @pytest.mark.parametrize(
+        ("display", "heading"),
+        [
+            (display_error, "❌ ERROR"),
+            (display_info, "ℹ️  INFO"),
+            (display_success, "✅ SUCCESS"),
+        ],
+    )
+    def test_message_panel(self, capsys: pytest.CaptureFixture[str], display, heading):
+        """Test that the message is framed by separators under its heading."""
+        display("Something happened")
+
+        assert capsys.readouterr().out == (
+            f"\n{SEPARATOR}\n{heading}\n{SEPARATOR}\n\nSomething happened\n\n{SEPARATOR}\n"
+        )
@@ -1,6 +1,8 @@
 """Tests for workflow error handling and recovery."""
 
+import logging
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -152,6 +154,19 @@ class TestRetryLogic:
             delay2 = call_times[2] - call_times[1]
             assert 0.18 < delay2 < 0.25  # ~0.2s with tolerance
 
+    def test_retry_sleeps_follow_schedule(self):
+        """Test that each retry sleeps its exponential delay and the last one does not sleep."""
+
+        @retry_with_backoff(max_retries=3, initial_delay=0.5, backoff_factor=3.0)
+        def always_fails():
+            raise ValueError("Always fails")
+
+        with patch("src.workflow.error_handling.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError, match="Always fails"):
+                always_fails()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.5, 4.5]
+
 
 class TestErrorContext:
     """Tests for ErrorContext manager."""
@@ -175,12 +190,28 @@ class TestErrorContext:
         """Test ErrorContext tracks operation duration."""
         with ErrorContext("timed_operation") as ctx:
             time.sleep(0.05)
-            assert ctx.start_time is not None
+            assert ctx.start_ns is not None
 
         # Duration should be at least 0.05s
-        duration = time.time() - ctx.start_time
+        duration = (time.monotonic_ns() - ctx.start_ns) / 1e9
         assert duration >= 0.05
 
+    def test_error_context_info_allocated_on_demand(self):
+        """Test info stays unallocated until something is added."""
+        ctx = ErrorContext("lazy")
+        assert ctx.info is None
+
+        ctx.add_info("key", "value")
+        assert ctx.info == {"key": "value"}
+
+    def test_error_context_has_no_instance_dict(self):
+        """Test ErrorContext uses slots instead of a per-instance dict."""
+        ctx = ErrorContext("slotted")
+
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.unknown = 1
+
     def test_error_context_multiple_info(self):
         """Test ErrorContext can store multiple info items."""
         with ErrorContext("multi_info_op") as ctx:
@@ -252,6 +283,36 @@ class TestRecoveryStrategies:
         with pytest.raises(ValueError, match="Always fails"):
             strategy.recover(ValueError("initial"), {"operation": always_fails})
 
+    def test_retry_recovery_stops_on_unrecoverable(self):
+        """Test RetryRecovery re-raises an UnrecoverableError without retrying."""
+        calls = 0
+
+        def fatal():
+            nonlocal calls
+            calls += 1
+            raise UnrecoverableError("Fatal")
+
+        strategy = RetryRecovery(max_attempts=3, delay=0.5)
+        with patch("src.workflow.error_handling.time.sleep") as mock_sleep:
+            with pytest.raises(UnrecoverableError, match="Fatal"):
+                strategy.recover(ValueError("initial"), {"operation": fatal})
+
+        assert calls == 1
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_retry_recovery_delay_increases_linearly(self):
+        """Test RetryRecovery waits delay, 2x delay, 3x delay before attempts."""
+
+        def always_fails():
+            raise ValueError("Always fails")
+
+        strategy = RetryRecovery(max_attempts=3, delay=0.5)
+        with patch("src.workflow.error_handling.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError):
+                strategy.recover(ValueError("initial"), {"operation": always_fails})
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0, 1.5]
+
     def test_retry_recovery_requires_operation(self):
         """Test RetryRecovery requires operation in context."""
         strategy = RetryRecovery(max_attempts=3)
@@ -321,6 +382,24 @@ class TestHandleNodeError:
         result = kwarg_node("self", state={"workflow_id": "wf-789"})
         assert result["status"] == "ok"
 
+    def test_handle_node_error_logs_failure_once(self, caplog: pytest.LogCaptureFixture):
+        """Test a failure is logged once with its duration and current step."""
+
+        @handle_node_error("logged_node")
+        def logged_node(state):
+            raise ValueError("Logged error")
+
+        with caplog.at_level(logging.ERROR, logger="src.workflow.error_handling"):
+            with pytest.raises(NodeExecutionError):
+                logged_node({"workflow_id": "wf-1", "current_step": "research"})
+
+        assert len(caplog.records) == 1
+        record = caplog.records[0]
+        assert record.getMessage().startswith("Node 'logged_node' failed after ")
+        assert record.context == {"current_step": "research"}
+        assert record.workflow_id == "wf-1"
+        assert record.exc_info is None
+
 
 class TestStateValidation:
     """Tests for state validation helpers."""
@@ -342,6 +421,8 @@ class TestStateValidation:
         error = exc_info.value
         assert error.field == "user_query"
         assert "missing" in str(error).lower()
+        # The internal KeyError is not chained onto the validation error
+        assert error.__context__ is None or error.__suppress_context__
 
     def test_validate_state_field_wrong_type(self):
         """Test validation fails for wrong type."""
@@ -1,12 +1,16 @@
 """Tests for workflow graph definition."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from src.workflow.graph import (
     create_default_workflow,
     create_workflow_graph,
     get_workflow_visualization,
+    reset_default_workflow,
     should_continue_after_approval,
+    shutdown_workflow,
 )
 from src.workflow.graph_state import create_initial_state
 
@@ -24,6 +28,35 @@ class TestGraphCreation:
         graph = create_default_workflow()
         assert graph is not None
 
+    def test_default_workflow_is_compiled_once(self):
+        """Test that the default workflow is shared until reset."""
+        reset_default_workflow()
+        with patch(
+            "src.workflow.graph.create_workflow_graph", wraps=create_workflow_graph
+        ) as mock_create:
+            first = create_default_workflow()
+            second = create_default_workflow()
+            reset_default_workflow()
+            third = create_default_workflow()
+
+        assert first is second
+        assert third is not first
+        assert mock_create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shutdown_workflow_closes_shared_resources(self):
+        """Test that shutdown closes the HTTP client and the LLM cache."""
+        with (
+            patch(
+                "src.integrations.search.http_client.close_http_client", new=AsyncMock()
+            ) as mock_close_http,
+            patch("src.integrations.llm_cache.close_llm_cache") as mock_close_cache,
+        ):
+            await shutdown_workflow()
+
+        mock_close_http.assert_awaited_once()
+        mock_close_cache.assert_called_once()
+
     def test_graph_has_all_required_nodes(self):
         """Test that graph contains all expected nodes."""
         graph = create_workflow_graph()
@@ -227,6 +227,25 @@ class TestValidateRequiredFields:
         assert is_valid is False
         assert len(missing) == 7  # All required fields missing
 
+    def test_required_fields_match_typeddict(self):
+        """Test the validated fields are exactly the TypedDict's required keys."""
+        state = create_initial_state("wf-1", "test")
+
+        assert set(state) == ArticleWorkflowState.__required_keys__
+        assert validate_required_fields(state) == (True, [])
+
+    def test_missing_fields_in_declaration_order(self):
+        """Test missing fields are reported in a stable order."""
+        _, missing = validate_required_fields({"user_query": "test", "errors": []})
+
+        assert missing == [
+            "workflow_id",
+            "current_step",
+            "revision_count",
+            "max_revisions",
+            "retry_count",
+        ]
+
     def test_extra_fields_allowed(self):
         """Test validation allows extra optional fields."""
         state = {
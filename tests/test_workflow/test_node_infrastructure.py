@@ -11,6 +11,7 @@ Tests cover:
 import asyncio
 import logging
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -71,6 +72,27 @@ class TestBaseNode:
         node = ValidNode()
         assert node.name == "valid_node"
 
+    @pytest.mark.parametrize(
+        "node_name",
+        [
+            "scout_topics",
+            "analyze_trends",
+            "user_selection",
+            "plan_structure",
+            "research",
+            "write_draft",
+            "review",
+            "user_approval",
+            "revision",
+            "publish",
+        ],
+    )
+    def test_builtin_nodes_have_no_instance_dict(self, node_name: str):
+        """Test that built-in nodes declare __slots__ all the way down."""
+        node = NodeRegistry.get(node_name)()
+
+        assert not hasattr(node, "__dict__")
+
     @pytest.mark.asyncio
     async def test_node_execute_returns_dict(self):
         """Test that node execute method returns dict."""
@@ -209,6 +231,27 @@ class TestErrorHandlingDecorator:
         assert "KeyError" in result2["errors"][0]
         assert "Missing key" in result2["errors"][0]
 
+    @pytest.mark.asyncio
+    async def test_method_form_uses_node_name(self, caplog):
+        """Test stacked decorators on execute report the node's name."""
+
+        class FailingNode(BaseNode):
+            @property
+            def name(self) -> str:
+                return "failing_method_node"
+
+            @handle_node_errors
+            @log_node_execution
+            async def execute(self, state: ArticleWorkflowState) -> dict[str, Any]:
+                raise ValueError("Method failed")
+
+        with caplog.at_level(logging.INFO):
+            result = await FailingNode().execute({"workflow_id": "wf-method"})
+
+        assert result["current_step"] == "failed"
+        assert result["errors"] == ["Node 'failing_method_node' failed: ValueError: Method failed"]
+        assert "[wf-method] Starting execution of node: failing_method_node" in caplog.text
+
 
 class TestLoggingDecorator:
     """Tests for log_node_execution decorator."""
@@ -552,6 +595,25 @@ class TestRetryDecorator:
             await type_error_node(state)
         assert type_error_count == 1  # No retries
 
+    @pytest.mark.asyncio
+    async def test_backoff_schedule_and_final_log(self, caplog: pytest.LogCaptureFixture):
+        """Test that each retry waits backoff_factor**attempt and the last failure is logged."""
+
+        @retry_on_error(max_retries=3, backoff_factor=3.0)
+        async def always_fails(state: ArticleWorkflowState) -> dict:
+            raise ValueError("boom")
+
+        with patch("src.workflow.nodes.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            with caplog.at_level(logging.WARNING):
+                with pytest.raises(ValueError, match="boom"):
+                    await always_fails({})
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 3.0, 9.0]
+        assert "Node 'always_fails' failed (attempt 3/4). Retrying in 9.0s" in caplog.text
+        assert "Node 'always_fails' failed after 4 attempts. Final error: ValueError: boom" in (
+            caplog.text
+        )
+
 
 class TestNodeRegistry:
     """Tests for NodeRegistry."""
@@ -623,9 +685,43 @@ class TestNodeRegistry:
 
     def test_error_on_missing_node(self):
         """Test error when retrieving non-existent node."""
-        with pytest.raises(KeyError, match="Node 'nonexistent' not registered"):
+        with pytest.raises(KeyError, match="Node 'nonexistent' not registered") as exc_info:
             NodeRegistry.get("nonexistent")
 
+        # The lookup's own KeyError is not chained onto the reported one
+        assert exc_info.value.__context__ is None
+
+    def test_get_imports_builtin_node_module(self):
+        """Test that an unregistered built-in node is loaded from its module."""
+
+        class LazyNode(BaseNode):
+            @property
+            def name(self) -> str:
+                return "analyze_trends"
+
+            async def execute(self, state: ArticleWorkflowState) -> dict[str, Any]:
+                return {}
+
+        def import_module(module: str):
+            NodeRegistry.register("analyze_trends")(LazyNode)
+
+        with patch(
+            "src.workflow.nodes.importlib.import_module", side_effect=import_module
+        ) as mock_import:
+            assert NodeRegistry.get("analyze_trends") is LazyNode
+            assert NodeRegistry.get("analyze_trends") is LazyNode
+
+        mock_import.assert_called_once_with("src.workflow.nodes.analyze_trends")
+
+    def test_get_restores_builtin_node_after_clear(self):
+        """Test that clear() does not make an already-imported built-in node unreachable."""
+        from src.workflow.nodes.research import ResearchNode
+
+        NodeRegistry.clear()
+
+        assert NodeRegistry.get("research") is ResearchNode
+        assert NodeRegistry.is_registered("research")
+
     def test_error_message_shows_available_nodes(self):
         """Test error message includes available nodes."""
 
@@ -146,6 +146,20 @@ class TestPlanStructureNode:
         assert "errors" in result
         assert result["current_step"] == "failed"
 
+    @pytest.mark.asyncio
+    async def test_none_topic_raises_error(self) -> None:
+        """Verify a None selected_topic is reported like a missing one."""
+        node = PlanStructureNode()
+        state = {
+            "selected_topic": None,
+            "workflow_id": "test-wf-006b",
+        }
+
+        result = await node.execute(state)
+
+        assert result["current_step"] == "failed"
+        assert "selected_topic is required" in result["errors"][0]
+
     @pytest.mark.asyncio
     async def test_deterministic_output(self) -> None:
         """Verify same topic produces same outline (deterministic)."""
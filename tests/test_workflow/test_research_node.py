@@ -12,6 +12,7 @@ Test Coverage:
 - Logging integration
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -367,3 +368,66 @@ class TestResearchNode:
         assert "research_data" in result
         assert len(result["research_data"]) == 1
         assert result["current_step"] == "write_draft"
+
+    @pytest.mark.asyncio
+    async def test_sections_researched_concurrently(self) -> None:
+        """Verify sections overlap in flight, bounded by the concurrency limit."""
+        node = ResearchNode()
+        outline = generate_outline("Python", max_sections=6)
+        in_flight = 0
+        peak = 0
+
+        async def mock_research_fn(outline: Outline, section: Section) -> ResearchDossier:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ResearchDossier(
+                section_title=section.title,
+                synthesis="Synthesis",
+                web_results=(),
+                papers=(),
+                code_examples=(),
+                citations=(),
+            )
+
+        with (
+            patch("src.workflow.nodes.research.research_section", new=mock_research_fn),
+            patch("src.workflow.nodes.research._MAX_CONCURRENT_SECTIONS", 2),
+        ):
+            result = await node.execute({"article_outline": outline, "workflow_id": "test-wf-c"})
+
+        assert peak == 2
+        assert [d.section_title for d in result["research_data"]] == [
+            s.title for s in outline.sections
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_sections(self) -> None:
+        """Verify one failed section cancels running and queued siblings."""
+        node = ResearchNode()
+        outline = generate_outline("Python", max_sections=6)
+        started: list[str] = []
+        finished: list[str] = []
+
+        async def mock_research_fn(outline: Outline, section: Section) -> ResearchDossier:
+            started.append(section.title)
+            if section is outline.sections[0]:
+                raise RuntimeError("search API down")
+            await asyncio.sleep(10)
+            finished.append(section.title)
+
+        with (
+            patch("src.workflow.nodes.research.research_section", new=mock_research_fn),
+            patch("src.workflow.nodes.research._MAX_CONCURRENT_SECTIONS", 2),
+        ):
+            result = await node.execute({"article_outline": outline, "workflow_id": "test-wf-f"})
+            # Let the cancellations run
+            await asyncio.sleep(0.01)
+
+        assert result["current_step"] == "failed"
+        assert "search API down" in result["errors"][0]
+        # Queued sections never start and running ones never finish
+        assert len(started) < len(outline.sections)
+        assert finished == []
@@ -12,6 +12,7 @@ Test Coverage:
 - Logging integration
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -308,3 +309,77 @@ class TestWriteDraftNode:
         workflow_logs = [m for m in log_messages if workflow_id in m]
 
         assert len(workflow_logs) > 0, f"Should include workflow_id {workflow_id} in logs"
+
+    @pytest.mark.asyncio
+    async def test_sections_written_concurrently(self) -> None:
+        """Verify sections are drafted in parallel, bounded, and combined in order."""
+        node = WriteDraftNode()
+        outline = generate_outline("Rust Programming", max_sections=6)
+        in_flight = 0
+        peak = 0
+
+        async def mock_write_section(outline, section, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Finish later sections first so completion order differs from outline order
+            await asyncio.sleep(0.01 * (len(outline.sections) - outline.sections.index(section)))
+            in_flight -= 1
+            return WrittenSection(
+                section_title=section.title,
+                content=f"Content for {section.title}",
+                word_count=50,
+            )
+
+        state = {
+            "article_outline": outline,
+            "research_data": [{"section": s.title} for s in outline.sections],
+            "workflow_id": "test-wf-c",
+        }
+
+        with (
+            patch("src.workflow.nodes.write_draft.write_section", new=mock_write_section),
+            patch("src.workflow.nodes.write_draft._MAX_CONCURRENT_SECTIONS", 3),
+        ):
+            result = await node.execute(state)
+
+        assert peak == 3
+        titles = [s.title for s in outline.sections]
+        assert [w.section_title for w in result["draft_sections"]] == titles
+        positions = [result["draft_content"].index(f"## {title}\n") for title in titles]
+        assert positions == sorted(positions)
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_sections(self) -> None:
+        """Verify one failed section cancels running and queued siblings."""
+        node = WriteDraftNode()
+        outline = generate_outline("Rust Programming", max_sections=6)
+        started: list[str] = []
+        finished: list[str] = []
+
+        async def mock_write_section(outline, section, **kwargs):
+            started.append(section.title)
+            if section is outline.sections[0]:
+                raise RuntimeError("LLM quota exceeded")
+            await asyncio.sleep(10)
+            finished.append(section.title)
+
+        state = {
+            "article_outline": outline,
+            "research_data": [{"section": s.title} for s in outline.sections],
+            "workflow_id": "test-wf-f",
+        }
+
+        with (
+            patch("src.workflow.nodes.write_draft.write_section", new=mock_write_section),
+            patch("src.workflow.nodes.write_draft._MAX_CONCURRENT_SECTIONS", 2),
+        ):
+            result = await node.execute(state)
+            # Let the cancellations run
+            await asyncio.sleep(0.01)
+
+        assert result["current_step"] == "failed"
+        assert "LLM quota exceeded" in result["errors"][0]
+        # Queued sections never start and running ones never finish
+        assert len(started) < len(outline.sections)
+        assert finished == []